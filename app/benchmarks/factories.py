@@ -0,0 +1,47 @@
+"""Builders of the synthetic scenarios used by the benchmark suite
+
+The cp_nigeria projects and MVS responses are built by cp_nigeria.factories, the builders here extend the generic
+scenarios of fixtures/benchmarks_fixture.json.
+"""
+
+import json
+import uuid
+
+import numpy as np
+
+from projects.models import Asset, ConnectionLink
+
+
+def extend_scenario_assets(scenario, n_assets, horizon):
+    """Duplicate the first production asset of a scenario n_assets times and resize all input timeseries to the horizon
+
+    :param scenario: a Scenario instance (e.g. the one of fixtures/benchmarks_fixture.json)
+    :param n_assets: number of production assets to add
+    :param horizon: evaluated period of the scenario in days
+    """
+    scenario.evaluated_period = horizon
+    scenario.save()
+    n_timesteps = horizon * 24 * 60 // scenario.time_step
+
+    for asset in Asset.objects.filter(scenario=scenario, input_timeseries__isnull=False).exclude(input_timeseries=""):
+        values = json.loads(asset.input_timeseries)
+        if isinstance(values, list) and len(values) > 0:
+            asset.input_timeseries = json.dumps(np.resize(values, n_timesteps).tolist())
+            asset.save()
+
+    template = Asset.objects.filter(scenario=scenario, asset_type__asset_category="energy_production").first()
+    link = ConnectionLink.objects.filter(asset=template).first()
+    for i in range(n_assets):
+        new_asset = Asset.objects.get(pk=template.pk)
+        new_asset.pk = None
+        new_asset.name = f"{template.name}_{i}"
+        new_asset.unique_id = str(uuid.uuid4())
+        new_asset.save()
+        ConnectionLink.objects.create(
+            bus=link.bus,
+            asset=new_asset,
+            bus_connection_port=link.bus_connection_port,
+            flow_direction=link.flow_direction,
+            scenario=scenario,
+        )
+    return scenario
@@ -0,0 +1,206 @@
+"""Benchmarks of the computationally heavy code paths of the app
+
+The benchmarks are skipped during the normal test run, execute them with
+
+    EPA_BENCHMARK=1 python manage.py test benchmarks
+
+Each benchmark records the best wall time over EPA_BENCHMARK_REPEAT runs (default 5) and the number of database queries
+of a single run. The measures are compared to the ones stored in benchmarks/baseline.json for the same database
+backend: a benchmark fails if it is slower than EPA_BENCHMARK_TOLERANCE (default 2) times its baseline (plus a few
+milliseconds of slack) or if it needs more queries than before. Run with EPA_BENCHMARK_SAVE=1 to write the measures to
+the baseline file instead.
+"""
+
+import io
+import json
+import os
+import time
+import unittest
+from unittest import mock
+
+from django.db import connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from benchmarks.factories import extend_scenario_assets
+from cp_nigeria.factories import create_cpn_project, synthetic_mvs_response
+from cp_nigeria.helpers import FinancialTool, ReportHandler, get_aggregated_cgs
+from dashboard.models import AssetsResults, graph_sankey, graph_timeseries_stacked_cpn
+from projects.constants import DONE
+from projects.dtos import convert_to_dto
+from projects.models import Scenario, Simulation
+from projects.requests import parse_mvs_results
+from users.models import CustomUser
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+RUN_BENCHMARKS = os.environ.get("EPA_BENCHMARK", "") not in ("", "0")
+SAVE_BASELINE = os.environ.get("EPA_BENCHMARK_SAVE", "") not in ("", "0")
+REPEAT = int(os.environ.get("EPA_BENCHMARK_REPEAT", 5))
+TOLERANCE = float(os.environ.get("EPA_BENCHMARK_TOLERANCE", 2))
+# absolute slack in seconds so that the timer noise does not fail the fastest benchmarks
+SLACK = 0.005
+
+# evaluated periods in days and number of additional assets the benchmarks are parametrized with
+HORIZONS = (7, 365)
+ASSET_COUNTS = (0, 25)
+
+# ArrayField (used by the demand timeseries) is only supported by PostgreSQL
+ARRAY_FIELDS_SUPPORTED = connection.vendor == "postgresql"
+
+
+def load_baseline():
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, "r") as fp:
+            return json.load(fp)
+    return {}
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, "benchmarks are only run if EPA_BENCHMARK is set")
+class BenchmarkTestCase(TestCase):
+    fixtures = ["fixtures/benchmarks_fixture.json", "fixtures/test_users.json"]
+    measures = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        if SAVE_BASELINE is True and cls.measures:
+            baseline = load_baseline()
+            baseline.update(cls.measures)
+            with open(BASELINE_PATH, "w") as fp:
+                json.dump(dict(sorted(baseline.items())), fp, indent=2)
+                fp.write("\n")
+
+    def setUp(self):
+        self.user = CustomUser.objects.get(username="testUser")
+
+    def benchmark(self, name, func, setup=None):
+        """Time func and count its database queries, then compare the measures to the baseline
+
+        :param name: key of the benchmark within the baseline file
+        :param func: callable to benchmark, called with the output of setup as arguments
+        :param setup: optional callable run before each call of func, its duration is not measured
+        :return: the return value of the last call of func
+        """
+        timings = []
+        n_queries = None
+        for _ in range(REPEAT):
+            args = setup() if setup is not None else ()
+            with CaptureQueriesContext(connection) as ctx:
+                start = time.perf_counter()
+                answer = func(*args)
+                timings.append(time.perf_counter() - start)
+            if n_queries is None:
+                n_queries = len(ctx.captured_queries)
+
+        key = f"{connection.vendor}:{name}"
+        measure = {"wall_time": round(min(timings), 5), "queries": n_queries}
+        self.measures[key] = measure
+
+        reference = load_baseline().get(key)
+        if reference is not None and SAVE_BASELINE is False:
+            self.assertLessEqual(
+                measure["wall_time"],
+                reference["wall_time"] * TOLERANCE + SLACK,
+                f"{key} got slower: {measure['wall_time']}s instead of {reference['wall_time']}s",
+            )
+            self.assertLessEqual(
+                measure["queries"],
+                reference["queries"],
+                f"{key} needs more database queries: {measure['queries']} instead of {reference['queries']}",
+            )
+        return answer
+
+
+class MVSResultsBenchmark(BenchmarkTestCase):
+    def test_parse_mvs_results(self):
+        scenario = Scenario.objects.get(id=2)
+        for horizon in HORIZONS:
+            for n_assets in ASSET_COUNTS:
+                with self.subTest(horizon=horizon, n_assets=n_assets):
+                    response = synthetic_mvs_response(horizon * 24, n_extra_assets=n_assets)
+
+                    def new_simulation():
+                        Simulation.objects.filter(scenario=scenario).delete()
+                        return (Simulation.objects.create(scenario=scenario, status=DONE), response)
+
+                    self.benchmark(f"parse_mvs_results[{horizon}d-{n_assets}a]", parse_mvs_results, new_simulation)
+
+    def test_convert_to_dto(self):
+        for horizon in HORIZONS:
+            for n_assets in ASSET_COUNTS:
+                with self.subTest(horizon=horizon, n_assets=n_assets), transaction.atomic():
+                    scenario = extend_scenario_assets(Scenario.objects.get(id=2), n_assets, horizon)
+                    self.benchmark(f"convert_to_dto[{horizon}d-{n_assets}a]", lambda: convert_to_dto(scenario))
+                    # drop the added assets before the next parametrization
+                    transaction.set_rollback(True)
+
+
+class GraphsBenchmark(BenchmarkTestCase):
+    def test_graph_timeseries_stacked_cpn(self):
+        for horizon in HORIZONS:
+            for n_assets in ASSET_COUNTS:
+                with self.subTest(horizon=horizon, n_assets=n_assets):
+                    project = create_cpn_project(self.user, horizon, n_assets, n_consumer_groups=0)
+                    simulation = project.scenario.simulation
+                    self.benchmark(
+                        f"graph_timeseries_stacked_cpn[{horizon}d-{n_assets}a]",
+                        lambda: graph_timeseries_stacked_cpn([simulation], None, "Electricity"),
+                    )
+
+    def test_graph_sankey(self):
+        for n_assets in ASSET_COUNTS:
+            with self.subTest(n_assets=n_assets):
+                project = create_cpn_project(self.user, 365, n_assets, n_consumer_groups=0)
+                simulation = project.scenario.simulation
+                self.benchmark(f"graph_sankey[{n_assets}a]", lambda: graph_sankey(simulation, ["Electricity", "Gas"]))
+
+
+class FinancialToolBenchmark(BenchmarkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.n_consumer_groups = 8 if ARRAY_FIELDS_SUPPORTED else 0
+
+    def test_financial_tool_calculate_tariff(self):
+        for n_assets in ASSET_COUNTS:
+            with self.subTest(n_assets=n_assets):
+                project = create_cpn_project(self.user, 365, n_assets, n_consumer_groups=self.n_consumer_groups)
+                self.benchmark(f"financial_tool[{n_assets}a]", lambda: FinancialTool(project).calculate_tariff())
+
+    @unittest.skipUnless(ARRAY_FIELDS_SUPPORTED, "demand timeseries need a PostgreSQL database")
+    def test_get_aggregated_cgs(self):
+        for n_groups in (2, 20):
+            with self.subTest(n_groups=n_groups):
+                project = create_cpn_project(self.user, 7, n_consumer_groups=n_groups, with_results=False)
+                self.benchmark(f"get_aggregated_cgs[{n_groups}cg]", lambda: get_aggregated_cgs(project, as_ts=True))
+
+    @unittest.skipUnless(ARRAY_FIELDS_SUPPORTED, "demand timeseries need a PostgreSQL database")
+    def test_report_handler(self):
+        """Build the parts of the implementation plan which do not depend on graphs rendered by the browser"""
+        project = create_cpn_project(self.user, 365, n_consumer_groups=self.n_consumer_groups)
+
+        def build_report():
+            report = ReportHandler(project)
+            report.create_cover_sheet()
+            report.add_footer()
+            report.prevent_table_splitting()
+            report.save(io.BytesIO())
+
+        # avoid reverse geocoding requests to an external service during the benchmark
+        with mock.patch("cp_nigeria.helpers.get_community_region", return_value=("Kogi", "North Central")):
+            self.benchmark("report_handler", build_report)
+
+
+class FactoriesTest(TestCase):
+    fixtures = ["fixtures/benchmarks_fixture.json"]
+
+    def test_synthetic_mvs_response_lists_the_assets_like_mvs(self):
+        response = json.loads(synthetic_mvs_response(24))
+        self.assertEqual([asset["label"] for asset in response["energy_storage"]], ["battery"])
+
+        scenario = Scenario.objects.get(id=2)
+        Simulation.objects.filter(scenario=scenario).delete()
+        simulation = Simulation.objects.create(scenario=scenario, status=DONE)
+        parse_mvs_results(simulation, json.dumps(response))
+        asset_names = AssetsResults.objects.get(simulation=simulation).asset_names
+        self.assertIn("pv_plant", asset_names)
+        self.assertEqual(asset_names.count("inverter"), 1)
@@ -41,7 +41,10 @@ class BMQuestionForm(forms.Form):
     def __init__(self, *args, **kwargs):
         qs = kwargs.pop("qs", None)
         super().__init__(*args, **kwargs)
-        for criteria in qs.order_by("question"):
+        answers = {answer.question_id: answer for answer in qs.select_related("question").order_by("question")}
+        # the questions are kept to look up their category and whether they are sub questions without new queries
+        self.questions = {question_id: answer.question for question_id, answer in answers.items()}
+        for criteria in answers.values():
             alv = criteria.question.score_allowed_values
             opts = {"label": criteria.question.question_for_user}
             if criteria.score is not None:
@@ -64,13 +67,13 @@ class BMQuestionForm(forms.Form):
             # - hide the sub question if the supra question's answer is not "Yes"
             if criteria.question.sub_question_to is not None:
                 disable_sub_question = True
-                supra_question = BMQuestion.objects.get(id=criteria.question.sub_question_to)
+                supra_answer = answers[criteria.question.sub_question_to]
+                supra_question = supra_answer.question
 
                 self.fields[f"criteria_{supra_question.id}"].widget.attrs.update(
                     {"onchange": f"triggerSubQuestion(new_value=this.value,subQuestionId={criteria.question.id})"}
                 )
 
-                supra_answer = qs.get(question=supra_question)
                 if supra_answer.score is not None:
                     # assuming the subquestion is triggered only if answer to supraquestion is yes
                     if supra_answer.score == 1.0:
@@ -93,7 +96,7 @@ class BMQuestionForm(forms.Form):
                 if cleaned_data[record] != "":
                     cleaned_data[record] = float(cleaned_data[record])
                 else:
-                    question = BMQuestion.objects.get(id=int(record.split("_")[1]))
+                    question = self.questions[int(record.split("_")[1])]
                     if question.sub_question_to is None:
                         raise ValidationError("This field cannot be blank")
                     else:
@@ -2,8 +2,8 @@ import os
 import csv
 import json
 from django.core.exceptions import ValidationError
-from django.contrib.staticfiles.storage import staticfiles_storage
 from django.utils.translation import gettext_lazy as _
+from projects.static_tables import static_tables, LazyTable
 
 BM_QUESTIONS_CATEGORIES = {
     "dialogue": _("Engagement, dialogue, and co-determination"),
@@ -62,32 +62,31 @@ BM_DEFAULT_ECONOMIC_VALUES = {
 }
 
 
-B_MODELS = {}
+def parse_business_models_list(filepath):
+    """Parse business_model_list.csv, the advantages and disadvantages columns contain json lists"""
+    b_models = {}
+    if os.path.exists(filepath) is True:
+        with open(filepath, encoding="utf-8") as csvfile:
+            csvreader = csv.reader(csvfile, delimiter=",", quotechar='"')
+            for i, row in enumerate(csvreader):
+                if i == 0:
+                    hdr = row
+                    # Name,Category,Description,Graph,Responsibilities
+                    label_idx = hdr.index("Name")
+                else:
+                    label = row[label_idx]
+                    b_models[label] = {}
+                    for k, v in zip(hdr, row):
+                        if k not in ("Advantages", "Disadvantages"):
+                            b_models[label][k] = v
+                        else:
+                            b_models[label][k] = json.loads(v)
+    return b_models
 
-if os.path.exists(staticfiles_storage.path("business_model_list.csv")) is True:
-    with open(staticfiles_storage.path("business_model_list.csv"), encoding="utf-8") as csvfile:
-        csvreader = csv.reader(csvfile, delimiter=",", quotechar='"')
-        for i, row in enumerate(csvreader):
-            if i == 0:
-                hdr = row
-                # Name,Category,Description,Graph,Responsibilities
-                label_idx = hdr.index("Name")
-                verbose_idx = hdr.index("Verbose")
-                graph_idx = hdr.index("Graph")
-                description_idx = hdr.index("Description")
-                cat_idx = hdr.index("Category")
-                resp_idx = hdr.index("Responsibilities")
-                adv_idx = hdr.index("Advantages")
-                disadv_idx = hdr.index("Disadvantages")
-                report_idx = hdr.index("Report")
-            else:
-                label = row[label_idx]
-                B_MODELS[label] = {}
-                for k, v in zip(hdr, row):
-                    if k not in ("Advantages", "Disadvantages"):
-                        B_MODELS[label][k] = v
-                    else:
-                        B_MODELS[label][k] = json.loads(v)
+
+static_tables.register("business_model_list", "business_model_list.csv", parse_business_models_list)
+
+B_MODELS = LazyTable("business_model_list")
 
 
 def available_models(score, grid_condition):
@@ -12,7 +12,7 @@ from django.shortcuts import get_object_or_404
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from projects.models import Scenario
-from django.db.models import Value, Q, F, Case, When
+from django.db.models import Value, Q, F, Case, When, Count, Sum
 from django.db.models.functions import Concat, Replace
 from business_model.helpers import B_MODELS, BM_QUESTIONS_CATEGORIES, BM_DEFAULT_ECONOMIC_VALUES, validate_percent
 
@@ -35,19 +35,15 @@ class BusinessModel(models.Model):
 
     @property
     def total_score(self):
-        total_score = 0
-        user_answers = self.user_answers.all()
-        if user_answers:
-            for answer in user_answers:
-                if answer.score is not None:
-                    total_score += answer.score * answer.question.criteria_weight
-                else:
-                    total_score = None
-                    break
-        else:
-            total_score = None
-
-        return total_score
+        """Sum of the answers scores weighted by their question criteria weight, None unless all questions are answered"""
+        scores = self.user_answers.aggregate(
+            n_answers=Count("id"),
+            n_unanswered=Count("id", filter=Q(score__isnull=True)),
+            total_score=Sum(F("score") * F("question__criteria_weight")),
+        )
+        if scores["n_answers"] == 0 or scores["n_unanswered"] > 0:
+            return None
+        return scores["total_score"]
 
     @property
     def default_economic_model_values(self):
@@ -0,0 +1,33 @@
+"""Questionnaire helping the users to assess whether their community is suitable for a community-led business model
+
+The answers of a business model are created and updated in bulk, so that a visit of the questionnaire costs the same
+number of queries whatever the number of questions.
+"""
+
+from business_model.models import BMAnswer, BMQuestion
+
+
+def get_or_create_answers(bm):
+    """Create the missing answers of the business model (one per BMQuestion) and return all its answers
+
+    :param bm: BusinessModel instance
+    :return: queryset of the answers of the business model, with their question, ordered by question
+    """
+    answered = BMAnswer.objects.filter(business_model=bm, question__isnull=False).values("question_id")
+    missing = BMQuestion.objects.exclude(id__in=answered).order_by("id")
+    BMAnswer.objects.bulk_create([BMAnswer(business_model=bm, question=question) for question in missing])
+    return BMAnswer.objects.filter(business_model=bm).select_related("question").order_by("question")
+
+
+def save_answers(bm, cleaned_data):
+    """Save the scores of a filled BMQuestionForm to the answers of the business model
+
+    :param bm: BusinessModel instance
+    :param cleaned_data: cleaned data of the form, a score for each "criteria_<question id>" field
+    :return: the number of updated answers
+    """
+    scores = {int(field.replace("criteria_", "")): score for field, score in cleaned_data.items()}
+    answers = list(BMAnswer.objects.filter(business_model=bm, question_id__in=scores))
+    for answer in answers:
+        answer.score = scores[answer.question_id]
+    return BMAnswer.objects.bulk_update(answers, ["score"])
@@ -7,3 +7,48 @@ from django.test import TestCase
 from dashboard.models import SensitivityAnalysis
 from dashboard.helpers import dict_keyword_mapper, nested_dict_crawler, KPIFinder
 from projects.models import Asset
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from business_model.models import BusinessModel, BMAnswer, BMQuestion
+from projects.models import Scenario
+
+
+class QuestionnaireTest(TestCase):
+    fixtures = ["fixtures/benchmarks_fixture.json"]
+
+    def setUp(self):
+        call_command("update_bmquestions")
+        self.bm = BusinessModel.objects.create(scenario=Scenario.objects.get(pk=2), grid_condition="isolated")
+        self.url = reverse("help_select_questions", args=[self.bm.id])
+        self.client.login(username="testUser", password="ASas12,.")
+
+    def get_questionnaire(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, HTTP_X_REQUESTED_WITH="XMLHttpRequest")
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_visits_cost_a_constant_number_of_queries(self):
+        n_questions = BMQuestion.objects.count()
+        first_visit = self.get_questionnaire()
+        self.assertEqual(self.bm.user_answers.count(), n_questions)
+        self.assertLess(first_visit, 15)
+        self.assertLess(self.get_questionnaire(), 15)
+        self.assertEqual(self.bm.user_answers.count(), n_questions)
+
+    def test_answers_are_saved_and_scored(self):
+        self.get_questionnaire()
+        self.assertIsNone(self.bm.total_score)
+
+        data = {f"criteria_{question.id}": "1.0" for question in BMQuestion.objects.all()}
+        response = self.client.post(self.url, data)
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(BMAnswer.objects.filter(business_model=self.bm, score__isnull=True).exists())
+
+        expected = sum(BMQuestion.objects.values_list("criteria_weight", flat=True))
+        self.assertAlmostEqual(self.bm.total_score, expected)
+
+        BMAnswer.objects.filter(pk=self.bm.user_answers.first().pk).update(score=None)
+        self.assertIsNone(self.bm.total_score)
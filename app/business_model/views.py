@@ -24,6 +24,7 @@ from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_http_methods
 from django.contrib.staticfiles.storage import staticfiles_storage
 from business_model.helpers import BM_QUESTIONS_CATEGORIES
+from business_model.services import get_or_create_answers, save_answers
 
 logger = logging.getLogger(__name__)
 
@@ -36,43 +37,18 @@ def help_select_questions(request, bm_id):
         form = BMQuestionForm(request.POST, qs=BMAnswer.objects.filter(business_model=bm))
 
         if form.is_valid():
-            qs = BMAnswer.objects.filter(business_model=bm)
-
-            for criteria_num, score in form.cleaned_data.items():
-                crit = qs.get(question__id=int(criteria_num.replace("criteria_", "")))
-                crit.score = score
-                crit.save(update_fields=["score"])
+            save_answers(bm, form.cleaned_data)
             proj_id = bm.scenario.project.id
             answer = HttpResponseRedirect(reverse("cpn_model_choice", args=[proj_id]))
         else:
-            criterias = BMQuestion.objects.all()
-            categories_map = [cat for cat in criterias.values_list("category", flat=True)]
-            categories = [cat for cat in criterias.values_list("category", flat=True).distinct()]
-            # form_html = get_template("cp_nigeria/business_model/help_select_questions.html")
             proj_id = bm.scenario.project.id
             answer = HttpResponseRedirect(reverse("cpn_steps", args=[proj_id, STEP_MAPPING["business_model"]]))
     else:
-        qs = BMAnswer.objects.filter(business_model=bm)
-
-        criterias = BMQuestion.objects.all()
-        if qs.exists() is False:
-            for criteria in criterias:
-                criteria_params = {}
-
-                criteria_params["business_model"] = bm
-                criteria_params["question"] = criteria
-                new_criteria = BMAnswer(**criteria_params)
-                new_criteria.save()
-
         categories = [cat for cat in BM_QUESTIONS_CATEGORIES.keys()]
 
-        form = BMQuestionForm(qs=BMAnswer.objects.filter(business_model=bm))
+        form = BMQuestionForm(qs=get_or_create_answers(bm))
 
-        categories_map = []
-        for field in form.fields:
-            n = int(field.split("_")[1])
-            cat = BMQuestion.objects.get(pk=n).category
-            categories_map.append(cat)
+        categories_map = [form.questions[int(field.split("_")[1])].category for field in form.fields]
 
         if request.headers.get("x-requested-with") == "XMLHttpRequest":
             answer = render(
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class CPNigeriaConfig(AppConfig):
     name = "cp_nigeria"
+
+    def ready(self):
+        # connect the signal receivers
+        from cp_nigeria import signals  # noqa: F401
@@ -0,0 +1,169 @@
+"""Running totals of the demand of the consumer groups of a project, one per demand asset
+
+The input timeseries of the three demand assets of a CPN project are the sums of the profiles of the consumer groups
+(number of consumers x demand profile), the groups of the households above the SHS threshold being excluded. Instead of
+summing all the profiles each time a group changes, a DemandAggregate keeps the total of a demand asset together with
+the groups it includes. When the groups change, the groups which were added, removed or modified are found by
+comparing this record with the database and only their profiles are loaded and added to (or subtracted from) the total.
+"""
+
+from collections import defaultdict
+import json
+
+import numpy as np
+from django.db.models import Q
+
+from cp_nigeria.helpers import get_shs_threshold
+from cp_nigeria.models import ConsumerGroup, DemandAggregate, DemandTimeseries, Options
+from projects.models import Asset
+
+# consumer types included in each demand category, the machinery demand is part of the enterprise demand
+DEMAND_CATEGORIES = {
+    "Household": ("Household",),
+    "Enterprise": ("Enterprise", "Machinery"),
+    "Public facility": ("Public facility",),
+}
+DEMAND_ASSETS = {
+    "electricity_demand_hh": "Household",
+    "electricity_demand_ent": "Enterprise",
+    "electricity_demand_pf": "Public facility",
+}
+N_HOURS = 8760
+
+
+def group_contributions(project, shs_threshold):
+    """Return the consumer groups counted in each demand category
+
+    :return: dict mapping each category to a dict {group id (str): [timeseries id, number of consumers]}
+    """
+    qs = ConsumerGroup.objects.filter(project=project, timeseries__isnull=False)
+    if len(shs_threshold) != 0:
+        qs = qs.exclude(timeseries__name__in=get_shs_threshold(shs_threshold))
+
+    categories = {consumer_type: category for category, types in DEMAND_CATEGORIES.items() for consumer_type in types}
+    contributions = {category: {} for category in DEMAND_CATEGORIES}
+    for group_id, ts_id, number_consumers, consumer_type in qs.values_list(
+        "id", "timeseries_id", "number_consumers", "consumer_type__consumer_type"
+    ):
+        if consumer_type in categories:
+            contributions[categories[consumer_type]][str(group_id)] = [ts_id, number_consumers]
+    return contributions
+
+
+def contribution_weights(old, new):
+    """Weights of the profiles to add to a total to go from the old to the new contributions
+
+    :param old: dict {group id: [timeseries id, number of consumers]} of the groups included in the total
+    :param new: dict {group id: [timeseries id, number of consumers]} of the groups to include
+    :return: dict {timeseries id: number of consumers to add (negative to remove)}, without zero weights
+    """
+    weights = defaultdict(int)
+    for group_id in old.keys() | new.keys():
+        if old.get(group_id) == new.get(group_id):
+            continue
+        if group_id in old:
+            ts_id, number_consumers = old[group_id]
+            weights[ts_id] -= number_consumers
+        if group_id in new:
+            ts_id, number_consumers = new[group_id]
+            weights[ts_id] += number_consumers
+    return {ts_id: weight for ts_id, weight in weights.items() if weight != 0}
+
+
+def changed_group_fields(consumer_group, cleaned_data):
+    """Return the names of the fields of a consumer group whose value differs from the cleaned data of its form
+
+    The foreign keys are compared by id, so that the related objects are not fetched.
+    """
+    changed = []
+    for field_name, field_value in cleaned_data.items():
+        if field_name in ("id", "DELETE"):
+            continue
+        field = ConsumerGroup._meta.get_field(field_name)
+        if field.is_relation:
+            field_value = field_value.pk if field_value is not None else None
+        if getattr(consumer_group, field.attname) != field_value:
+            changed.append(field_name)
+    return changed
+
+
+def load_profiles(timeseries_ids):
+    """Return the demand profiles in kWh, as a dict {timeseries id: numpy array}"""
+    profiles = {}
+    for ts in DemandTimeseries.objects.filter(id__in=timeseries_ids).only("id", "values", "units"):
+        profiles[ts.id] = np.array(ts.get_values_with_unit("kWh"))
+    return profiles
+
+
+def update_demand_aggregates(project):
+    """Apply the changes of the consumer groups of the project to its demand totals
+
+    :param project: Project instance
+    :return: tuple (dict mapping each category to its total as a list, set of the categories whose total changed)
+    """
+    options = Options.objects.get(project=project)
+    contributions = group_contributions(project, options.shs_threshold)
+    aggregates = {aggregate.category: aggregate for aggregate in DemandAggregate.objects.filter(project=project)}
+
+    weights = {
+        category: contribution_weights(aggregates[category].contributions if category in aggregates else {}, new)
+        for category, new in contributions.items()
+    }
+    profiles = load_profiles({ts_id for category_weights in weights.values() for ts_id in category_weights})
+    for category, category_weights in weights.items():
+        # a profile of the total was deleted, the total is summed again from scratch
+        if not profiles.keys() >= category_weights.keys():
+            aggregates.pop(category, None)
+            weights[category] = contribution_weights({}, contributions[category])
+            profiles.update(load_profiles(weights[category].keys() - profiles.keys()))
+
+    totals = {}
+    changed = set()
+    for category, new in contributions.items():
+        aggregate = aggregates.get(category)
+        if aggregate is None:
+            # first update of the category (or rebuild), the total starts from zero
+            aggregate, _ = DemandAggregate.objects.get_or_create(project=project, category=category)
+            aggregate.contributions = {}
+            aggregate.values = np.zeros(N_HOURS).tolist()
+            changed.add(category)
+        if weights[category]:
+            total = np.array(aggregate.values, dtype=float)
+            for ts_id, weight in weights[category].items():
+                total += weight * profiles[ts_id]
+            # avoid keeping rounding errors once all groups are removed
+            aggregate.values = total.tolist() if new else np.zeros(N_HOURS).tolist()
+            changed.add(category)
+        if category in changed or aggregate.contributions != new:
+            aggregate.contributions = new
+            aggregate.save()
+        totals[category] = aggregate.values
+    return totals, changed
+
+
+def update_demand_assets(project):
+    """Update the demand totals of the project and write the demand assets whose total changed
+
+    As with get_aggregated_demand, the input timeseries of the demand assets are empty while the project has no
+    consumer groups.
+
+    :return: set of the names of the demand assets which were updated
+    """
+    totals, changed = update_demand_aggregates(project)
+    has_groups = ConsumerGroup.objects.filter(project=project).exists()
+    qs_demand = Asset.objects.filter(
+        scenario=project.scenario, asset_type__asset_type="reducable_demand", name__in=DEMAND_ASSETS.keys()
+    )
+    if has_groups:
+        names = [name for name, category in DEMAND_ASSETS.items() if category in changed]
+        # the assets emptied while the project had no consumer groups are written again as well
+        qs_demand = qs_demand.filter(Q(name__in=names) | Q(input_timeseries="[]") | Q(input_timeseries__isnull=True))
+    else:
+        qs_demand = qs_demand.exclude(input_timeseries="[]")
+
+    updated = set()
+    for demand in qs_demand:
+        demand.input_timeseries = json.dumps(totals[DEMAND_ASSETS[demand.name]] if has_groups else [])
+        demand.save()
+        updated.add(demand.name)
+    return updated
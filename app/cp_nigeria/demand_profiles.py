@@ -0,0 +1,79 @@
+"""Index of the demand profiles (DemandTimeseries) with their precomputed statistics
+
+The demand step lists, previews and sums up the demand profiles of the library. Each profile holds a full year of
+hourly values, so a DemandProfileSummary row keeps the figures needed by the user interface (annual total, peak, daily
+mean, household tier, daily shape and first week) and the full profile is only loaded to build the energy system.
+
+The summaries are updated when a DemandTimeseries is saved (see cp_nigeria.signals) and rebuilt by the cp_setup command
+after the profiles are loaded from the fixtures.
+"""
+
+import logging
+
+import numpy as np
+
+from cp_nigeria.helpers import HOUSEHOLD_TIERS
+from cp_nigeria.models import DemandProfileSummary, DemandTimeseries
+
+logger = logging.getLogger(__name__)
+
+# conversion factors of the timeseries units to kWh
+KWH_FACTORS = {"Wh": 0.001, "kWh": 1}
+TIERS_BY_NAME = {verbose: tier for tier, verbose in HOUSEHOLD_TIERS if tier != ""}
+
+
+def profile_statistics(values, units):
+    """Compute the statistics of an hourly demand profile
+
+    :param values: list of the hourly values of the profile
+    :param units: units of the values, "Wh" or "kWh"
+    :return: dict with annual_total, peak, daily_mean (in kWh), daily_shape (24 values) and first_week (168 values)
+    """
+    if units not in KWH_FACTORS:
+        raise ValueError("Unsupported units")
+    profile = np.asarray(values, dtype=float) * KWH_FACTORS[units]
+    n_days = profile.size // 24
+    daily_shape = profile[: n_days * 24].reshape(n_days, 24).mean(axis=0) if n_days > 0 else np.zeros(24)
+    return dict(
+        annual_total=float(profile.sum()),
+        peak=float(profile.max()) if profile.size > 0 else 0.0,
+        daily_mean=float(profile.sum() / n_days) if n_days > 0 else float(profile.sum()),
+        daily_shape=daily_shape.tolist(),
+        first_week=profile[:168].tolist(),
+    )
+
+
+def update_profile_summary(timeseries):
+    """Create or update the summary of a DemandTimeseries, return None if its units are not supported"""
+    try:
+        statistics = profile_statistics(timeseries.values, timeseries.units)
+    except ValueError:
+        logger.warning(f"The demand profile '{timeseries.name}' has unsupported units ({timeseries.units})")
+        return None
+    summary, _ = DemandProfileSummary.objects.update_or_create(
+        timeseries=timeseries,
+        defaults=dict(
+            name=timeseries.name,
+            consumer_type_id=timeseries.consumer_type_id,
+            tier=TIERS_BY_NAME.get(timeseries.name, ""),
+            **statistics,
+        ),
+    )
+    return summary
+
+
+def get_profile_summary(timeseries_id):
+    """Return the summary of a DemandTimeseries, computing it if it is missing"""
+    summary = DemandProfileSummary.objects.filter(timeseries_id=timeseries_id).first()
+    if summary is None:
+        summary = update_profile_summary(DemandTimeseries.objects.get(id=timeseries_id))
+    return summary
+
+
+def refresh_profile_index():
+    """Rebuild the summaries of all DemandTimeseries, return the number of summaries"""
+    n_summaries = 0
+    for timeseries in DemandTimeseries.objects.iterator(chunk_size=50):
+        if update_profile_summary(timeseries) is not None:
+            n_summaries += 1
+    return n_summaries
@@ -0,0 +1,187 @@
+"""Builders of synthetic cp_nigeria projects and MVS responses, shared by the tests and the benchmarks
+
+The fixtures shipped with the repository only contain small, generic MVS scenarios. The cp_nigeria helpers
+(FinancialTool, ReportHandler, get_aggregated_cgs...) need consumer groups, options, equity data and simulation
+results with the asset names of the cp_nigeria energy system, so these are created here on top of the asset types of
+fixtures/benchmarks_fixture.json.
+"""
+
+import json
+import uuid
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from business_model.models import BusinessModel, EquityData
+from cp_nigeria.models import ConsumerGroup, ConsumerType, DemandTimeseries, ImplementationPlanContent, Options
+from projects.constants import DONE
+from projects.models import Asset, AssetType, Bus, ConnectionLink, EconomicData, Project, Scenario, Simulation
+from projects.requests import parse_mvs_results
+
+CONSUMER_TYPES = ["Household", "Enterprise", "Public facility", "Machinery"]
+
+# (bus, energy_vector, direction, asset, asset_type, oemof_type) of the flows of a diesel/pv/battery mini-grid
+CPN_FLOWS = [
+    ("fuel_bus", "Gas", "in", "diesel_fuel", "dso", "source"),
+    ("fuel_bus", "Gas", "out", "diesel_generator", "diesel_generator", "transformer"),
+    ("ac_bus", "Electricity", "in", "diesel_generator", "diesel_generator", "transformer"),
+    ("ac_bus", "Electricity", "in", "inverter", "transformer_station_in", "transformer"),
+    ("ac_bus", "Electricity", "out", "electricity_demand_hh_critical", "demand", "sink"),
+    ("ac_bus", "Electricity", "out", "electricity_demand_ent_critical", "demand", "sink"),
+    ("ac_bus", "Electricity", "out", "electricity_demand_pf_critical", "demand", "sink"),
+    ("ac_bus", "Electricity", "out", "ac_bus_excess", "excess", "sink"),
+    ("dc_bus", "Electricity", "in", "pv_plant", "pv_plant", "source"),
+    ("dc_bus", "Electricity", "in", "battery", "capacity", "storage"),
+    ("dc_bus", "Electricity", "out", "battery", "capacity", "storage"),
+    ("dc_bus", "Electricity", "out", "inverter", "transformer_station_in", "transformer"),
+]
+
+# name, asset type and cost parameters of the assets matching CPN_FLOWS
+CPN_ASSETS = {
+    "diesel_generator": dict(asset_type="diesel_generator", capex_var=250, opex_fix=20, opex_var_extra=0.7, lifetime=8),
+    "inverter": dict(asset_type="transformer_station_in", capex_var=400, opex_fix=10, lifetime=10),
+    "pv_plant": dict(asset_type="pv_plant", capex_var=600, opex_fix=15, lifetime=25),
+    "battery": dict(asset_type="bess", lifetime=10),
+    "battery capacity": dict(asset_type="capacity", capex_var=300, opex_fix=10, lifetime=10, parent_asset="battery"),
+    "battery input power": dict(asset_type="charging_power", lifetime=10, parent_asset="battery"),
+    "battery output power": dict(asset_type="discharging_power", lifetime=10, parent_asset="battery"),
+}
+
+
+def synthetic_flow(n_timesteps, peak=50.0, seed=0):
+    """Return a daily periodic profile with noise, good enough to exercise the timeseries code paths"""
+    rng = np.random.default_rng(seed)
+    hours = np.arange(n_timesteps) % 24
+    profile = peak * (0.5 + 0.5 * np.sin((hours - 6) * np.pi / 12).clip(0)) + rng.random(n_timesteps)
+    return profile.round(3)
+
+
+def synthetic_mvs_response(n_timesteps, flows=None, n_extra_assets=0):
+    """Build an MVS response json string mimicking the one parsed by projects.requests.parse_mvs_results
+
+    :param n_timesteps: number of timesteps of each flow
+    :param flows: list of (bus, energy_vector, direction, asset, asset_type, oemof_type) tuples
+    :param n_extra_assets: number of additional production assets on the ac_bus
+    """
+    if flows is None:
+        flows = CPN_FLOWS
+    flows = list(flows) + [
+        ("ac_bus", "Electricity", "in", f"pv_plant_{i}", "pv_plant", "source") for i in range(n_extra_assets)
+    ]
+
+    data = np.vstack([synthetic_flow(n_timesteps, seed=i) for i in range(len(flows))]).T
+    # the last row of the raw results contains the optimized capacities, which MVS only provides for the output flow
+    # of components (and for both flows of storages)
+    capacities = [
+        10.0 * (i + 1) if flow[5] == "storage" or (flow[2] == "in" and flow[5] in ("source", "transformer")) else np.nan
+        for i, flow in enumerate(flows)
+    ]
+    data = np.vstack([data, capacities])
+    raw_results = pd.DataFrame(data, columns=pd.MultiIndex.from_tuples(flows)).to_json(orient="split")
+
+    scalars = {
+        "levelized_costs_of_electricity_equivalent": 0.35,
+        "total_demandElectricity": float(data[:-1].sum()),
+        "renewable_factor": 0.6,
+    }
+    cost_matrix = {"label": {str(i): flow[3] for i, flow in enumerate(flows)}}
+    # the assets of each category are listed as in the MVS results, an asset with several flows only once
+    assets = {flow[3]: {"label": flow[3], "energy_vector": flow[1]} for flow in flows}
+    response = {
+        "kpi": {"scalars": scalars, "cost_matrix": json.dumps(cost_matrix)},
+        "energy_consumption": [v for k, v in assets.items() if "demand" in k],
+        "energy_conversion": [v for k, v in assets.items() if k in ("diesel_generator", "inverter")],
+        "energy_production": [v for k, v in assets.items() if "pv_plant" in k],
+        "energy_providers": [v for k, v in assets.items() if k == "diesel_fuel"],
+        "energy_storage": [v for k, v in assets.items() if k == "battery"],
+        "raw_results": raw_results,
+    }
+    return json.dumps(response)
+
+
+def get_consumer_types():
+    return [ConsumerType.objects.get_or_create(consumer_type=name)[0] for name in CONSUMER_TYPES]
+
+
+def create_cpn_project(user, horizon=365, n_extra_assets=0, n_consumer_groups=8, with_results=True):
+    """Create a cp_nigeria project with demand, options, equity data and (optionally) simulation results
+
+    :param user: owner of the project
+    :param horizon: evaluated period of the scenario in days
+    :param n_extra_assets: number of additional assets in the simulation results
+    :param n_consumer_groups: number of consumer groups per consumer type
+    :param with_results: if True a finished simulation is attached and a synthetic MVS response is parsed
+    """
+    economic_data = EconomicData.objects.create(duration=20, currency="NGN", discount=0.12, tax=0.075)
+    project = Project.objects.create(
+        name=f"Synthetic project {uuid.uuid4().hex[:6]}",
+        description="Synthetic cp_nigeria project",
+        country="NIGERIA",
+        latitude=8.2929,
+        longitude=7.9102,
+        economic_data=economic_data,
+        user=user,
+    )
+    scenario = Scenario.objects.create(
+        name="benchmark", start_date=datetime(2023, 1, 1), time_step=60, evaluated_period=horizon, project=project
+    )
+
+    busses = {}
+    for bus_name, energy_vector in (("fuel_bus", "Gas"), ("ac_bus", "Electricity"), ("dc_bus", "Electricity")):
+        busses[bus_name] = Bus.objects.create(name=bus_name, type=energy_vector, scenario=scenario)
+
+    assets = {}
+    for name, params in CPN_ASSETS.items():
+        params = params.copy()
+        asset_type = AssetType.objects.get(asset_type=params.pop("asset_type"))
+        parent = params.pop("parent_asset", None)
+        assets[name] = Asset.objects.create(
+            name=name,
+            scenario=scenario,
+            asset_type=asset_type,
+            parent_asset=assets.get(parent),
+            installed_capacity=0.0,
+            optimize_cap=True,
+            **params,
+        )
+    for bus_name, _, direction, asset_name, _, _ in CPN_FLOWS:
+        if asset_name in assets:
+            ConnectionLink.objects.create(
+                bus=busses[bus_name],
+                asset=assets[asset_name],
+                bus_connection_port="input_1" if direction == "in" else "output_1",
+                flow_direction="A2B" if direction == "in" else "B2A",
+                scenario=scenario,
+            )
+
+    Options.objects.create(project=project, user_case="diesel_pv_bess", shs_threshold="")
+    EquityData.objects.create(scenario=scenario, debt_start=scenario.start_date.year)
+    BusinessModel.objects.create(scenario=scenario, grid_condition="isolated", model_name="cooperative")
+
+    consumer_groups = []
+    for ct_idx, consumer_type in enumerate(get_consumer_types()):
+        for i in range(n_consumer_groups):
+            ts = DemandTimeseries.objects.create(
+                name=f"{consumer_type.consumer_type}_{i}",
+                values=(synthetic_flow(8760, peak=0.5, seed=10 * ct_idx + i) / 1000).tolist(),
+                units="kWh",
+                consumer_type=consumer_type,
+            )
+            consumer_groups.append(
+                ConsumerGroup(project=project, consumer_type=consumer_type, timeseries=ts, number_consumers=10 + i)
+            )
+    ConsumerGroup.objects.bulk_create(consumer_groups)
+
+    if with_results is True:
+        simulation = Simulation.objects.create(
+            scenario=scenario,
+            start_date=datetime.now() - timedelta(seconds=10),
+            end_date=datetime.now(),
+            status=DONE,
+            mvs_token=str(uuid.uuid4()),
+        )
+        parse_mvs_results(simulation, synthetic_mvs_response(horizon * 24, n_extra_assets=n_extra_assets))
+        ImplementationPlanContent.objects.create(simulation=simulation)
+
+    return project
@@ -15,7 +15,7 @@ from business_model.helpers import validate_percent
 from projects.constants import CURRENCY_SYMBOLS, ENERGY_DENSITY_DIESEL
 from .models import *
 from projects.helpers import PARAMETERS
-from projects.requests import request_exchange_rate
+from projects.exchange_rates import latest_exchange_rate
 from cp_nigeria.helpers import HOUSEHOLD_TIERS
 
 
@@ -91,7 +91,7 @@ class EconomicProjectForm(OpenPlanModelForm):
         self.fields["currency"].initial = "NGN"
 
         if instance is None:
-            self.fields["exchange_rate"].initial = request_exchange_rate("NGN")
+            self.fields["exchange_rate"].initial = latest_exchange_rate("NGN")
 
 
 class EconomicDataForm(OpenPlanModelForm):
@@ -15,17 +15,19 @@ import json
 import csv
 import base64
 import io
+import hashlib
 import logging
 from cp_nigeria.models import ConsumerGroup, DemandTimeseries, Options, ImplementationPlanContent
 from projects.models import Asset, Simulation
 from projects.constants import ENERGY_DENSITY_DIESEL, CURRENCY_SYMBOLS
+from projects.static_tables import static_tables, LazyTable, StaticTableAttribute
+from projects.caching import get_or_set
 from business_model.models import EquityData, BusinessModel, BMAnswer
 from business_model.helpers import B_MODELS
 from dashboard.models import FancyResults, KPIScalarResults
 from projects.models import EconomicData
 from django.shortcuts import get_object_or_404
 from django.db.models import Func, Sum, Avg, Max
-from django.contrib.staticfiles.storage import staticfiles_storage
 from django.templatetags.static import static
 from dashboard.models import get_costs
 from django.db.models import Case
@@ -33,6 +35,8 @@ from django.db import transaction
 from django.utils.functional import cached_property
 from geopy.geocoders import Nominatim
 
+logger = logging.getLogger(__name__)
+
 
 class Unnest(Func):
     subquery = True  # contains_subquery = True for Django > 4.2.7
@@ -50,12 +54,12 @@ HOUSEHOLD_TIERS = [
 ]
 
 
-def csv_to_dict(filepath, label_col="label"):
+def parse_labelled_csv(path, label_col="label"):
     # the csv must contain a column named "label" containing the variable name, which will be used to construct the
     # nested dictionaries
     dict = {}
-    if os.path.exists(staticfiles_storage.path(filepath)) is True:
-        with open(staticfiles_storage.path(filepath), encoding="utf-8") as csvfile:
+    if os.path.exists(path) is True:
+        with open(path, encoding="utf-8") as csvfile:
             csvreader = csv.reader(csvfile, delimiter=",", quotechar='"')
             for i, row in enumerate(csvreader):
                 if i == 0:
@@ -70,8 +74,19 @@ def csv_to_dict(filepath, label_col="label"):
     return dict
 
 
-FINANCIAL_PARAMS = csv_to_dict("financial_tool/financial_parameters_list.csv")
-OUTPUT_PARAMS = csv_to_dict("cpn_output_params.csv")
+static_tables.register("financial_parameters_list", "financial_tool/financial_parameters_list.csv", parse_labelled_csv)
+static_tables.register("cpn_output_params", "cpn_output_params.csv", parse_labelled_csv)
+static_tables.register(
+    "business_model_report_criteria",
+    "business_model_report_criteria.csv",
+    lambda path: parse_labelled_csv(path, label_col="Criteria"),
+)
+static_tables.register(
+    "cost_assumptions", "financial_tool/cost_assumptions.csv", lambda path: pd.read_csv(path, sep=";")
+)
+
+FINANCIAL_PARAMS = LazyTable("financial_parameters_list")
+OUTPUT_PARAMS = LazyTable("cpn_output_params")
 
 
 def calculate_co2_mitigation(project):
@@ -126,9 +141,9 @@ def save_table_for_report(scenario, attr_name, cols, rows, units_on=[]):
             report_content = report_qs.first()
             setattr(report_content, attr_name, json.dumps({"headers": report_headers, "data": report_table}))
             report_content.save()
-            print(f"Saved {attr_name} to database")
+            logger.debug(f"Saved {attr_name} to database")
         else:
-            print(f"Report object was not found, so {attr_name} could not be saved")
+            logger.warning(f"Report object was not found, so {attr_name} could not be saved")
 
 
 def set_outputs_table_format(param, currency_symbol, from_dict=OUTPUT_PARAMS):
@@ -157,7 +172,7 @@ def set_outputs_table_format(param, currency_symbol, from_dict=OUTPUT_PARAMS):
 def get_project_summary(project):
     bm_name = BusinessModel.objects.get(scenario=project.scenario).model_name
     options = Options.objects.get(project=project)
-    ft = FinancialTool(project)
+    ft = get_financial_tool(project)
     if "inverter" in ft.system_params["supply_source"].tolist():
         inverter_aggregated_flow = ft.system_params.loc[
             (ft.system_params["category"] == "total_flow") & (ft.system_params["supply_source"] == "inverter"), "value"
@@ -217,6 +232,8 @@ def get_shs_threshold(shs_tier):
 
 
 def get_aggregated_cgs(project, as_ts=False):
+    from cp_nigeria.demand_profiles import get_profile_summary
+
     options = get_object_or_404(Options, project=project)
     shs_threshold = options.shs_threshold
 
@@ -235,23 +252,33 @@ def get_aggregated_cgs(project, as_ts=False):
 
     for consumer_type_id, consumer_type in enumerate(consumer_types, 1):
         results_dict[consumer_type] = {}
-        total_demand = np.zeros(8760)
+        total_demand = np.zeros(8760) if as_ts is True else 0.0
         total_consumers = 0
 
         # filter consumer group objects based on consumer type
         group_qs = ConsumerGroup.objects.filter(project=project, consumer_type_id=consumer_type_id)
+        if as_ts is True:
+            group_qs = group_qs.select_related("timeseries")
+        else:
+            # only the annual totals are needed, they are read from the demand profiles index
+            group_qs = group_qs.select_related("timeseries__summary").defer("timeseries__values")
 
         # calculate total consumers and total demand as sum of array elements in kWh
         for group in group_qs:
-            ts = DemandTimeseries.objects.get(pk=group.timeseries_id)
+            ts = group.timeseries
+            if as_ts is True:
+                demand = np.array(ts.get_values_with_unit("kWh"))
+            else:
+                summary = getattr(ts, "summary", None) or get_profile_summary(ts.id)
+                demand = summary.annual_total
 
             if shs_consumers is not None and ts.name in shs_consumers:
-                total_demand_shs += np.array(ts.get_values_with_unit("kWh")) * group.number_consumers
-                total_demand_shs += np.array(ts.get_values_with_unit("kWh")) * group.number_consumers
+                total_demand_shs += demand * group.number_consumers
+                total_demand_shs += demand * group.number_consumers
                 total_consumers_shs += group.number_consumers
 
             else:
-                total_demand += np.array(ts.get_values_with_unit("kWh")) * group.number_consumers
+                total_demand += demand * group.number_consumers
                 total_consumers += group.number_consumers
 
         # add machinery total demand to enterprise demand without increasing nr. of consumers
@@ -270,7 +297,7 @@ def get_aggregated_cgs(project, as_ts=False):
 
     if as_ts is not True:
         for key in results_dict:
-            results_dict[key]["total_demand"] = round(sum(results_dict[key]["total_demand"]), 0)
+            results_dict[key]["total_demand"] = round(float(np.sum(results_dict[key]["total_demand"])), 0)
 
     return results_dict
 
@@ -538,7 +565,7 @@ class ReportHandler:
             * self.project.economic_data.exchange_rate
         )
 
-        ft = FinancialTool(project)
+        ft = get_financial_tool(project)
         self.cost_assumptions = ft.cost_assumption_tables
 
         fulfilled_demand, peak_demand, daily_demand = get_fulfilled_demand_indicators(project)
@@ -910,7 +937,7 @@ class ReportHandler:
 
     @staticmethod
     def create_community_criteria_list(bmanswer_qs):
-        BM_CRITERIA = csv_to_dict("business_model_report_criteria.csv", label_col="Criteria")
+        BM_CRITERIA = static_tables.get("business_model_report_criteria")
         criteria_list = []
         for criteria, values in BM_CRITERIA.items():
             total_score_qs = bmanswer_qs.filter(question_id__in=json.loads(values["Questions"])).aggregate(
@@ -1282,8 +1309,35 @@ class ReportHandler:
         )
 
 
+def compound_growth_matrix(base_amounts, growth_rates, n_years):
+    """
+    Return a (items x years) array where each row is a base amount growing at its annual growth rate, i.e.
+    base_amount * (1 + growth_rate) ** year for year in range(n_years).
+    """
+    base_amounts = np.asarray(base_amounts, dtype=float).reshape(-1, 1)
+    growth_rates = np.asarray(growth_rates, dtype=float).reshape(-1, 1)
+    return base_amounts * (1 + growth_rates) ** np.arange(n_years)
+
+
+def first_year_and_diff(values):
+    """Return the yearly increase of each row of a (items x years) array, the first year keeps its initial value"""
+    values = np.asarray(values, dtype=float)
+    return np.concatenate([values[:, :1], np.diff(values, axis=1)], axis=1)
+
+
+def corporate_tax(ebt, tax_rate):
+    """Tax on the positive earnings before tax of each year"""
+    return np.where(ebt > 0, ebt * tax_rate, 0.0)
+
+
+def depreciation_row(amount, years, depreciation_yrs):
+    # TODO the amount is only depreciated over the years whose label is lower or equal to depreciation_yrs, as the
+    #  labels are calendar years (e.g. 2024) and depreciation_yrs a duration no depreciation is applied at the moment
+    return np.where(np.asarray(years) <= depreciation_yrs, amount / depreciation_yrs, 0.0)
+
+
 class FinancialTool:
-    cost_assumptions = pd.read_csv(staticfiles_storage.path("financial_tool/cost_assumptions.csv"), sep=";")
+    cost_assumptions = StaticTableAttribute("cost_assumptions")
     loan_assumptions = {"Tenor": 10, "Grace period": 1, "Cum. replacement years": 10}
 
     def __init__(self, project):
@@ -1296,6 +1350,8 @@ class FinancialTool:
         # TODO there are a number of loose variables (unclear if default or missing in tool) - see list in PR and
         #  discuss along with best approach to display results
         self.project = project
+        # own copy of the cost assumptions, set_tariff() must not modify the table shared by all instances
+        self.cost_assumptions = FinancialTool.cost_assumptions.copy()
         self.exchange_rate = project.economic_data.exchange_rate
         self.project_start = project.scenario.start_date.year
         self.project_duration = project.economic_data.duration
@@ -1456,10 +1512,6 @@ class FinancialTool:
         financial_params["capex_fix"] = self.project.scenario.capex_fix
         return financial_params
 
-    @staticmethod
-    def yearly_increase(base_amount, growth_rate, year):
-        return base_amount * (1 + growth_rate) ** year
-
     def growth_over_lifetime_table(self, df, base_col, growth_col, index_col=None):
         """
         This method creates a wide table over the project lifetime based on start values and growth rate of the given
@@ -1469,11 +1521,9 @@ class FinancialTool:
         methods.
         """
         lifetime_df = pd.DataFrame(
-            {
-                self.project_start
-                + year: self.yearly_increase(base_amount=df[base_col], growth_rate=df[growth_col], year=year)
-                for year in range(self.project_duration)
-            }
+            compound_growth_matrix(df[base_col], df[growth_col], self.project_duration),
+            index=df.index,
+            columns=self.lifetime_years,
         )
 
         if index_col is not None:
@@ -1492,13 +1542,14 @@ class FinancialTool:
         consumer increase is not accounted for, so all but the initial year should return 0.
         """
         vars = [ix for ix in df.index if "nr_consumers" in ix]
-        for var in vars:
-            diff = df.T[var].diff()
-            diff[self.project_start] = df[self.project_start].loc[var]
-            new_var = f"{var}_new"
-            df.loc[new_var] = diff
-
-        return df
+        if len(vars) == 0:
+            return df
+        new_rows = pd.DataFrame(
+            first_year_and_diff(df.loc[vars].to_numpy()),
+            index=pd.Index([f"{var}_new" for var in vars], name=df.index.name),
+            columns=df.columns,
+        )
+        return pd.concat([df, new_rows])
 
     @cached_property
     def capex(self):
@@ -1747,72 +1798,82 @@ class FinancialTool:
         )
 
     @property
-    def losses_over_lifetime(self):
+    def lifetime_years(self):
+        return list(range(self.project_start, self.project_start + self.project_duration))
+
+    def lifetime_losses(self):
         """
         This method first calculates the EBITDA (earnings before interest, tax, depreciation and amortization), then
         the financial losses through depreciation, interest payments to get the EBT (earnings before tax) and finally
-        including taxes to get the net income over the project lifetime. The calculate_capex() method is used here.
+        including taxes to get the net income over the project lifetime. The rows are returned as arrays over the
+        project lifetime, see losses_over_lifetime for the table.
         """
+        years = self.lifetime_years
         depreciation_yrs = self.project_duration
         capex_df = self.capex
         system_capex = capex_df[capex_df["Category"] == "Power supply system"][f"Total costs [{self.currency}]"].sum()
         equity = self.financial_params["equity_community_amount"] + self.financial_params["equity_developer_amount"]
-        losses = pd.DataFrame(columns=range(self.project_start, self.project_start + self.project_duration))
-
-        losses.loc["EBITDA"] = (
-            self.revenue_over_lifetime.loc[("Total operating revenues", "operating_revenues_total"), :]
-            - self.om_costs_over_lifetime.loc["opex_total"]
+        initial_loan = self.initial_loan_table
+        replacement_loan = self.replacement_loan_table
+
+        losses = {}
+        losses["EBITDA"] = (
+            self.revenue_over_lifetime.loc[("Total operating revenues", "operating_revenues_total"), years].to_numpy()
+            - self.om_costs_over_lifetime.loc["opex_total", years].to_numpy()
+        ).astype(float)
+        losses["Depreciation"] = depreciation_row(system_capex, years, depreciation_yrs)
+        losses["Equity interest"] = np.full(len(years), equity * self.financial_params["equity_interest_MG"])
+        losses["Debt interest"] = (
+            initial_loan.loc["Interest", years].to_numpy() + replacement_loan.loc["Interest", years].to_numpy()
         )
-        losses.loc["Depreciation"] = 0.0
-        losses.loc["Depreciation", :depreciation_yrs] = system_capex / depreciation_yrs
-        losses.loc["Equity interest"] = equity * self.financial_params["equity_interest_MG"]
-        losses.loc["Debt interest"] = (
-            self.initial_loan_table.loc["Interest"] + self.replacement_loan_table.loc["Interest"]
+        losses["Debt repayments"] = (
+            initial_loan.loc["Principal", years].to_numpy() + replacement_loan.loc["Principal", years].to_numpy()
         )
-        losses.loc["Debt repayments"] = (
-            self.initial_loan_table.loc["Principal"] + self.replacement_loan_table.loc["Principal"]
-        )
-
-        losses.loc["EBT"] = (
-            losses.loc["EBITDA"]
-            - losses.loc["Depreciation"]
-            - losses.loc["Equity interest"]
-            - losses.loc["Debt interest"]
-        )
-        losses.loc["Corporate tax"] = [
-            losses.loc["EBT"][year] * self.financial_params["tax"] if losses.loc["EBT"][year] > 0 else 0
-            for year in losses.columns
-        ]
-        losses.loc["Net income"] = losses.loc["EBT"] - losses.loc["Corporate tax"]
+        losses["EBT"] = losses["EBITDA"] - losses["Depreciation"] - losses["Equity interest"] - losses["Debt interest"]
+        losses["Corporate tax"] = corporate_tax(losses["EBT"], self.financial_params["tax"])
+        losses["Net income"] = losses["EBT"] - losses["Corporate tax"]
 
         return losses
 
     @property
-    def cash_flow_over_lifetime(self):
+    def losses_over_lifetime(self):
+        """Table of the financial losses over the project lifetime, see lifetime_losses()"""
+        losses = self.lifetime_losses()
+        return pd.DataFrame(np.vstack(list(losses.values())), index=list(losses), columns=self.lifetime_years)
+
+    def lifetime_cash_flow(self, losses=None):
         """
         This method calculates the cash flows over system lifetime considering the previously calculated loan debt,
-        earnings and financial losses. Both the losses_ver_lifetime() and debt_service_table() are called here.
+        earnings and financial losses. The rows are returned as arrays over the project lifetime, see
+        cash_flow_over_lifetime for the table.
         """
-        cash_flow = pd.DataFrame(columns=range(self.project_start, self.project_start + self.project_duration))
-        losses = self.losses_over_lifetime
-
-        cash_flow.loc["Cash flow from operating activity"] = losses.loc["EBITDA"] - losses.loc["Corporate tax"]
-        cash_flow.loc["Cash flow after debt service"] = (
-            cash_flow.loc["Cash flow from operating activity"]
-            - losses.loc["Equity interest"]
-            - losses.loc["Debt interest"]
-            - losses.loc["Debt repayments"]
+        if losses is None:
+            losses = self.lifetime_losses()
+
+        cash_flow = {}
+        cash_flow["Cash flow from operating activity"] = losses["EBITDA"] - losses["Corporate tax"]
+        cash_flow["Cash flow after debt service"] = (
+            cash_flow["Cash flow from operating activity"]
+            - losses["Equity interest"]
+            - losses["Debt interest"]
+            - losses["Debt repayments"]
         )
-        cash_flow.loc["Free cash flow available"] = (
-            losses.loc["EBITDA"]
-            - losses.loc["Corporate tax"]
-            - losses.loc["Equity interest"]
-            - losses.loc["Debt interest"]
-            - losses.loc["Debt repayments"]
+        cash_flow["Free cash flow available"] = (
+            losses["EBITDA"]
+            - losses["Corporate tax"]
+            - losses["Equity interest"]
+            - losses["Debt interest"]
+            - losses["Debt repayments"]
         )
 
         return cash_flow
 
+    @property
+    def cash_flow_over_lifetime(self):
+        """Table of the cash flows over the project lifetime, see lifetime_cash_flow()"""
+        cash_flow = self.lifetime_cash_flow()
+        return pd.DataFrame(np.vstack(list(cash_flow.values())), index=list(cash_flow), columns=self.lifetime_years)
+
     def internal_return_on_investment(self, years):
         """
         This method returns the internal return on investment % based on project CAPEX, grant share and cash flows
@@ -1820,9 +1881,8 @@ class FinancialTool:
         """
         gross_capex = self.total_capex
         grant = self.financial_params["grant_share"] * gross_capex
-        cash_flow = self.cash_flow_over_lifetime
-        cash_flow_irr = cash_flow.loc["Cash flow from operating activity"].tolist()
-        cash_flow_irr.insert(0, -gross_capex + grant)
+        cash_flow = self.lifetime_cash_flow()
+        cash_flow_irr = np.concatenate([[-gross_capex + grant], cash_flow["Cash flow from operating activity"]])
 
         return npf.irr(cash_flow_irr[: (years + 1)])
 
@@ -1830,7 +1890,7 @@ class FinancialTool:
         # change the tariff to the custom tariff
         self.set_tariff(custom_tariff)
 
-        cashflow_helper = np.sum(self.cash_flow_over_lifetime.loc["Cash flow after debt service"].tolist()[0:5])
+        cashflow_helper = np.sum(self.lifetime_cash_flow()["Cash flow after debt service"][0:5])
         return cashflow_helper
 
     @property
@@ -1893,3 +1953,64 @@ class FinancialTool:
     def set_tariff(self, tariff):
         # set FinancialTool tariff value to the computed tariff
         self.cost_assumptions.loc[self.cost_assumptions["Description"] == "Community tariff", "USD/Unit"] = tariff
+
+
+FINANCIAL_TOOL_CACHE_TIMEOUT = 60 * 60
+# maximal time (s) a request waits for another request to build the same FinancialTool snapshot
+FINANCIAL_TOOL_LOCK_TIMEOUT = 30
+# cached properties computed before a FinancialTool snapshot is stored, they are used by most of the outputs
+FINANCIAL_TOOL_WARM_PROPERTIES = (
+    "capex",
+    "om_costs",
+    "om_costs_over_lifetime",
+    "replacement_loan_table",
+    "cost_assumption_tables",
+    "rounding_magnitude",
+)
+
+
+def financial_tool_cache_key(project):
+    """
+    Return the cache key of the FinancialTool snapshot of a project. The key contains the id of the simulation and a
+    version computed from the inputs of the financial tool (equity data, economic data, consumer groups and options),
+    a new snapshot is built as soon as one of them changes.
+    """
+    scenario = project.scenario
+    simulation = Simulation.objects.filter(scenario=scenario).values("id", "end_date").first() or {}
+    inputs = {
+        "simulation": simulation,
+        "start_date": scenario.start_date,
+        "capex_fix": scenario.capex_fix,
+        "equity_data": list(EquityData.objects.filter(scenario=scenario).values()),
+        "economic_data": list(EconomicData.objects.filter(project=project).values()),
+        "consumer_groups": list(
+            ConsumerGroup.objects.filter(project=project)
+            .order_by("id")
+            .values("id", "consumer_type_id", "timeseries_id", "number_consumers")
+        ),
+        "shs_threshold": list(Options.objects.filter(project=project).values_list("shs_threshold", flat=True)),
+    }
+    version = hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+    return f"financial_tool:{simulation.get('id')}:{version}"
+
+
+def build_financial_tool(project):
+    ft = FinancialTool(project)
+    for attr in FINANCIAL_TOOL_WARM_PROPERTIES:
+        getattr(ft, attr)
+    return ft
+
+
+def get_financial_tool(project):
+    """
+    Return a FinancialTool of the project, from its snapshot in the cache if the inputs did not change since it was
+    built. The outputs endpoints are requested simultaneously by the results page, only one of the requests builds the
+    snapshot while the others wait for it. Each call returns its own copy, so that the returned instance can be modified
+    (e.g. with remove_grant() or set_tariff()) without affecting the snapshot.
+    """
+    return get_or_set(
+        financial_tool_cache_key(project),
+        lambda: build_financial_tool(project),
+        timeout=FINANCIAL_TOOL_CACHE_TIMEOUT,
+        lock_timeout=FINANCIAL_TOOL_LOCK_TIMEOUT,
+    )
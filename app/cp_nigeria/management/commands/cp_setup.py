@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand
 from django.core.management import call_command
-from cp_nigeria.models import DemandTimeseries, Community, ConsumerType, ConsumerGroup
+from cp_nigeria.models import DemandTimeseries, Community, ConsumerType, ConsumerGroup, DemandAggregate
+from cp_nigeria.demand_profiles import refresh_profile_index
 from projects.models import Timeseries
 
 
@@ -24,5 +25,11 @@ class Command(BaseCommand):
         if qs.exists():
             qs.delete()
 
+        # the demand totals of the projects are summed again from the new profiles at their next update
+        DemandAggregate.objects.all().delete()
+
         call_command("loaddata", "fixtures/cp_data/all_demand_profiles.json")
         call_command("loaddata", "fixtures/cp_data/cp_setup.json")
+        # the fixtures are loaded without triggering the signals, the profiles are indexed here
+        n_profiles = refresh_profile_index()
+        self.stdout.write(f"Indexed {n_profiles} demand profiles")
@@ -0,0 +1,77 @@
+import json
+import time
+
+import pandas as pd
+from django.core.management.base import BaseCommand, CommandError
+
+from cp_nigeria.models import Community
+from cp_nigeria.pv_profiles import get_pv_profile, store_pv_profile
+from projects.services import RenewableNinjas
+
+
+def read_profiles_file(path, start):
+    """Read the PV output profiles of a file
+
+    * csv: the first column contains the timestamps, the others the profiles, named after the communities
+    * json: {community name: list of hourly values starting at start}
+
+    :return: dict {community name: Series of the profile}
+    """
+    if path.endswith(".json"):
+        with open(path) as fp:
+            data = json.load(fp)
+        return {
+            name: pd.Series(
+                values, index=pd.date_range(start, periods=len(values), freq=pd.Timedelta(hours=1)), dtype=float
+            )
+            for name, values in data.items()
+        }
+    df = pd.read_csv(path, index_col=0, parse_dates=True)
+    return {str(name): df[name].astype(float) for name in df.columns}
+
+
+class Command(BaseCommand):
+    help = "Store the PV output profiles of the communities in the PV profile cache from a local file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="csv or json file with the PV output of 1 kWp of the communities")
+        parser.add_argument(
+            "--start",
+            default=RenewableNinjas.pv_parameters["date_from"],
+            help="first timestamp of the hourly profiles of a json file",
+        )
+        parser.add_argument(
+            "--fetch",
+            action="store_true",
+            help="request the profiles of the communities missing from the file to renewables.ninja",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="number of seconds between two requests to renewables.ninja",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            profiles = read_profiles_file(options["path"], options["start"])
+        except (OSError, ValueError) as e:
+            raise CommandError(f"The profiles could not be read from {options['path']}: {e}")
+
+        n_stored = n_fetched = 0
+        missing = []
+        for community in Community.objects.filter(lat__isnull=False, lon__isnull=False).order_by("name"):
+            if community.name in profiles:
+                store_pv_profile(community.lat, community.lon, profiles[community.name], source=options["path"])
+                n_stored += 1
+            elif options["fetch"] is True:
+                if get_pv_profile(community.lat, community.lon, fetch=False) is None:
+                    get_pv_profile(community.lat, community.lon)
+                    n_fetched += 1
+                    time.sleep(options["interval"])
+            else:
+                missing.append(community.name)
+
+        self.stdout.write(f"Stored {n_stored} PV profiles from the file, fetched {n_fetched} from renewables.ninja")
+        if missing:
+            self.stdout.write(f"No profile was found for: {', '.join(missing)}")
@@ -0,0 +1,86 @@
+# Generated by Django 4.2.4 on 2026-10-19 14:04
+
+from django.db import migrations, models
+import django.db.models.deletion
+import numpy as np
+
+# copy of cp_nigeria.demand_profiles at the time of this migration, which must not depend on the current code
+KWH_FACTORS = {"Wh": 0.001, "kWh": 1}
+TIERS_BY_NAME = {
+    "Very Low Consumption Estimate": "very_low",
+    "National Average Consumption Estimate": "avg",
+    "Low Consumption Estimate": "low",
+    "Middle Consumption Estimate": "middle",
+    "High Consumption Estimate": "high",
+    "Very High Consumption Estimate": "very_high",
+}
+
+
+def profile_statistics(values, units):
+    if units not in KWH_FACTORS:
+        raise ValueError("Unsupported units")
+    profile = np.asarray(values, dtype=float) * KWH_FACTORS[units]
+    n_days = profile.size // 24
+    daily_shape = profile[: n_days * 24].reshape(n_days, 24).mean(axis=0) if n_days > 0 else np.zeros(24)
+    return dict(
+        annual_total=float(profile.sum()),
+        peak=float(profile.max()) if profile.size > 0 else 0.0,
+        daily_mean=float(profile.sum() / n_days) if n_days > 0 else float(profile.sum()),
+        daily_shape=daily_shape.tolist(),
+        first_week=profile[:168].tolist(),
+    )
+
+
+def index_demand_profiles(apps, schema_editor):
+    DemandTimeseries = apps.get_model("cp_nigeria", "DemandTimeseries")
+    DemandProfileSummary = apps.get_model("cp_nigeria", "DemandProfileSummary")
+    for timeseries in DemandTimeseries.objects.iterator(chunk_size=50):
+        try:
+            statistics = profile_statistics(timeseries.values, timeseries.units)
+        except ValueError:
+            continue
+        DemandProfileSummary.objects.create(
+            timeseries=timeseries,
+            name=timeseries.name,
+            consumer_type_id=timeseries.consumer_type_id,
+            tier=TIERS_BY_NAME.get(timeseries.name, ""),
+            **statistics,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cp_nigeria", "0013_options_demand_coverage_factor"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DemandProfileSummary",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(blank=True, default="", max_length=120)),
+                ("tier", models.CharField(blank=True, default="", max_length=20)),
+                ("annual_total", models.FloatField()),
+                ("peak", models.FloatField()),
+                ("daily_mean", models.FloatField()),
+                ("daily_shape", models.JSONField(default=list)),
+                ("first_week", models.JSONField(default=list)),
+                (
+                    "consumer_type",
+                    models.ForeignKey(
+                        null=True, on_delete=django.db.models.deletion.CASCADE, to="cp_nigeria.consumertype"
+                    ),
+                ),
+                (
+                    "timeseries",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="summary",
+                        to="cp_nigeria.demandtimeseries",
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(index_demand_profiles, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.4 on 2026-10-19 14:07
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0026_simulation_timings"),
+        ("cp_nigeria", "0014_demandprofilesummary"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DemandAggregate",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("category", models.CharField(max_length=20)),
+                ("contributions", models.JSONField(default=dict)),
+                ("values", models.JSONField(default=list)),
+                ("project", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to="projects.project")),
+            ],
+            options={
+                "unique_together": {("project", "category")},
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.4 on 2026-10-19 14:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cp_nigeria", "0015_demandaggregate"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PVProfile",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("lat", models.FloatField()),
+                ("lon", models.FloatField()),
+                ("parameters", models.CharField(max_length=16)),
+                ("start_time", models.DateTimeField()),
+                ("time_step", models.IntegerField(default=60)),
+                ("values", models.BinaryField()),
+                ("source", models.CharField(blank=True, default="", max_length=120)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "unique_together": {("lat", "lon", "parameters")},
+            },
+        ),
+    ]
@@ -31,6 +31,26 @@ class DemandTimeseries(Timeseries):
         return self.name
 
 
+class DemandProfileSummary(models.Model):
+    """Precomputed statistics of a DemandTimeseries (in kWh), see cp_nigeria.demand_profiles"""
+
+    timeseries = models.OneToOneField(DemandTimeseries, on_delete=models.CASCADE, related_name="summary")
+    name = models.CharField(max_length=120, blank=True, default="")
+    consumer_type = models.ForeignKey(ConsumerType, on_delete=models.CASCADE, null=True)
+    # code of the household tier (see cp_nigeria.helpers.HOUSEHOLD_TIERS) matching the name of the timeseries, if any
+    tier = models.CharField(max_length=20, blank=True, default="")
+    annual_total = models.FloatField()
+    peak = models.FloatField()
+    daily_mean = models.FloatField()
+    # mean value of each hour of the day over the profile
+    daily_shape = models.JSONField(default=list)
+    # values of the first week, displayed as preview of the profile
+    first_week = models.JSONField(default=list)
+
+    def __str__(self):
+        return self.name
+
+
 class CommunityManager(models.Manager):
     def get_by_natural_key(self, name):
         return self.get(name=name)
@@ -50,6 +70,25 @@ class Community(models.Model):
         return (self.name,)
 
 
+class PVProfile(models.Model):
+    """Hourly PV output of 1 kWp at a location, shared by the projects nearby (see cp_nigeria.pv_profiles)"""
+
+    # coordinates rounded to settings.PV_PROFILE_PRECISION decimals
+    lat = models.FloatField()
+    lon = models.FloatField()
+    # hash of the parameters of the PV system (see RenewableNinjas.pv_parameters)
+    parameters = models.CharField(max_length=16)
+    start_time = models.DateTimeField()
+    time_step = models.IntegerField(default=60)
+    # float32 values in the .npy format
+    values = models.BinaryField()
+    source = models.CharField(max_length=120, blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = [("lat", "lon", "parameters")]
+
+
 class ConsumerGroup(models.Model):
     project = models.ForeignKey(Project, on_delete=models.CASCADE, blank=True, null=True)
     consumer_type = models.ForeignKey(ConsumerType, on_delete=models.CASCADE, null=True)
@@ -60,6 +99,23 @@ class ConsumerGroup(models.Model):
     community = models.ForeignKey(Community, on_delete=models.CASCADE, null=True, blank=True)
 
 
+class DemandAggregate(models.Model):
+    """Running total of the demand (kWh) of the consumer groups of a project for one demand asset
+
+    See cp_nigeria.demand_aggregates
+    """
+
+    project = models.ForeignKey(Project, on_delete=models.CASCADE)
+    # "Household", "Enterprise" or "Public facility"
+    category = models.CharField(max_length=20)
+    # consumer groups included in the total: {group id: [timeseries id, number of consumers]}
+    contributions = models.JSONField(default=dict)
+    values = models.JSONField(default=list)
+
+    class Meta:
+        unique_together = [("project", "category")]
+
+
 class Options(models.Model):
     project = models.ForeignKey(Project, on_delete=models.CASCADE, blank=True, null=True)
     user_case = models.TextField(default="")
@@ -0,0 +1,93 @@
+"""Cache of the PV output profiles of the project locations
+
+The PV output of a project is requested to renewables.ninja for the coordinates of the project. Many projects are
+located in the same region and would request nearly identical profiles, so a profile is stored once in a PVProfile row,
+keyed by the coordinates rounded to PV_PROFILE_PRECISION decimals and by the parameters of the PV system, its hourly
+values being kept as a float32 array. The profiles of the communities can be loaded in bulk from a local file with the
+load_pv_profiles command, so that the API is not requested for them at all.
+"""
+
+import hashlib
+import io
+import json
+import logging
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+
+from cp_nigeria.models import PVProfile
+from projects.services import RenewableNinjas
+
+logger = logging.getLogger(__name__)
+
+RENEWABLES_NINJA = "renewables.ninja"
+
+
+def rounded_coordinates(lat, lon):
+    return round(float(lat), settings.PV_PROFILE_PRECISION), round(float(lon), settings.PV_PROFILE_PRECISION)
+
+
+def parameters_key(parameters=None):
+    """Return the hash of the parameters of a PV system, RenewableNinjas.pv_parameters by default"""
+    if parameters is None:
+        parameters = RenewableNinjas.pv_parameters
+    return hashlib.sha256(json.dumps(parameters, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def encode_values(values):
+    buffer = io.BytesIO()
+    np.save(buffer, np.asarray(values, dtype=np.float32), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def profile_series(profile):
+    """Return the values of a PVProfile as a Series indexed by their timestamps"""
+    values = np.load(io.BytesIO(bytes(profile.values)), allow_pickle=False).astype(float)
+    index = pd.date_range(profile.start_time, periods=values.size, freq=pd.Timedelta(minutes=profile.time_step))
+    return pd.Series(values, index=index, name="electricity")
+
+
+def store_pv_profile(lat, lon, series, source="", parameters=None):
+    """Store the profile of a location, replacing the existing one
+
+    :param series: Series of the PV output of 1 kWp, indexed by regular timestamps
+    """
+    lat, lon = rounded_coordinates(lat, lon)
+    if len(series.index) > 1:
+        time_step = int((series.index[1] - series.index[0]).total_seconds() // 60)
+    else:
+        time_step = 60
+    profile, _ = PVProfile.objects.update_or_create(
+        lat=lat,
+        lon=lon,
+        parameters=parameters_key(parameters),
+        defaults=dict(
+            start_time=series.index[0].to_pydatetime(),
+            time_step=time_step,
+            values=encode_values(series.values),
+            source=source,
+        ),
+    )
+    return profile
+
+
+def get_pv_profile(lat, lon, fetch=True):
+    """Return the PV output of 1 kWp at a location as a Series, from the cache or from renewables.ninja
+
+    :param fetch: if False, None is returned when the profile of the location is not cached
+    """
+    lat, lon = rounded_coordinates(lat, lon)
+    profile = PVProfile.objects.filter(lat=lat, lon=lon, parameters=parameters_key()).first()
+    if profile is not None:
+        return profile_series(profile)
+    if fetch is False:
+        return None
+
+    location = RenewableNinjas()
+    location.get_pv_output({"lat": lat, "lon": lon})
+    series = location.data.iloc[:, 0]
+    store_pv_profile(lat, lon, series, source=RENEWABLES_NINJA)
+    logger.info(f"The PV output profile at ({lat}, {lon}) was fetched from {RENEWABLES_NINJA}")
+    # return the values as they are read from the cache
+    return series.astype(np.float32).astype(float)
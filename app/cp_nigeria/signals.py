@@ -0,0 +1,22 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from cp_nigeria.models import DemandAggregate, DemandTimeseries
+
+
+@receiver(post_save, sender=DemandTimeseries)
+def update_demand_profile_summary(sender, instance, raw=False, **kwargs):
+    """Keep the summary of a demand profile up to date, fixtures (raw saves) are indexed by the cp_setup command"""
+    if raw is True:
+        return
+    from cp_nigeria.demand_profiles import update_profile_summary
+
+    update_profile_summary(instance)
+
+
+@receiver(post_save, sender=DemandTimeseries)
+def reset_demand_aggregates(sender, instance, raw=False, **kwargs):
+    """The running demand totals which include the saved profile are summed again at their next update"""
+    if raw is True:
+        return
+    DemandAggregate.objects.filter(project__consumergroup__timeseries=instance).delete()
@@ -0,0 +1,504 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+
+from business_model.models import EquityData
+from cp_nigeria.demand_aggregates import DEMAND_ASSETS, changed_group_fields, contribution_weights, update_demand_assets
+from cp_nigeria.demand_profiles import profile_statistics
+from cp_nigeria.factories import create_cpn_project, synthetic_mvs_response
+from cp_nigeria.helpers import (
+    FinancialTool,
+    compound_growth_matrix,
+    corporate_tax,
+    financial_tool_cache_key,
+    first_year_and_diff,
+    get_aggregated_demand,
+    get_financial_tool,
+)
+from cp_nigeria.models import (
+    Community,
+    ConsumerGroup,
+    ConsumerType,
+    DemandProfileSummary,
+    DemandTimeseries,
+    PVProfile,
+)
+from cp_nigeria.pv_profiles import get_pv_profile
+from dashboard.comparison import ScenarioComparison, table_row_values
+from dashboard.helpers import COSTS_PER_ASSETS, report_item_render_to_json
+from dashboard.models import FancyResults, FlowResults, KPIScalarResults, graph_capacities, graph_costs
+from dashboard.payloads import dumps
+from projects.constants import DONE, ERROR, PENDING
+from projects.models import Asset, AssetType, Simulation
+from projects.services import RenewableNinjas
+from users.models import CustomUser
+
+
+class CPNProjectMixin:
+    """Create a cp_nigeria project of one week with simulation results and without consumer groups"""
+
+    fixtures = ["fixtures/benchmarks_fixture.json"]
+
+    def setUp(self):
+        super().setUp()
+        self.user = CustomUser.objects.get(username="testUser")
+        self.project = create_cpn_project(self.user, 7, n_consumer_groups=0)
+        self.scenario = self.project.scenario
+        self.simulation = self.scenario.simulation
+
+
+class TestFinancialToolSnapshot(CPNProjectMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        super().setUp()
+        self.collect_system_params = mock.patch.object(
+            FinancialTool, "collect_system_params", autospec=True, side_effect=FinancialTool.collect_system_params
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_snapshot_is_built_once(self):
+        with self.collect_system_params as collect:
+            ft1 = get_financial_tool(self.project)
+            ft2 = get_financial_tool(self.project)
+        self.assertEqual(collect.call_count, 1)
+        self.assertIsNot(ft1, ft2)
+        self.assertEqual(ft1.total_capex, ft2.total_capex)
+
+    def test_modifying_a_copy_does_not_alter_the_snapshot(self):
+        ft = get_financial_tool(self.project)
+        ft.set_tariff(123.0)
+        ft.remove_grant()
+        snapshot = get_financial_tool(self.project)
+        self.assertNotEqual(snapshot.financial_params["grant_share"], 0.0)
+        tariff = snapshot.cost_assumptions.loc[snapshot.cost_assumptions["Description"] == "Community tariff"]
+        self.assertNotEqual(tariff["USD/Unit"].iloc[0], 123.0)
+        self.assertNotEqual(
+            FinancialTool.cost_assumptions.loc[FinancialTool.cost_assumptions["Description"] == "Community tariff"][
+                "USD/Unit"
+            ].iloc[0],
+            123.0,
+        )
+
+    def test_key_changes_with_inputs(self):
+        key = financial_tool_cache_key(self.project)
+        self.assertIn(f":{self.scenario.simulation.id}:", key)
+        self.assertEqual(key, financial_tool_cache_key(self.project))
+
+        EquityData.objects.filter(scenario=self.scenario).update(grant_share=0.3)
+        new_key = financial_tool_cache_key(self.project)
+        self.assertNotEqual(key, new_key)
+
+        economic_data = self.project.economic_data
+        economic_data.discount = 0.2
+        economic_data.save()
+        self.assertNotEqual(new_key, financial_tool_cache_key(self.project))
+
+    def test_combined_financial_outputs(self):
+        self.client.login(username="testUser", password="ASas12,.")
+        url = reverse("request_financial_outputs", args=[self.scenario.id])
+        with self.collect_system_params as collect:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            outputs = response.json()
+            cash_flow = self.client.get(reverse("scenario_visualize_cash_flow", args=[self.scenario.id])).json()
+        self.assertEqual(collect.call_count, 1)
+        self.assertEqual(
+            set(outputs),
+            {"cash_flow", "revenue", "system_costs", "capex", "opex", "system_size", "financial_kpis"},
+        )
+        self.assertEqual(outputs["cash_flow"], cash_flow)
+        self.assertIn("financial_kpi_table", outputs["financial_kpis"]["tables"])
+
+
+class TestLifetimeProjection(CPNProjectMixin, TestCase):
+    def test_array_core(self):
+        growth = compound_growth_matrix([100.0, 10.0], [0.1, 0.0], 3)
+        np.testing.assert_allclose(growth, [[100.0, 110.0, 121.0], [10.0, 10.0, 10.0]])
+        np.testing.assert_allclose(first_year_and_diff(growth), [[100.0, 10.0, 11.0], [10.0, 0.0, 0.0]])
+        np.testing.assert_allclose(corporate_tax(np.array([-10.0, 0.0, 100.0]), 0.3), [0.0, 0.0, 30.0])
+
+    def test_financial_tables(self):
+        ft = FinancialTool(self.project)
+        years = list(range(ft.project_start, ft.project_start + ft.project_duration))
+
+        losses = ft.losses_over_lifetime
+        self.assertEqual(losses.columns.tolist(), years)
+        expected_tax = np.where(losses.loc["EBT"] > 0, losses.loc["EBT"] * ft.financial_params["tax"], 0)
+        np.testing.assert_allclose(losses.loc["Corporate tax"], expected_tax)
+        np.testing.assert_allclose(losses.loc["Net income"], losses.loc["EBT"] - losses.loc["Corporate tax"])
+
+        cash_flow = ft.cash_flow_over_lifetime
+        np.testing.assert_allclose(
+            cash_flow.loc["Cash flow from operating activity"], losses.loc["EBITDA"] - losses.loc["Corporate tax"]
+        )
+        new_consumers = [ix for ix in ft.system_lifetime.index if ix.endswith("nr_consumers_new")]
+        for row in new_consumers:
+            self.assertEqual(
+                ft.system_lifetime.loc[row].sum(), ft.system_lifetime.loc[row.replace("_new", ""), years[-1]]
+            )
+
+
+class TestDemandProfileIndex(TestCase):
+    fixtures = ["fixtures/benchmarks_fixture.json"]
+
+    def test_profile_statistics(self):
+        values = np.tile(np.arange(24, dtype=float), 365) * 1000
+        statistics = profile_statistics(values, "Wh")
+        self.assertAlmostEqual(statistics["annual_total"], 276 * 365)
+        self.assertEqual(statistics["peak"], 23)
+        self.assertAlmostEqual(statistics["daily_mean"], 276)
+        self.assertEqual(statistics["daily_shape"], list(np.arange(24, dtype=float)))
+        self.assertEqual(len(statistics["first_week"]), 168)
+        with self.assertRaises(ValueError):
+            profile_statistics(values, "MW")
+
+    @unittest.skipUnless(connection.vendor == "postgresql", "demand timeseries need a PostgreSQL database")
+    def test_summary_is_updated_on_save(self):
+        consumer_type = ConsumerType.objects.create(consumer_type="households")
+        ts = DemandTimeseries.objects.create(
+            name="Low Consumption Estimate", values=[1000.0] * 48, units="Wh", consumer_type=consumer_type
+        )
+        self.assertEqual(ts.summary.tier, "low")
+        self.assertEqual(ts.summary.annual_total, 48)
+
+        ts.values = [2000.0] * 48
+        ts.save()
+        ts.summary.refresh_from_db()
+        self.assertEqual(ts.summary.annual_total, 96)
+
+        self.client.login(username="testUser", password="ASas12,.")
+        response = self.client.post(
+            reverse("ajax_update_graph"), {"timeseries": ts.id}, HTTP_X_REQUESTED_WITH="XMLHttpRequest"
+        )
+        self.assertEqual(response.json()["timeseries_values"], [2.0] * 48)
+
+    @unittest.skipUnless(connection.vendor == "postgresql", "demand timeseries need a PostgreSQL database")
+    def test_dropdown_lists_the_profiles_without_summary(self):
+        project = create_cpn_project(CustomUser.objects.get(username="testUser"), 7, n_consumer_groups=1)
+        consumer_type = ConsumerType.objects.get(consumer_type="Enterprise")
+        ts = DemandTimeseries.objects.get(name="Enterprise_0")
+        DemandProfileSummary.objects.filter(timeseries=ts).delete()
+
+        self.client.login(username="testUser", password="ASas12,.")
+        response = self.client.get(
+            reverse("ajax_load_timeseries", args=[project.id]),
+            {"consumer_type": consumer_type.id},
+            HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+        )
+        self.assertContains(response, f'<option value="{ts.id}">{ts.name}</option>')
+
+
+class TestDemandAggregates(TestCase):
+    fixtures = ["fixtures/benchmarks_fixture.json"]
+
+    def test_contribution_weights(self):
+        old = {"1": [10, 5], "2": [11, 3], "3": [12, 2]}
+        new = {"1": [10, 5], "2": [11, 4], "4": [12, 2], "5": [13, 1]}
+        # group 3 is replaced by group 4 with the same profile and number of consumers
+        self.assertEqual(contribution_weights(old, new), {11: 1, 13: 1})
+        self.assertEqual(contribution_weights(old, {}), {10: -5, 11: -3, 12: -2})
+        self.assertEqual(contribution_weights(old, old), {})
+
+    def test_changed_group_fields(self):
+        consumer_type = ConsumerType.objects.create(consumer_type="households")
+        group = ConsumerGroup(consumer_type=consumer_type, timeseries_id=3, number_consumers=10)
+        cleaned_data = dict(
+            id=group,
+            consumer_type=consumer_type,
+            timeseries=None,
+            number_consumers=12,
+            expected_consumer_increase=None,
+            expected_demand_increase=None,
+            DELETE=False,
+        )
+        self.assertEqual(changed_group_fields(group, cleaned_data), ["timeseries", "number_consumers"])
+
+    @unittest.skipUnless(connection.vendor == "postgresql", "demand timeseries need a PostgreSQL database")
+    def test_only_changed_demands_are_updated(self):
+        project = create_cpn_project(CustomUser.objects.get(username="testUser"), 7, n_consumer_groups=2)
+        asset_type = AssetType.objects.get(asset_type="reducable_demand")
+        for name in DEMAND_ASSETS:
+            Asset.objects.create(name=name, scenario=project.scenario, asset_type=asset_type, input_timeseries="[]")
+
+        self.assertEqual(update_demand_assets(project), set(DEMAND_ASSETS))
+        self.assertEqual(update_demand_assets(project), set())
+
+        group = ConsumerGroup.objects.filter(project=project, consumer_type__consumer_type="Household").first()
+        group.number_consumers += 5
+        group.save()
+        self.assertEqual(update_demand_assets(project), {"electricity_demand_hh"})
+        demand = Asset.objects.get(scenario=project.scenario, name="electricity_demand_hh")
+        np.testing.assert_allclose(
+            json.loads(demand.input_timeseries), get_aggregated_demand(project, consumer_type="Household")
+        )
+
+        ConsumerGroup.objects.filter(project=project).delete()
+        self.assertEqual(update_demand_assets(project), set(DEMAND_ASSETS))
+        demand.refresh_from_db()
+        self.assertEqual(demand.input_timeseries, "[]")
+
+
+class TestScenarioComparison(CPNProjectMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.projects = [self.project] + [create_cpn_project(self.user, 7, n_consumer_groups=0) for _ in range(2)]
+        self.simulations = [project.scenario.simulation for project in self.projects]
+        # make the second scenario cheaper than the others
+        kpis = KPIScalarResults.objects.get(simulation=self.simulations[1])
+        scalars = json.loads(kpis.scalar_values)
+        scalars["levelized_costs_of_electricity_equivalent"] = 0.01
+        kpis.scalar_values = json.dumps(scalars)
+        kpis.save()
+
+    def test_tables_are_aligned_on_the_simulations(self):
+        comparison = ScenarioComparison(reversed(self.simulations))
+        sim_ids = [simulation.id for simulation in reversed(self.simulations)]
+        self.assertEqual(comparison.simulation_ids, sim_ids)
+        self.assertEqual(
+            comparison.scenario_names, [simulation.scenario.name for simulation in reversed(self.simulations)]
+        )
+        for table in (
+            comparison.kpis,
+            comparison.installed_capacities,
+            comparison.optimized_capacities,
+            comparison.flows,
+        ):
+            self.assertEqual(list(table.columns), sim_ids)
+            self.assertGreater(len(table), 0)
+        self.assertEqual(comparison.flows.index.names, ["bus", "asset", "direction"])
+
+    def test_number_of_queries_does_not_depend_on_the_number_of_simulations(self):
+        def load(simulations):
+            comparison = ScenarioComparison(simulations)
+            for table in (comparison.kpis, comparison.installed_capacities, comparison.optimized_capacities):
+                comparison.rankings(comparison.deltas(table))
+            comparison.flows
+
+        with self.assertNumQueries(4):
+            load(self.simulations[:1])
+        with self.assertNumQueries(4):
+            load(self.simulations)
+
+    def test_deltas_and_rankings(self):
+        comparison = ScenarioComparison.from_scenarios([simulation.scenario.id for simulation in self.simulations])
+        lcoe = "levelized_costs_of_electricity_equivalent"
+        deltas = comparison.deltas(comparison.kpis)
+        np.testing.assert_allclose(deltas.iloc[:, 0], 0)
+        self.assertAlmostEqual(deltas.loc[lcoe].iloc[1], 0.01 - comparison.kpis.loc[lcoe].iloc[0])
+        self.assertEqual(table_row_values(comparison.rankings(comparison.kpis), lcoe, decimals=None)[1], 1)
+        self.assertEqual(table_row_values(deltas, "not a kpi"), [None, None, None])
+        reference = comparison.simulation_ids[1]
+        np.testing.assert_allclose(comparison.relative_deltas(comparison.kpis, reference=reference)[reference], 0)
+
+    def test_capacities_and_costs_graphs_of_several_scenarios(self):
+        with self.assertNumQueries(3):
+            capacities = graph_capacities(self.simulations, None)
+        with self.assertNumQueries(4):
+            costs = graph_costs(self.simulations, None, arrangement=COSTS_PER_ASSETS)
+        self.assertEqual(len(capacities), 3)
+        self.assertEqual(len(costs), 3)
+        self.assertEqual(
+            [graph["scenario_name"] for graph in costs], [simulation.scenario.name for simulation in self.simulations]
+        )
+        # the costs of one simulation are the same computed alone or with others
+        single = graph_costs(self.simulations[:1], None, arrangement=COSTS_PER_ASSETS)[0]
+        self.assertEqual(single["timestamps"], costs[0]["timestamps"])
+        self.assertEqual(single["timeseries"][0]["value"], costs[0]["timeseries"][0]["value"])
+        self.assertIn("pv_plant", capacities[0]["timestamps"])
+
+    def test_kpi_table_of_several_scenarios(self):
+        self.client.force_login(self.user)
+        proj_id = str(self.projects[0].id)
+        session = self.client.session
+        session["selected_scenarios"] = {proj_id: [str(simulation.scenario.id) for simulation in self.simulations]}
+        session.save()
+        response = self.client.get(reverse("request_kpi_table", args=[proj_id]), {"compare_scenario": ""})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(data["hdrs"]), 4)
+        param = next(param for params in data["data"].values() for param in params)
+        self.assertEqual(len(param["scen_values"]), 3)
+        self.assertEqual(len(param["scen_deltas"]), 3)
+        self.assertEqual(len(param["scen_relative_deltas"]), 3)
+        self.assertEqual(len(param["scen_ranks"]), 3)
+
+
+class TestSimulationReview(CPNProjectMixin, TestCase):
+    def test_force_rerun_is_offered_for_each_status(self):
+        self.client.force_login(self.user)
+        force_rerun_url = reverse("cpn_simulation_request", args=[self.project.id]) + "?force_rerun=on"
+        for status in (DONE, ERROR, PENDING):
+            Simulation.objects.filter(pk=self.simulation.pk).update(status=status)
+            with mock.patch("cp_nigeria.views.poll_simulation_status"):
+                response = self.client.get(reverse("cpn_review", args=[self.project.id]))
+            self.assertContains(response, force_rerun_url, msg_prefix=status)
+
+
+class TestCompactTimeAxis(CPNProjectMixin, TestCase):
+    def test_timeseries_graph_with_compact_time_axis(self):
+        self.client.login(username="testUser", password="ASas12,.")
+        project = self.project
+        url = reverse("scenario_visualize_timeseries", args=[project.id, project.scenario.id])
+        full = self.client.get(url).json()["data"][0]
+        compact = self.client.get(url, {"time_axis": "compact"}).json()["data"][0]
+        self.assertEqual(len(full["timestamps"]), 7 * 24)
+        self.assertEqual(compact["timestamps"], [])
+        self.assertEqual(compact["time_axis"], project.scenario.get_timestamps(compact=True))
+        self.assertEqual(compact["time_axis"]["count"], 7 * 24)
+        self.assertEqual(compact["timeseries"], full["timeseries"])
+
+
+class TestGraphPayloads(CPNProjectMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        super().setUp()
+        self.client.login(username="testUser", password="ASas12,.")
+        self.url = reverse("scenario_visualize_timeseries", args=[self.project.id, self.project.scenario.id])
+        self.render = mock.patch("dashboard.views.report_item_render_to_json", side_effect=report_item_render_to_json)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_payload_is_built_once_and_revalidated(self):
+        with self.render as render:
+            identity = self.client.get(self.url)
+            compressed = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+            not_modified = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=compressed["ETag"])
+        self.assertEqual(render.call_count, 1)
+        self.assertFalse(identity.has_header("Content-Encoding"))
+        self.assertEqual(compressed["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(compressed.content)), identity.json())
+        self.assertNotEqual(identity["ETag"], compressed["ETag"])
+        self.assertIn("Accept-Encoding", compressed["Vary"])
+        self.assertIn("private", compressed["Cache-Control"])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b"")
+
+    def test_payload_is_rebuilt_for_new_results(self):
+        with self.render as render:
+            etag = self.client.get(self.url)["ETag"]
+            simulation = self.project.scenario.simulation
+            simulation.end_date = datetime.now()
+            simulation.save()
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(render.call_count, 2)
+        # the ETag is computed from the content, which did not change
+        self.assertEqual(response.status_code, 304)
+
+    def test_pending_simulations_are_not_cached(self):
+        Simulation.objects.filter(scenario=self.project.scenario).update(status=PENDING)
+        with self.render as render:
+            response = self.client.get(self.url)
+            self.client.get(self.url)
+        self.assertEqual(render.call_count, 2)
+        self.assertFalse(response.has_header("ETag"))
+        self.assertIn("no-store", response["Cache-Control"])
+
+    def test_numpy_values_are_serialized(self):
+        data = {"values": np.array([1.5, np.nan]), "total": np.float32(2), 1: np.int64(3)}
+        self.assertEqual(json.loads(dumps(data)), {"values": [1.5, None], "total": 2.0, "1": 3})
+
+
+class TestBusBalance(CPNProjectMixin, TestCase):
+    def test_balance_is_materialized_at_ingestion(self):
+        flow_results = FlowResults.objects.get(simulation=self.simulation)
+        self.assertEqual(flow_results.flow_data, "")
+        self.assertEqual(flow_results.busses, {"ac_bus": "Electricity", "dc_bus": "Electricity", "fuel_bus": "Gas"})
+
+        df = flow_results.single_bus_flows("dc_bus")
+        self.assertEqual(df.energy_vector, "Electricity")
+        self.assertEqual(
+            df.columns.tolist(), [("in", "battery"), ("in", "pv_plant"), ("out", "battery"), ("out", "inverter")]
+        )
+        self.assertEqual(len(df.index), 7 * 24)
+        inverter = FancyResults.objects.get(simulation=self.simulation, bus="dc_bus", asset="inverter")
+        np.testing.assert_allclose(df[("out", "inverter")].values, -np.array(json.loads(inverter.flow_data)))
+
+        self.assertNotIn("ac_bus_excess", flow_results.all_flows().columns)
+        self.assertEqual(
+            flow_results.all_flows(asset_list=["battery"]).columns.tolist(), ["battery discharge", "battery charge"]
+        )
+        self.assertEqual(
+            flow_results.energy_sector_flows("Gas").columns.tolist(), ["diesel_fuel", "diesel_generator (inflow)"]
+        )
+        self.assertEqual(flow_results.asset_optimized_capacity("pv_plant"), 90.0)
+
+    def test_balance_of_former_results_is_materialized_once(self):
+        raw_results = json.loads(synthetic_mvs_response(24))["raw_results"]
+        FlowResults.objects.filter(simulation=self.simulation).update(flow_data=raw_results, bus_balance=None)
+        flows = FlowResults.objects.get(simulation=self.simulation).all_flows(include_hidden_assets=True)
+        self.assertIsNotNone(FlowResults.objects.get(simulation=self.simulation).bus_balance)
+        self.assertEqual(flows.shape, (24, 12))
+
+
+class TestPVProfiles(TestCase):
+    def setUp(self):
+        index = pd.date_range("2019-01-01", "2019-12-31 23:00", freq=pd.Timedelta(hours=1))
+        self.pv_data = pd.DataFrame(
+            {"electricity": (index.hour.isin(range(7, 18)) * 0.5 + index.month / 100)}, index=index
+        )
+
+    def fake_get_pv_output(self, location, coordinates):
+        location.data = self.pv_data
+
+    def test_profile_is_fetched_once_per_region(self):
+        with mock.patch.object(
+            RenewableNinjas, "get_pv_output", autospec=True, side_effect=self.fake_get_pv_output
+        ) as fetch:
+            fetched = get_pv_profile(9.061, 7.489)
+            cached = get_pv_profile(9.07, 7.51)
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(fetch.call_args.args[1], {"lat": 9.1, "lon": 7.5})
+        pd.testing.assert_series_equal(fetched, cached, check_freq=False)
+        np.testing.assert_allclose(cached.values, self.pv_data["electricity"].values, rtol=1e-6)
+        self.assertEqual(cached.index[-1], pd.Timestamp("2019-12-31 23:00"))
+        self.assertIsNone(get_pv_profile(6.5, 3.4, fetch=False))
+
+    def test_renewables_ninja_answer_is_parsed(self):
+        data = RenewableNinjas.parse_pv_data(
+            {"1546300800000": {"electricity": 0.0}, "1546304400000": {"electricity": 0.2}}
+        )
+        self.assertEqual(data.index.tolist(), [pd.Timestamp("2019-01-01 00:00"), pd.Timestamp("2019-01-01 01:00")])
+        self.assertEqual(data["electricity"].tolist(), [0.0, 0.2])
+
+    def test_pv_graph_averages(self):
+        location = RenewableNinjas()
+        location.data = self.pv_data
+        with mock.patch("projects.services.plot") as plot:
+            location.create_pv_graph()
+            location.create_pv_graph(freq="MS")
+        daily, monthly = (call.args[0][0] for call in plot.call_args_list)
+        self.assertEqual(len(daily.y), 365)
+        self.assertAlmostEqual(daily.y[0], 11 * 0.5 / 24 + 0.01)
+        np.testing.assert_allclose(monthly.y, 11 * 0.5 / 24 + np.arange(1, 13) / 100)
+
+    def test_load_pv_profiles_command(self):
+        Community.objects.create(name="Ezere", lat=6.123, lon=7.456)
+        Community.objects.create(name="Usungwe", lat=8.5, lon=8.0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profiles.json")
+            with open(path, "w") as fp:
+                json.dump({"Ezere": self.pv_data["electricity"].tolist()}, fp)
+            out = io.StringIO()
+            call_command("load_pv_profiles", path, stdout=out)
+        self.assertIn("Stored 1 PV profiles", out.getvalue())
+        self.assertIn("No profile was found for: Usungwe", out.getvalue())
+        self.assertEqual(PVProfile.objects.get().source, path)
+        profile = get_pv_profile(6.1, 7.5, fetch=False)
+        self.assertEqual(profile.index[0], pd.Timestamp("2019-01-01"))
+        np.testing.assert_allclose(profile.values, self.pv_data["electricity"].values, rtol=1e-6)
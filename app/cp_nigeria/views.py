@@ -7,6 +7,7 @@ import pandas as pd
 import os
 import base64
 import re
+import time
 from django.http import JsonResponse
 from jsonview.decorators import json_view
 from django.utils.translation import gettext_lazy as _
@@ -20,19 +21,30 @@ from epa.settings import MVS_GET_URL, MVS_LP_FILE_URL
 from .forms import *
 from .helpers import *
 from business_model.forms import *
-from projects.requests import fetch_mvs_simulation_results
+from projects.exchange_rates import latest_exchange_rate
+from projects.simulation_status import poll_simulation_status
 from projects.models import *
 from projects.views import project_duplicate, project_delete
 from business_model.models import *
 from cp_nigeria.models import ConsumerGroup
+from cp_nigeria.demand_aggregates import (
+    DEMAND_ASSETS,
+    changed_group_fields,
+    update_demand_aggregates,
+    update_demand_assets,
+)
+from cp_nigeria.demand_profiles import get_profile_summary
 from cp_nigeria.helpers import ReportHandler
 from projects.forms import UploadFileForm, ProjectShareForm, ProjectRevokeForm, UseCaseForm
-from projects.services import RenewableNinjas
+from cp_nigeria.pv_profiles import get_pv_profile
+from projects.permissions import project_rights_required, get_project_permissions, EDIT
+from projects.metrics import record_first_render
 from projects.constants import DONE, PENDING, ERROR
 from projects.views import request_mvs_simulation, simulation_cancel
 from business_model.helpers import B_MODELS
 from dashboard.models import KPIScalarResults, KPICostsMatrixResults, FancyResults
-from dashboard.helpers import KPI_PARAMETERS
+from dashboard.helpers import KPI_PARAMETERS, fetch_user_projects_page
+from dashboard.payloads import graph_payload_response, json_payload_response
 
 logger = logging.getLogger(__name__)
 
@@ -71,11 +83,9 @@ def home_cpn(request):
 @login_required
 @require_http_methods(["GET"])
 def projects_list_cpn(request, proj_id=None):
-    combined_projects_list = (
-        Project.objects.filter(Q(user=request.user) | Q(viewers__user__email=request.user.email))
-        .distinct()
-        .order_by("date_created")
-        .reverse()
+    search = request.GET.get("q", "").strip()
+    combined_projects_list, next_cursor = fetch_user_projects_page(
+        request.user, search=search, cursor=request.GET.get("after", None)
     )
     # combined_projects_list = Project.objects.filter(
     #     (Q(user=request.user) | Q(viewers__user=request.user)) & Q(country="NIGERIA")
@@ -92,6 +102,8 @@ def projects_list_cpn(request, proj_id=None):
         "cp_nigeria/project_display.html",
         {
             "project_list": combined_projects_list,
+            "next_cursor": next_cursor,
+            "search": search,
             "proj_id": proj_id,
             "scenario_upload_form": scenario_upload_form,
             "project_upload_form": project_upload_form,
@@ -145,15 +157,11 @@ def cpn_project_duplicate(request, proj_id):
 
 @login_required
 @require_http_methods(["GET", "POST"])
+@project_rights_required(EDIT)
 def cpn_grid_conditions(request, proj_id, scen_id, step_id=STEP_MAPPING["grid_conditions"]):
     # TODO in the future, pre-load the questions instead of written out in the template
     project = get_object_or_404(Project, id=proj_id)
 
-    if (project.user != request.user) and (
-        project.viewers.filter(user__email=request.user.email, share_rights="edit").exists() is False
-    ):
-        raise PermissionDenied
-
     page_information = "Please include information about your connection to the grid."
 
     bm_qs = BusinessModel.objects.filter(scenario=project.scenario)
@@ -185,9 +193,7 @@ def cpn_scenario_create(request, proj_id=None, step_id=STEP_MAPPING["choose_loca
     proj_name = ""
     if qs_project.exists():
         project = qs_project.get()
-        if (project.user != request.user) and (
-            project.viewers.filter(user__email=request.user.email, share_rights="edit").exists() is False
-        ):
+        if not get_project_permissions(request.user).can_edit(project.id):
             raise PermissionDenied
 
     else:
@@ -257,14 +263,10 @@ def cpn_scenario_create(request, proj_id=None, step_id=STEP_MAPPING["choose_loca
 
 @login_required
 @require_http_methods(["GET", "POST"])
+@project_rights_required(EDIT)
 def cpn_demand_params(request, proj_id, step_id=STEP_MAPPING["demand_profile"]):
     project = get_object_or_404(Project, id=proj_id)
 
-    if (project.user != request.user) and (
-        project.viewers.filter(user__email=request.user.email, share_rights="edit").exists() is False
-    ):
-        raise PermissionDenied
-
     options = get_object_or_404(Options, project=project)
 
     # TODO change DB default value to 1
@@ -303,42 +305,43 @@ def cpn_demand_params(request, proj_id, step_id=STEP_MAPPING["demand_profile"]):
                     consumer_type_id = int(form.data.get(f"{form.prefix}-consumer_type"))
                     form.fields["timeseries"].queryset = DemandTimeseries.objects.filter(
                         consumer_type_id=consumer_type_id
-                    )
+                    ).defer("values")
                 except (ValueError, TypeError):
                     pass
 
         if formset.is_valid():
+            to_create = []
+            to_update = []
+            to_delete = []
+            updated_fields = set()
             for form in formset:
                 # update consumer group if already in database and create new entry if not
                 if len(form.cleaned_data) == 0:
                     continue
-                try:
-                    group_id = form.cleaned_data["id"].id
-                    consumer_group = ConsumerGroup.objects.get(id=group_id)
-                    if form.cleaned_data["DELETE"] is True:
-                        consumer_group.delete()
-                    else:
-                        for field_name, field_value in form.cleaned_data.items():
-                            if field_name == "id":
-                                continue
-                            setattr(consumer_group, field_name, field_value)
-                            consumer_group.save()
-
-                # AttributeError gets thrown when form id field is empty -> not yet in db
-                except AttributeError:
-                    if form.cleaned_data["DELETE"] is True:
-                        continue
-
-                    consumer_group = form.save(commit=False)
-                    consumer_group.project = project
-                    consumer_group.save()
-
-            # update demand if exists
-            if qs_demand.exists():
-                for demand, cg_type in zip(qs_demand.order_by("name"), ("Enterprise", "Household", "Public facility")):
-                    total_demand = get_aggregated_demand(project, consumer_type=cg_type)
-                    demand.input_timeseries = json.dumps(total_demand)
-                    demand.save()
+                consumer_group = form.cleaned_data.get("id")
+                if consumer_group is None:
+                    if form.cleaned_data["DELETE"] is False:
+                        consumer_group = form.save(commit=False)
+                        consumer_group.project = project
+                        to_create.append(consumer_group)
+                elif form.cleaned_data["DELETE"] is True:
+                    to_delete.append(consumer_group.id)
+                else:
+                    # only the consumer groups which were modified are written to the database
+                    changed_fields = changed_group_fields(consumer_group, form.cleaned_data)
+                    for field_name in changed_fields:
+                        setattr(consumer_group, field_name, form.cleaned_data[field_name])
+                    if changed_fields:
+                        to_update.append(consumer_group)
+                        updated_fields.update(changed_fields)
+
+            with transaction.atomic():
+                ConsumerGroup.objects.filter(project=project, id__in=to_delete).delete()
+                if to_update:
+                    ConsumerGroup.objects.bulk_update(to_update, sorted(updated_fields))
+                ConsumerGroup.objects.bulk_create(to_create)
+                # update demand if exists, only the demand assets whose total changed are written
+                update_demand_assets(project)
 
             step_id = STEP_MAPPING["demand_profile"] + 1
             return HttpResponseRedirect(reverse("cpn_steps", args=[proj_id, step_id]))
@@ -374,7 +377,9 @@ def cpn_demand_params(request, proj_id, step_id=STEP_MAPPING["demand_profile"]):
                     form[field].initial = getattr(obj, field)
                 if field == "timeseries":
                     consumer_type_id = getattr(obj, "consumer_type").id
-                    form.fields[field].queryset = DemandTimeseries.objects.filter(consumer_type_id=consumer_type_id)
+                    form.fields[field].queryset = DemandTimeseries.objects.filter(
+                        consumer_type_id=consumer_type_id
+                    ).defer("values")
 
     page_information = "Please input user group data. This includes user type information about households, enterprises and facilities and predicted energy demand tiers as collected from survey data or available information about the community."
     household_tiers = json.dumps([tier[1] for tier in HOUSEHOLD_TIERS])
@@ -398,14 +403,10 @@ def cpn_demand_params(request, proj_id, step_id=STEP_MAPPING["demand_profile"]):
 
 @login_required
 @require_http_methods(["GET", "POST"])
+@project_rights_required(EDIT)
 def cpn_scenario(request, proj_id, step_id=STEP_MAPPING["scenario_setup"]):
     project = get_object_or_404(Project, id=proj_id)
 
-    if (project.user != request.user) and (
-        project.viewers.filter(user__email=request.user.email, share_rights="edit").exists() is False
-    ):
-        raise PermissionDenied
-
     scenario = project.scenario
 
     if request.method == "GET":
@@ -566,9 +567,11 @@ def cpn_scenario(request, proj_id, step_id=STEP_MAPPING["scenario_setup"]):
         demand_ent.save()
         demand_pf.save()
         if created is True:
-            for dem, cg_type in zip((demand_ent, demand_hh, demand_pf), ("Enterprise", "Household", "Public facility")):
-                total_demand = get_aggregated_demand(project, consumer_type=cg_type)
-                dem.input_timeseries = json.dumps(total_demand)
+            # the running totals of the consumer groups are up to date after the demand step
+            totals, _ = update_demand_aggregates(project)
+            has_groups = ConsumerGroup.objects.filter(project=project).exists()
+            for dem in (demand_ent, demand_hh, demand_pf):
+                dem.input_timeseries = json.dumps(totals[DEMAND_ASSETS[dem.name]] if has_groups else [])
                 dem.save()
 
         peak_demand = (
@@ -863,14 +866,10 @@ def cpn_scenario(request, proj_id, step_id=STEP_MAPPING["scenario_setup"]):
 
 @login_required
 @require_http_methods(["GET", "POST"])
+@project_rights_required(EDIT)
 def cpn_constraints(request, proj_id, step_id=STEP_MAPPING["economic_params"]):
     project = get_object_or_404(Project, id=proj_id)
 
-    if (project.user != request.user) and (
-        project.viewers.filter(user__email=request.user.email, share_rights="edit").exists() is False
-    ):
-        raise PermissionDenied
-
     scenario = project.scenario
     page_information = (
         "Please review the following values which are suggested for tariff evaluations based on the model you chose."
@@ -1013,14 +1012,10 @@ def cpn_constraints(request, proj_id, step_id=STEP_MAPPING["economic_params"]):
 
 @login_required
 @require_http_methods(["GET", "POST"])
+@project_rights_required(EDIT)
 def cpn_review(request, proj_id, step_id=STEP_MAPPING["simulation"]):
     project = get_object_or_404(Project, id=proj_id)
 
-    if (project.user != request.user) and (
-        project.viewers.filter(user__email=request.user.email, share_rights="edit").exists() is False
-    ):
-        raise PermissionDenied
-
     if request.method == "GET":
         html_template = "cp_nigeria/steps/simulation/no-status.html"
         context = {
@@ -1040,7 +1035,7 @@ def cpn_review(request, proj_id, step_id=STEP_MAPPING["simulation"]):
             simulation = qs.first()
 
             if simulation.status == PENDING:
-                fetch_mvs_simulation_results(simulation)
+                poll_simulation_status(simulation)
 
             context.update(
                 {
@@ -1069,13 +1064,10 @@ def cpn_review(request, proj_id, step_id=STEP_MAPPING["simulation"]):
 
 @login_required
 @require_http_methods(["GET", "POST"])
+@project_rights_required(EDIT)
 def cpn_model_choice(request, proj_id, step_id=STEP_MAPPING["business_model"]):
     project = get_object_or_404(Project, id=proj_id)
 
-    if (project.user != request.user) and (
-        project.viewers.filter(user__email=request.user.email, share_rights="edit").exists() is False
-    ):
-        raise PermissionDenied
     context = {
         "scenario": project.scenario,
         "scen_id": project.scenario.id,
@@ -1129,17 +1121,15 @@ def cpn_complex_outputs(request, proj_id, step_id=STEP_MAPPING["outputs"]):
 
 @login_required
 @require_http_methods(["GET", "POST"])
+@project_rights_required(EDIT)
 def cpn_outputs(request, proj_id, step_id=STEP_MAPPING["outputs"], complex=False):
+    render_start = time.perf_counter()
     project = get_object_or_404(Project, id=proj_id)
     options = get_object_or_404(Options, project=project)
     report_obj, created = ImplementationPlanContent.objects.get_or_create(simulation=project.scenario.simulation)
     # saves the graphs and tables to the database if there are empty fields (report_obj.empty_fields is True)
     save_to_db = report_obj.empty_fields
 
-    if (project.user != request.user) and (
-        project.viewers.filter(user__email=request.user.email, share_rights="edit").exists() is False
-    ):
-        raise PermissionDenied
     user_scenarios = [project.scenario]
 
     bm = BusinessModel.objects.get(scenario__project=project)
@@ -1154,7 +1144,7 @@ def cpn_outputs(request, proj_id, step_id=STEP_MAPPING["outputs"], complex=False
     else:
         es_schema_name = None
 
-    ft = FinancialTool(project)
+    ft = get_financial_tool(project)
     tariff = ft.calculate_tariff()
 
     ed = EquityData.objects.get(scenario=project.scenario)
@@ -1272,7 +1262,9 @@ def cpn_outputs(request, proj_id, step_id=STEP_MAPPING["outputs"], complex=False
                 "system_costs": system_costs,
             }
         )
-    return render(request, html_template, context)
+    response = render(request, html_template, context)
+    record_first_render(project.scenario.simulation, render_start)
+    return response
 
 
 # TODO for later create those views instead of simply serving the html templates
@@ -1328,14 +1320,12 @@ def cpn_simulation_request(request, proj_id=0):
 
 def get_pv_output(proj_id):
     project = Project.objects.get(id=proj_id)
-    coordinates = {"lat": project.latitude, "lon": project.longitude}
-    location = RenewableNinjas()
-    location.get_pv_output(coordinates)
+    pv_output = get_pv_profile(project.latitude, project.longitude)
     pv_ts, _ = Timeseries.objects.get_or_create(scenario=project.scenario, open_source=True, ts_type="source")
 
-    pv_ts.values = np.squeeze(location.data.values).tolist()
-    pv_ts.start_time = location.data.index[0]
-    pv_ts.end_time = location.data.index[-1]
+    pv_ts.values = pv_output.values.tolist()
+    pv_ts.start_time = pv_output.index[0]
+    pv_ts.end_time = pv_output.index[-1]
     pv_ts.time_step = 60
     pv_ts.save()
 
@@ -1363,7 +1353,7 @@ def get_exchange_rate(request):
     if currency == "":
         data = {"exchange_rate": ""}
     else:
-        exchange_rate = request_exchange_rate(currency)
+        exchange_rate = latest_exchange_rate(currency)
         data = {"exchange_rate": exchange_rate}
     return JsonResponse(data)
 
@@ -1415,10 +1405,10 @@ def ajax_load_timeseries(request, proj_id):
         options = Options.objects.get(project__id=proj_id)
         consumer_type_id = int(request.GET.get("consumer_type"))
         # only offer the national average load profile for households if not using one of the pre-loaded CPs
+        # the options only need the names of the profiles, not their values
+        timeseries_qs = DemandTimeseries.objects.filter(consumer_type_id=consumer_type_id).defer("values")
         if options.community is None and consumer_type_id == 1:
-            timeseries_qs = DemandTimeseries.objects.filter(consumer_type_id=consumer_type_id, name__contains="Average")
-        else:
-            timeseries_qs = DemandTimeseries.objects.filter(consumer_type_id=consumer_type_id)
+            timeseries_qs = timeseries_qs.filter(name__contains="Average")
 
         return render(
             request, "cp_nigeria/steps/timeseries_dropdown_options.html", context={"timeseries_qs": timeseries_qs}
@@ -1432,10 +1422,9 @@ def ajax_load_timeseries(request, proj_id):
 def ajax_update_graph(request):
     if request.headers.get("x-requested-with") == "XMLHttpRequest":
         timeseries_id = request.POST.get("timeseries")
-        timeseries = DemandTimeseries.objects.get(id=timeseries_id)
-        timeseries_values = timeseries.get_values_with_unit("kWh")[:168]
+        timeseries_values = get_profile_summary(timeseries_id).first_week
 
-        return JsonResponse({"timeseries_values": timeseries_values})
+        return json_payload_response(request, {"timeseries_values": timeseries_values})
 
     return JsonResponse({"error": request})
 
@@ -1456,73 +1445,77 @@ def ajax_shs_tiers(request):
 @login_required
 @json_view
 @require_http_methods(["GET"])
+@project_rights_required(EDIT)
 def cpn_kpi_results(request, proj_id=None):
     project = get_object_or_404(Project, id=proj_id)
     options = get_object_or_404(Options, project=project)
 
-    if (project.user != request.user) and (
-        project.viewers.filter(user__email=request.user.email, share_rights="edit").exists() is False
-    ):
-        raise PermissionDenied
+    sim = Simulation.objects.filter(scenario=project.scenario).first()
+    if sim is not None:
+        economic_data = project.economic_data
+
+        def build_table():
+            kpi_scalar_results_obj = KPIScalarResults.objects.get(simulation=sim)
+            json.loads(kpi_scalar_results_obj.scalar_values)
+            kpi_cost_results_obj = KPICostsMatrixResults.objects.get(simulation=sim)
+            json.loads(kpi_cost_results_obj.cost_values)
+
+            qs_res = FancyResults.objects.filter(simulation=sim)
+            opt_caps = qs_res.filter(optimized_capacity__gt=0).values_list("asset", "asset_type", "optimized_capacity")
+
+            kpis_of_interest = [
+                # "costs_total",
+                "levelized_costs_of_electricity_equivalent",
+                # "total_emissions",
+                "renewable_factor",
+            ]
+            kpis_of_comparison_diesel = ["costs_total", "levelized_costs_of_electricity_equivalent", "total_emissions"]
+
+            # diesel_results = json.loads(KPIScalarResults.objects.get(simulation__scenario__id=230).scalar_values)
+            scenario_results = json.loads(
+                KPIScalarResults.objects.get(simulation__scenario=project.scenario).scalar_values
+            )
 
-    qs = Simulation.objects.filter(scenario=project.scenario)
-    if qs.exists():
-        sim = qs.get()
-        kpi_scalar_results_obj = KPIScalarResults.objects.get(simulation=sim)
-        json.loads(kpi_scalar_results_obj.scalar_values)
-        kpi_cost_results_obj = KPICostsMatrixResults.objects.get(simulation=sim)
-        json.loads(kpi_cost_results_obj.cost_values)
-
-        qs_res = FancyResults.objects.filter(simulation=sim)
-        opt_caps = qs_res.filter(optimized_capacity__gt=0).values_list("asset", "asset_type", "optimized_capacity")
-
-        kpis_of_interest = [
-            # "costs_total",
-            "levelized_costs_of_electricity_equivalent",
-            # "total_emissions",
-            "renewable_factor",
-        ]
-        kpis_of_comparison_diesel = ["costs_total", "levelized_costs_of_electricity_equivalent", "total_emissions"]
-
-        # diesel_results = json.loads(KPIScalarResults.objects.get(simulation__scenario__id=230).scalar_values)
-        scenario_results = json.loads(KPIScalarResults.objects.get(simulation__scenario=project.scenario).scalar_values)
-
-        kpis = {}
-        qs_inverter = qs_res.filter(optimized_capacity__gt=0, asset="inverter")
-        inverter_flow = 0
-        if qs_inverter.exists():
-            inverter_flow = qs_inverter.get().total_flow
-
-        total_demand, peak_demand, daily_demand = get_fulfilled_demand_indicators(project)
-
-        for kpi in kpis_of_interest:
-            unit = KPI_PARAMETERS[kpi]["unit"].replace("currency", project.economic_data.currency_symbol)
-            if "Factor" in KPI_PARAMETERS[kpi]["unit"]:
-                factor = 100.0
-                unit = "%"
-                # TODO quick fix for renewable share, fix properly later (this also doesnt include possible renewable share from grid)
-                scen_values = round(get_renewable_share(project), 2)
-            else:
-                if project.economic_data.currency_symbol in unit:
-                    factor = project.economic_data.exchange_rate
+            kpis = {}
+            qs_inverter = qs_res.filter(optimized_capacity__gt=0, asset="inverter")
+            inverter_flow = 0
+            if qs_inverter.exists():
+                inverter_flow = qs_inverter.get().total_flow
+
+            total_demand, peak_demand, daily_demand = get_fulfilled_demand_indicators(project)
+
+            for kpi in kpis_of_interest:
+                unit = KPI_PARAMETERS[kpi]["unit"].replace("currency", project.economic_data.currency_symbol)
+                if "Factor" in KPI_PARAMETERS[kpi]["unit"]:
+                    factor = 100.0
+                    unit = "%"
+                    # TODO quick fix for renewable share, fix properly later (this also doesnt include possible renewable share from grid)
+                    scen_values = round(get_renewable_share(project), 2)
                 else:
-                    factor = 1.0
-                scen_values = round(scenario_results[kpi] * factor, 2)  # , round(diesel_results[kpi] * factor, 2)]
-
-            kpis[kpi] = {
-                "verbose": KPI_PARAMETERS[kpi]["verbose"],
-                "unit": unit,
-                "value": scen_values,
-                "description": help_icon(KPI_PARAMETERS[kpi]["definition"]),
-            }
+                    if project.economic_data.currency_symbol in unit:
+                        factor = project.economic_data.exchange_rate
+                    else:
+                        factor = 1.0
+                    scen_values = round(scenario_results[kpi] * factor, 2)  # , round(diesel_results[kpi] * factor, 2)]
+
+                kpis[kpi] = {
+                    "verbose": KPI_PARAMETERS[kpi]["verbose"],
+                    "unit": unit,
+                    "value": scen_values,
+                    "description": help_icon(KPI_PARAMETERS[kpi]["definition"]),
+                }
+
+                table_headers = {}
+                headers = [""]
+                for header in headers:
+                    table_headers[header] = {}
+                    table_headers[header]["verbose"] = header
 
-            table_headers = {}
-            headers = [""]
-            for header in headers:
-                table_headers[header] = {}
-                table_headers[header]["verbose"] = header
+            return {"data": kpis, "headers": table_headers}
 
-        return JsonResponse({"data": kpis, "headers": table_headers}, status=200, content_type="application/json")
+        return graph_payload_response(
+            request, "cpn_kpis", [sim], build_table, economic_data.currency_symbol, economic_data.exchange_rate
+        )
 
 
 @json_view
@@ -0,0 +1,180 @@
+"""Comparison of the results of several simulations
+
+A ScenarioComparison loads the KPIs, the capacities and the total flows of N simulations with a fixed number of queries
+(one per results table, whatever N is) into pandas DataFrames whose rows are the KPIs or the asset labels and whose
+columns are the simulations, in the order in which they were given. The rows missing in a simulation are NaN, so that
+the deltas to a reference simulation and the rankings of the simulations are computed on whole tables at once.
+"""
+
+import json
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+from django.db.models import Case, Q, Value, When
+from django.db.models.functions import Replace
+
+from dashboard.models import FancyResults, KPIScalarResults
+from projects.models import Asset, Simulation
+
+
+def capacity_label_annotation():
+    """Label of the assets in the capacities tables, the storages are named after their discharging power asset"""
+    return Case(
+        When(
+            Q(asset_type__asset_type="discharging_power"),
+            then=Replace("name", Value(" output power"), Value("")),
+        ),
+        default="name",
+    )
+
+
+def table_row_values(table, row, decimals=2):
+    """Return the values of a row of a comparison table as a list, None for the missing values (or a missing row)"""
+    if row not in table.index:
+        return [None] * len(table.columns)
+    values = table.loc[row].to_numpy(dtype=float)
+    if decimals is not None:
+        values = values.round(decimals)
+    return [None if np.isnan(value) else (value.item() if decimals is not None else int(value)) for value in values]
+
+
+class ScenarioComparison:
+    def __init__(self, simulations):
+        """
+        :param simulations: iterable of Simulation instances or ids, the order of the columns of the tables
+        """
+        ids = [simulation.id if isinstance(simulation, Simulation) else int(simulation) for simulation in simulations]
+        info = {
+            sim_id: (scen_id, name, proj_id)
+            for sim_id, scen_id, name, proj_id in Simulation.objects.filter(id__in=ids).values_list(
+                "id", "scenario_id", "scenario__name", "scenario__project_id"
+            )
+        }
+        # the ids of unknown simulations are dropped
+        self.simulation_ids = [sim_id for sim_id in dict.fromkeys(ids) if sim_id in info]
+        self.scenario_ids = [info[sim_id][0] for sim_id in self.simulation_ids]
+        self.scenario_names = [info[sim_id][1] for sim_id in self.simulation_ids]
+        self.project_ids = [info[sim_id][2] for sim_id in self.simulation_ids]
+
+    @classmethod
+    def from_scenarios(cls, scenario_ids):
+        """Compare the simulations of the given scenarios, in the same order"""
+        simulations = dict(Simulation.objects.filter(scenario_id__in=scenario_ids).values_list("scenario_id", "id"))
+        return cls([simulations[scen_id] for scen_id in scenario_ids if scen_id in simulations])
+
+    def __len__(self):
+        return len(self.simulation_ids)
+
+    def _table(self, records, index_names=None):
+        """Pivot (simulation id, *index, value) records into a table aligned on the simulations of the comparison"""
+        if index_names is None:
+            index_names = ["label"]
+        if not records:
+            index = pd.MultiIndex.from_tuples([], names=index_names) if len(index_names) > 1 else pd.Index([])
+            return pd.DataFrame(index=index, columns=self.simulation_ids, dtype=float)
+        df = pd.DataFrame.from_records(records, columns=["simulation"] + index_names + ["value"])
+        df["value"] = pd.to_numeric(df["value"], errors="coerce")
+        # the values of a row found several times in a simulation are summed, NaN if all of them are missing
+        table = df.groupby(index_names + ["simulation"])["value"].sum(min_count=1).unstack("simulation")
+        table = table.reindex(columns=self.simulation_ids)
+        table.columns.name = None
+        if len(index_names) == 1:
+            table.index.name = None
+        return table
+
+    @cached_property
+    def kpi_dicts(self):
+        """The scalar KPIs of each simulation as stored, {simulation id: {kpi: value}}"""
+        kpis = {sim_id: {} for sim_id in self.simulation_ids}
+        # if a simulation was parsed several times, its latest KPIs prevail
+        for sim_id, scalar_values in (
+            KPIScalarResults.objects.filter(simulation_id__in=self.simulation_ids)
+            .order_by("id")
+            .values_list("simulation_id", "scalar_values")
+        ):
+            kpis[sim_id] = json.loads(scalar_values)
+        return kpis
+
+    @cached_property
+    def kpis(self):
+        """Table of the numeric scalar KPIs, one row per KPI"""
+        records = [
+            (sim_id, kpi, value)
+            for sim_id, kpi_dict in self.kpi_dicts.items()
+            for kpi, value in kpi_dict.items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        ]
+        return self._table(records)
+
+    @cached_property
+    def installed_capacities(self):
+        """Table of the installed capacities of the assets, one row per asset label"""
+        qs = (
+            Asset.objects.filter(scenario__simulation__id__in=self.simulation_ids, installed_capacity__isnull=False)
+            .exclude(
+                Q(asset_type__asset_type__contains="dso")
+                | Q(asset_type__asset_type__contains="demand")
+                | Q(asset_type__asset_type__in=["charging_power", "capacity"])
+            )
+            .annotate(label=capacity_label_annotation())
+            .values_list("scenario__simulation__id", "label", "installed_capacity")
+        )
+        return self._table(list(qs))
+
+    @cached_property
+    def fancy_results(self):
+        """DataFrame of the flows of the simulations without their timeseries, one row per flow"""
+        columns = ["simulation", "bus", "asset", "direction", "asset_type", "oemof_type", "total_flow", "capacity"]
+        qs = FancyResults.objects.filter(simulation_id__in=self.simulation_ids).values_list(
+            "simulation_id", "bus", "asset", "direction", "asset_type", "oemof_type", "total_flow", "optimized_capacity"
+        )
+        return pd.DataFrame.from_records(list(qs), columns=columns)
+
+    @cached_property
+    def optimized_capacities(self):
+        """Table of the optimized capacities of the assets, one row per asset label"""
+        df = self.fancy_results
+        df = df.loc[
+            ~(((df.oemof_type == "storage") & (df.direction == "out")) | (df.asset_type == "capacity"))
+            & df.capacity.notna()
+        ]
+        return self._table(list(df[["simulation", "asset", "capacity"]].itertuples(index=False, name=None)))
+
+    @cached_property
+    def flows(self):
+        """Table of the total flows, one row per (bus, asset, direction)"""
+        df = self.fancy_results
+        records = list(df[["simulation", "bus", "asset", "direction", "total_flow"]].itertuples(index=False, name=None))
+        return self._table(records, index_names=["bus", "asset", "direction"])
+
+    def _reference_column(self, reference):
+        """Position of the reference simulation (by default the first one) in the tables"""
+        if reference is None:
+            return 0
+        return self.simulation_ids.index(reference)
+
+    def deltas(self, table, reference=None):
+        """Differences of each simulation to the reference simulation (the first one by default)"""
+        values = table.to_numpy(dtype=float)
+        if values.shape[1] == 0:
+            return table.copy()
+        ref = values[:, [self._reference_column(reference)]]
+        return pd.DataFrame(values - ref, index=table.index, columns=table.columns)
+
+    def relative_deltas(self, table, reference=None):
+        """Differences to the reference simulation divided by its values, NaN where the reference is 0"""
+        values = table.to_numpy(dtype=float)
+        if values.shape[1] == 0:
+            return table.copy()
+        ref = values[:, [self._reference_column(reference)]]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            relative = np.where(ref != 0, (values - ref) / np.abs(ref), np.nan)
+        return pd.DataFrame(relative, index=table.index, columns=table.columns)
+
+    def rankings(self, table, ascending=True):
+        """Rank of each simulation in each row, 1 being the lowest value (the highest one if ascending is False)
+
+        The ties share the lowest rank and the missing values are not ranked.
+        """
+        return table.rank(axis=1, method="min", ascending=ascending)
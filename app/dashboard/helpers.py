@@ -1,13 +1,15 @@
 import os
 import copy
 import csv
-from django.contrib.staticfiles.storage import staticfiles_storage
 from django.utils.translation import gettext_lazy as _
-from django.db.models import Value, Q, F, Case, When
+from datetime import datetime
+from django.db.models import Value, Q, F, Case, When, Exists, OuterRef, Subquery, BooleanField
 from django.db.models.functions import Concat, Replace
 from numbers import Number
 
-from projects.models import Viewer, Project
+from projects.models import Viewer, Project, Scenario
+from projects.constants import DONE
+from projects.static_tables import static_tables, LazyTable
 import pickle
 from django.conf import settings as django_settings
 
@@ -15,92 +17,78 @@ from django.conf import settings as django_settings
 
 sectors = ["Electricity", "Heat", "Gas", "H2"]
 
-KPIS = {}
 MANAGEMENT_CAT = "management"
 ECONOMIC_CAT = "economic"
 TECHNICAL_CAT = "technical"
 ENVIRONEMENTAL_CAT = "environemental"
-TABLES = {
-    MANAGEMENT_CAT: {"General": []},
-    # ECONOMIC_CAT: {},
-    # TECHNICAL_CAT: {},
-    # ENVIRONEMENTAL_CAT: {},
-}
 EMPTY_SUBCAT = "none"
 
-KPI_PARAMETERS = {}
-KPI_PARAMETERS_ASSETS = {}
-
-if os.path.exists(staticfiles_storage.path("MVS_kpis_list.csv")) is True:
-    with open(staticfiles_storage.path("MVS_kpis_list.csv"), encoding="utf-8") as csvfile:
-        csvreader = csv.reader(csvfile, delimiter=",", quotechar='"')
-        for i, row in enumerate(csvreader):
-            if i == 0:
-                hdr = row
-                label_idx = hdr.index("label")
-                verbose_idx = hdr.index("verbose")
-                unit_idx = hdr.index(":Unit:")
-                cat_idx = hdr.index("category")
-                subcat_idx = hdr.index("subcategory")
-            else:
-                label = row[label_idx]
-                verbose = row[verbose_idx]
-                unit = row[unit_idx]
-                KPIS[label] = {k: v for k, v in zip(hdr, row)}
-
-                # cat = row[cat_idx]
-                # subcat = row[subcat_idx]
-                # if subcat == MANAGEMENT_CAT:
-                #     # reverse the category and the subcategory for this special table (management is not a parameter type, whereas all other table are also parameter types)
-                #     subcat = cat
-                #     cat = MANAGEMENT_CAT
-                if label in (
-                    "degree_of_autonomy",
-                    "onsite_energy_fraction",
-                    "renewable_factor",
-                    "renewable_share_of_local_generation",
-                    "levelized_costs_of_electricity_equivalent",
-                ):
-                    TABLES[MANAGEMENT_CAT]["General"].append(
-                        {
-                            "name": _(verbose),
-                            "id": label,
-                            "unit": _(unit) if unit != "Factor" else "",
-                        }
-                    )
-                # if subcat != EMPTY_SUBCAT:
-                #     if cat in TABLES:
-                #         if subcat not in TABLES[cat]:
-                #             TABLES[cat][subcat] = []
-                #         if label not in TABLES[cat][subcat]:
-                #             # the _() make the text translatable if it is mentionned in the django.po file
-                #             TABLES[cat][subcat].append(
-                #                 {"name": _(verbose), "id": label, "unit": _(unit)}
-                #             )
-
-    with open(staticfiles_storage.path("MVS_kpis_list.csv"), encoding="utf-8") as csvfile:
-        csvreader = csv.reader(csvfile, delimiter=",", quotechar='"')
-        for i, row in enumerate(csvreader):
-            if i == 0:
-                hdr = [el.replace(" ", "_").replace(":", "").lower() for el in row]
-                label_idx = hdr.index("label")
-                cat_idx = hdr.index("category")
-                scope_idx = hdr.index("scope")
-            else:
-                label = row[label_idx]
-                category = row[cat_idx]
-                scope = row[scope_idx]
-
-                if category != "files":
-                    KPI_PARAMETERS[label] = {
-                        k: _(v) if k == "verbose" or k == "definition" else v for k, v in zip(hdr, row)
-                    }
-                    if "asset" in scope:
-                        KPI_PARAMETERS_ASSETS[label] = {
-                            k: _(v) if k == "verbose" or k == "definition" else v for k, v in zip(hdr, row)
+
+def parse_kpis_list(filepath):
+    """Parse MVS_kpis_list.csv into the KPIS, TABLES, KPI_PARAMETERS and KPI_PARAMETERS_ASSETS tables"""
+    kpis = {}
+    tables = {
+        MANAGEMENT_CAT: {"General": []},
+        # ECONOMIC_CAT: {},
+        # TECHNICAL_CAT: {},
+        # ENVIRONEMENTAL_CAT: {},
+    }
+    kpi_parameters = {}
+    kpi_parameters_assets = {}
+
+    if os.path.exists(filepath) is True:
+        with open(filepath, encoding="utf-8") as csvfile:
+            csvreader = csv.reader(csvfile, delimiter=",", quotechar='"')
+            for i, row in enumerate(csvreader):
+                if i == 0:
+                    hdr = row
+                    label_idx = hdr.index("label")
+                    verbose_idx = hdr.index("verbose")
+                    unit_idx = hdr.index(":Unit:")
+                    cat_idx = hdr.index("category")
+                    scope_idx = hdr.index("scope")
+                    param_hdr = [el.replace(" ", "_").replace(":", "").lower() for el in row]
+                else:
+                    label = row[label_idx]
+                    verbose = row[verbose_idx]
+                    unit = row[unit_idx]
+                    kpis[label] = {k: v for k, v in zip(hdr, row)}
+
+                    if label in (
+                        "degree_of_autonomy",
+                        "onsite_energy_fraction",
+                        "renewable_factor",
+                        "renewable_share_of_local_generation",
+                        "levelized_costs_of_electricity_equivalent",
+                    ):
+                        tables[MANAGEMENT_CAT]["General"].append(
+                            {
+                                "name": _(verbose),
+                                "id": label,
+                                "unit": _(unit) if unit != "Factor" else "",
+                            }
+                        )
+
+                    if row[cat_idx] != "files":
+                        kpi_parameters[label] = {
+                            k: _(v) if k == "verbose" or k == "definition" else v for k, v in zip(param_hdr, row)
                         }
+                        if "asset" in row[scope_idx]:
+                            kpi_parameters_assets[label] = {
+                                k: _(v) if k == "verbose" or k == "definition" else v for k, v in zip(param_hdr, row)
+                            }
+
+    return dict(kpis=kpis, tables=tables, kpi_parameters=kpi_parameters, kpi_parameters_assets=kpi_parameters_assets)
+
+
+static_tables.register("MVS_kpis_list", "MVS_kpis_list.csv", parse_kpis_list)
 
-                #### FUNCTIONS ####
+KPIS = LazyTable("MVS_kpis_list", key="kpis")
+TABLES = LazyTable("MVS_kpis_list", key="tables")
+KPI_PARAMETERS = LazyTable("MVS_kpis_list", key="kpi_parameters")
+KPI_PARAMETERS_ASSETS = LazyTable("MVS_kpis_list", key="kpi_parameters_assets")
+
+#### FUNCTIONS ####
 
 
 def storage_asset_to_list(assets_results_json):
@@ -140,21 +128,104 @@ def update_selected_scenarios_in_cache(request, proj_id, scen_id):
 
 def fetch_user_projects(user):
     """Given a user return the projects they own as well as the shared ones"""
-    user_project_ids = user.project_set.values_list("id", flat=True).distinct()
-
-    viewer_project_ids = (
-        Viewer.objects.filter(user__email=user.email).values_list("viewer_projects", flat=True).distinct()
+    viewer_project_ids = Viewer.objects.filter(user__email=user.email).values_list("viewer_projects", flat=True)
+
+    user_projects = (
+        Project.objects.filter(Q(user=user) | Q(id__in=viewer_project_ids))
+        .annotate(shared=Exists(Viewer.objects.filter(viewer_projects=OuterRef("pk"), user__email=user.email)))
+        .annotate(
+            label=Case(
+                When(shared=True, then=Concat("name", Value(" (shared)"))),
+                default=F("name"),
+            ),
+        )
     )
 
-    user_projects = Project.objects.filter(Q(id__in=user_project_ids) | Q(id__in=viewer_project_ids)).annotate(
-        label=Case(
-            When(Q(id__in=viewer_project_ids), then=Concat("name", Value(" (shared)"))),
-            default=F("name"),
-        ),
-        shared=Case(When(Q(id__in=viewer_project_ids), then=Value(True)), default=Value(False)),
+    return user_projects
+
+
+PROJECTS_PAGE_SIZE = 20
+CURSOR_SEPARATOR = "_"
+
+
+def annotate_project_listing(projects, user):
+    """Annotate each project with the information displayed in the project list
+
+    * latest_scenario_id: id of the scenario returned by Project.scenario
+    * simulation_status: status of the simulation of this scenario (None if it was not simulated)
+    * has_results: True if the simulation of this scenario is finished
+    * share_rights: rights of the user on the project if it was shared with them ("edit" prevails over "read")
+    * can_edit: True if the user owns the project or has edit rights on it
+    """
+    latest_scenario = Scenario.objects.filter(project=OuterRef("pk")).order_by("-pk").values("pk")[:1]
+    latest_scenario_simulation = Scenario.objects.filter(pk=OuterRef("latest_scenario_id"))
+    share_rights = (
+        Viewer.objects.filter(viewer_projects=OuterRef("pk"), user__email=user.email)
+        .order_by("share_rights")
+        .values("share_rights")[:1]
+    )
+    return (
+        projects.select_related("user", "economic_data")
+        .annotate(latest_scenario_id=Subquery(latest_scenario))
+        .annotate(
+            simulation_status=Subquery(latest_scenario_simulation.values("simulation__status")[:1]),
+            has_results=Exists(latest_scenario_simulation.filter(simulation__status=DONE)),
+            share_rights=Subquery(share_rights),
+        )
+        .annotate(
+            can_edit=Case(
+                When(Q(user=user) | Q(share_rights="edit"), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
+        )
     )
 
-    return user_projects
+
+def encode_project_cursor(project):
+    return f"{project.date_created.isoformat()}{CURSOR_SEPARATOR}{project.pk}"
+
+
+def decode_project_cursor(cursor):
+    """Return the (date_created, pk) of the last project of a page, None if the cursor is not valid"""
+    try:
+        date_created, pk = cursor.rsplit(CURSOR_SEPARATOR, 1)
+        return datetime.fromisoformat(date_created), int(pk)
+    except (AttributeError, ValueError):
+        return None
+
+
+def fetch_user_projects_page(user, search=None, cursor=None, page_size=PROJECTS_PAGE_SIZE):
+    """Return one page of the projects of a user (owned and shared) from the most recent to the oldest
+
+    The pagination uses the creation date and id of the last project of the previous page (keyset pagination) rather
+    than an offset, so that the cost of a page does not depend on its position in the list.
+
+    :param user: the user whose projects are listed
+    :param search: optional text to look for in the name, description or country of the projects
+    :param cursor: the next_cursor returned with the previous page, None for the first page
+    :param page_size: maximal number of projects in the page
+    :return: the list of projects (annotated with annotate_project_listing) and the cursor of the next page (None if
+    this page is the last one)
+    """
+    projects = fetch_user_projects(user)
+    if search:
+        projects = projects.filter(
+            Q(name__icontains=search) | Q(description__icontains=search) | Q(country__icontains=search)
+        )
+
+    position = decode_project_cursor(cursor) if cursor else None
+    if position is not None:
+        date_created, pk = position
+        projects = projects.filter(Q(date_created__lt=date_created) | Q(date_created=date_created, pk__lt=pk))
+
+    projects = list(annotate_project_listing(projects, user).order_by("-date_created", "-pk")[: page_size + 1])
+
+    next_cursor = None
+    if len(projects) > page_size:
+        projects = projects[:page_size]
+        next_cursor = encode_project_cursor(projects[-1])
+    return projects, next_cursor
 
 
 def kpi_scalars_list(kpi_scalar_values_dict, KPI_SCALAR_UNITS, KPI_SCALAR_TOOLTIPS):
@@ -411,16 +482,32 @@ def single_timeseries_to_json(value=None, unit="", label="", asset_type="", asse
     }
 
 
-def simulation_timeseries_to_json(scenario_name="", scenario_id="", scenario_timeseries=None, scenario_timestamps=""):
-    """format the information about several timeseries within a scenario in a specific JSON"""
+def simulation_timeseries_to_json(
+    scenario_name="", scenario_id="", scenario_timeseries=None, scenario_timestamps="", time_axis=None
+):
+    """format the information about several timeseries within a scenario in a specific JSON
+
+    :param time_axis: compact {start, step, count} time axis (see projects.time_index) expanded by the client into the
+        timestamps, in which case scenario_timestamps is left empty
+    """
     if scenario_timeseries is None:
         scenario_timeseries = []
-    return {
+    answer = {
         "scenario_name": scenario_name,
         "scenario_id": scenario_id,
         "timeseries": scenario_timeseries,
         "timestamps": scenario_timestamps,
     }
+    if time_axis is not None:
+        answer["time_axis"] = time_axis
+    return answer
+
+
+def scenario_timestamps_to_json(scenario, compact_time_axis=False):
+    """Keyword arguments of simulation_timeseries_to_json for the timestamps of a scenario"""
+    if compact_time_axis is True:
+        return {"scenario_timestamps": [], "time_axis": scenario.get_timestamps(compact=True)}
+    return {"scenario_timestamps": scenario.get_timestamps()}
 
 
 def report_item_render_to_json(report_item_id="", data=None, title="", report_item_type=""):
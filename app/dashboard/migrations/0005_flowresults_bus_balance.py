@@ -0,0 +1,23 @@
+# Generated by Django 4.2.4 on 2026-10-19 14:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dashboard", "0004_new_result_model"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="flowresults",
+            name="bus_balance",
+            field=models.BinaryField(null=True),
+        ),
+        migrations.AlterField(
+            model_name="flowresults",
+            name="flow_data",
+            field=models.TextField(blank=True, default=""),
+        ),
+    ]
@@ -1,4 +1,5 @@
 import copy
+import io
 import json
 import jsonschema
 import traceback
@@ -35,6 +36,7 @@ from dashboard.helpers import (
     COSTS_PER_CATEGORY,
     single_timeseries_to_json,
     simulation_timeseries_to_json,
+    scenario_timestamps_to_json,
     report_item_render_to_json,
     sensitivity_analysis_graph_render_to_json,
     format_storage_subasset_name,
@@ -210,6 +212,129 @@ class OemofBusResults(pd.DataFrame):  # real results
         return optimized_capacity
 
 
+FLOW_LEVELS = ["bus", "energy_vector", "direction", "asset", "asset_type", "oemof_type"]
+
+
+def is_hidden_asset(asset):
+    return "@" in asset or "_excess" in asset
+
+
+class BusBalance:
+    """Energy balance of the busses of a simulation, materialized once from the raw oemof results
+
+    The flows are the rows of a (flow, timestep) matrix sorted like the index of OemofBusResults, so that the inflows
+    and the outflows of a bus are contiguous blocks of rows. Together with the labels of the flows, their total and
+    optimized capacity, the bus to energy vector map and the rows of each bus, they are stored as a compressed npz
+    archive in FlowResults.bus_balance.
+    """
+
+    def __init__(self, timestamps, flows, labels, investments, totals=None):
+        """
+        :param timestamps: int64 array of the timestamps in ms
+        :param flows: float array of shape (number of flows, number of timesteps)
+        :param labels: str array of shape (number of flows, 6), the values of FLOW_LEVELS of each flow
+        :param investments: float array of the optimized capacity of each flow, NaN if there is none
+        """
+        self.timestamps = np.asarray(timestamps, dtype=np.int64)
+        self.flows = np.asarray(flows, dtype=float).reshape(len(labels), len(self.timestamps))
+        self.labels = np.asarray(labels, dtype=str).reshape(len(self.flows), len(FLOW_LEVELS))
+        self.investments = np.asarray(investments, dtype=float)
+        self.totals = np.nansum(self.flows, axis=1) if totals is None else np.asarray(totals, dtype=float)
+
+        # {bus: energy_vector} and {bus: (first inflow row, first outflow row, end row)}
+        self.busses = {}
+        self.bus_rows = {}
+        for i, (bus, energy_vector, direction) in enumerate(self.labels[:, :3].tolist()):
+            self.busses[bus] = energy_vector
+            start, out_start, _ = self.bus_rows.get(bus, (i, None, None))
+            if direction == "out" and out_start is None:
+                out_start = i
+            self.bus_rows[bus] = (start, out_start, i + 1)
+        for bus, (start, out_start, end) in self.bus_rows.items():
+            if out_start is None:
+                self.bus_rows[bus] = (start, end, end)
+
+    @classmethod
+    def from_raw_results(cls, results):
+        """Build the balance from the raw results of MVS (a DataFrame saved to json with the "split" orient)"""
+        js = json.loads(results) if isinstance(results, str) else results
+        return cls.from_split(js["columns"], js["index"], js["data"])
+
+    @classmethod
+    def from_split(cls, columns, index, data):
+        """Build the balance from the columns, index and data of the raw results"""
+        data = np.asarray(data, dtype=float).reshape(len(index), len(columns))
+        labels = [tuple(str(level) for level in column) for column in columns]
+        order = sorted(range(len(labels)), key=labels.__getitem__)
+        # the last row of the raw results contains the optimized capacities
+        return cls(
+            timestamps=index[:-1],
+            flows=data[:-1, order].T,
+            labels=[labels[i] for i in order],
+            investments=data[-1, order],
+        )
+
+    @classmethod
+    def from_bytes(cls, data):
+        with np.load(io.BytesIO(data), allow_pickle=False) as archive:
+            return cls(
+                timestamps=archive["timestamps"],
+                flows=archive["flows"],
+                labels=archive["labels"],
+                investments=archive["investments"],
+                totals=archive["totals"],
+            )
+
+    def to_bytes(self):
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            timestamps=self.timestamps,
+            flows=self.flows,
+            labels=self.labels,
+            investments=self.investments,
+            totals=self.totals,
+            busses=np.array(list(self.busses.items()), dtype=str).reshape(-1, 2),
+            bus_rows=np.array(list(self.bus_rows.values()), dtype=np.int64).reshape(-1, 3),
+        )
+        return buffer.getvalue()
+
+    @property
+    def time_index(self):
+        return pd.to_datetime(self.timestamps, unit="ms")
+
+    def flow_index(self, rows=slice(None), levels=FLOW_LEVELS):
+        labels = self.labels[rows]
+        columns = [FLOW_LEVELS.index(level) for level in levels]
+        return pd.MultiIndex.from_arrays([labels[:, c] for c in columns], names=levels)
+
+    def inflows(self, bus):
+        start, out_start, _ = self.bus_rows[bus]
+        return slice(start, out_start)
+
+    def outflows(self, bus):
+        _, out_start, end = self.bus_rows[bus]
+        return slice(out_start, end)
+
+    def select(self, energy_vector=None, include_hidden_assets=False, asset_list=None):
+        """Return the rows of the flows of an energy vector (all flows if None) and of the listed assets"""
+        if asset_list is not None:
+            assets = set(asset_list)
+            return [
+                i
+                for i, label in enumerate(self.labels.tolist())
+                if label[3] in assets and energy_vector in (None, label[1])
+            ]
+        return [
+            i
+            for i, label in enumerate(self.labels.tolist())
+            if energy_vector in (None, label[1]) and (include_hidden_assets is True or not is_hidden_asset(label[3]))
+        ]
+
+    def to_dataframe(self):
+        return pd.DataFrame(self.flows, index=self.flow_index(), columns=self.time_index)
+
+
 class FancyResults(models.Model):
     bus = models.CharField(max_length=60)
     energy_vector = models.CharField(max_length=20, choices=ENERGY_VECTOR)
@@ -252,49 +377,66 @@ class FancyResults(models.Model):
 
 
 class FlowResults(models.Model):
-    flow_data = models.TextField()  # to store the assets list
+    flow_data = models.TextField(blank=True, default="")  # raw results of the simulations saved before bus_balance
+    bus_balance = models.BinaryField(null=True)  # see BusBalance
     simulation = models.ForeignKey(Simulation, on_delete=models.CASCADE)
+    __balance = None
     __df_flows = None
-    __df_capacities = None
+
+    @property
+    def balance(self):
+        if self.__balance is None:
+            if self.bus_balance is None:
+                # materialize the balance of the results saved before it existed
+                self.__balance = BusBalance.from_raw_results(self.flow_data)
+                self.bus_balance = self.__balance.to_bytes()
+                if self.pk is not None:
+                    FlowResults.objects.filter(pk=self.pk).update(bus_balance=self.bus_balance)
+            else:
+                self.__balance = BusBalance.from_bytes(bytes(self.bus_balance))
+        return self.__balance
 
     @property
     def df_flows(self):
         if self.__df_flows is None:
-            self.__df_flows = OemofBusResults(self.flow_data).bus_flows()
+            self.__df_flows = self.balance.to_dataframe()
 
         return self.__df_flows
 
     def asset_optimized_capacity(self, asset_name):
-        if self.__df_capacities is None:
-            self.__df_capacities = OemofBusResults(self.flow_data)
-        return self.__df_capacities.asset_optimized_capacity(asset_name)
+        balance = self.balance
+        rows = (balance.labels[:, 3] == asset_name) & ~np.isnan(balance.investments)
+        optimized_capacity = pd.Series(
+            balance.investments[rows], index=balance.flow_index(rows), name="investments", dtype=float
+        )
+        if len(optimized_capacity) == 1:
+            optimized_capacity = optimized_capacity.iloc[0]
+        return optimized_capacity
 
     @property
     def busses(self):
         """returns a mapping of the bus to their energy_vectors"""
-        return {
-            k: v
-            for k, v in zip(
-                self.df_flows.index.get_level_values("bus"),
-                self.df_flows.index.get_level_values("energy_vector"),
-            )
-        }
+        return dict(self.balance.busses)
 
     def single_bus_flows(self, bus_name):
-        df_bus = self.df_flows.loc[bus_name]
-        energy_vector = df_bus.index.get_level_values("energy_vector").unique()[0]
+        balance = self.balance
+        inflows = balance.inflows(bus_name)
+        outflows = balance.outflows(bus_name)
         # TODO label charge and discharge for storages
-        df_bus.index = df_bus.index.droplevel(["asset_type", "energy_vector", "oemof_type"])
-        df = pd.concat(
-            [
-                df_bus.loc[df_bus.index.get_level_values("direction") == "in"].T,
-                df_bus.loc[df_bus.index.get_level_values("direction") == "out"].T * -1,
-            ],
-            axis=1,
+        df = pd.DataFrame(
+            np.hstack([balance.flows[inflows].T, balance.flows[outflows].T * -1]),
+            index=balance.time_index,
+            columns=pd.MultiIndex.from_arrays(
+                [
+                    np.concatenate([balance.labels[inflows, 2], balance.labels[outflows, 2]]),
+                    np.concatenate([balance.labels[inflows, 3], balance.labels[outflows, 3]]),
+                ],
+                names=["direction", "asset"],
+            ),
         )
         df.name = bus_name
 
-        df.energy_vector = energy_vector
+        df.energy_vector = balance.busses[bus_name]
 
         return df
 
@@ -316,48 +458,22 @@ class FlowResults(models.Model):
         return fig.to_dict()
 
     def all_flows(self, include_hidden_assets=False, asset_list=None):
-        df = self.df_flows
-        # df = df.loc[
-        #     (
-        #         (df.index.get_level_values("direction") == "out")
-        #         & (df.index.get_level_values("oemof_type") == "transformer")
-        #     )
-        #     == False
-        # ]
-
-        if asset_list is not None:
-            include_hidden_assets = True
-
-        if include_hidden_assets is False:
-            df = df.loc[
-                (
-                    df.index.get_level_values("asset").str.contains("@")
-                    | df.index.get_level_values("asset").str.contains("_excess")
-                )
-                == False
-            ]
-
-        if asset_list is not None:
-            df = df.loc[df.index.get_level_values("asset").isin(asset_list)]
-
-        df.index = df.index.droplevel(["asset_type", "energy_vector", "bus"])
-        df = df.T
+        balance = self.balance
+        rows = balance.select(include_hidden_assets=include_hidden_assets, asset_list=asset_list)
 
         # Label charge and discharge of storage components
         col_names = []
-        for col in df.columns:
-            if col[2] == "storage":
-                suffix = "charge" if col[0] == "out" else "discharge"
-                col_names.append(f"{col[1]} {suffix}")
-            elif col[2] == "transformer":
-                suffix = "inflow" if col[0] == "out" else "outflow"
-                col_names.append(f"{col[1]} ({suffix})")
+        for _, _, direction, asset, _, oemof_type in balance.labels[rows].tolist():
+            if oemof_type == "storage":
+                suffix = "charge" if direction == "out" else "discharge"
+                col_names.append(f"{asset} {suffix}")
+            elif oemof_type == "transformer":
+                suffix = "inflow" if direction == "out" else "outflow"
+                col_names.append(f"{asset} ({suffix})")
             else:
-                col_names.append(col[1])
-
-        df.columns = col_names
+                col_names.append(asset)
 
-        return df
+        return pd.DataFrame(balance.flows[rows].T, index=balance.time_index, columns=col_names)
 
     def all_flows_figure(
         self,
@@ -394,49 +510,21 @@ class FlowResults(models.Model):
     #     return fig.to_dict()
 
     def energy_sector_flows(self, energy_vector, include_hidden_assets=False, asset_list=None):
-        df = self.df_flows.loc[(self.df_flows.index.get_level_values("energy_vector") == energy_vector)]
-
-        if asset_list is not None:
-            include_hidden_assets = True
-
-        if include_hidden_assets is False:
-            df = df.loc[
-                (
-                    df.index.get_level_values("asset").str.contains("@")
-                    | df.index.get_level_values("asset").str.contains("_excess")
-                )
-                == False
-            ]
-
-        if asset_list is not None:
-            df = df.loc[df.index.get_level_values("asset").isin(asset_list)]
-
+        balance = self.balance
+        rows = balance.select(energy_vector, include_hidden_assets=include_hidden_assets, asset_list=asset_list)
         # ignore the flows which are 0 everywhere
-        df = df[df.sum(axis=1).values != 0]  # .sum(axis=1).values
-
-        df.index = df.index.droplevel(["asset_type", "energy_vector", "bus"])
-        df = df.T
+        rows = [i for i in rows if balance.totals[i] != 0]
 
         # Label inflow and outflow of transformer components
         col_names = []
-        for col in df.columns:
-            if col[2] != "transformer":
-                col_names.append(col[1])
+        for _, _, direction, asset, _, oemof_type in balance.labels[rows].tolist():
+            if oemof_type != "transformer":
+                col_names.append(asset)
             else:
-                suffix = "inflow" if col[0] == "out" else "outflow"
-                col_names.append(f"{col[1]} ({suffix})")
-
-        df.columns = col_names
-
-        # TDB if we keep it (if we discard one of the in or out flow of transformer component
-        # If a transformers appears twice we keep only the flow which goes from
-        # for asset_name in df.loc[df.index.get_level_values("oemof_type") == "transformer"].index.get_level_values("asset").unique():
-        #    if len(df.loc[df_ev.index.get_level_values("asset") == asset_name]) > 1:
-        #        idx_to_drop = (df.index.get_level_values("asset") == asset_name) & (df.index.get_level_values("direction") == "out")
-        #        #df.drop(index=df[idx_to_drop].index, inplace=True)
-        #
-        # df.loc[idx_to_drop].rename({asset_name: asset_name + "out"})
-        return df
+                suffix = "inflow" if direction == "out" else "outflow"
+                col_names.append(f"{asset} ({suffix})")
+
+        return pd.DataFrame(balance.flows[rows].T, index=balance.time_index, columns=col_names)
 
     def energy_sector_flows_figure(
         self,
@@ -819,7 +907,7 @@ def parse_manytomany_object_list(object_list, model):
     return object_list
 
 
-def graph_timeseries(simulations, y_variables=None):
+def graph_timeseries(simulations, y_variables=None, compact_time_axis=False):
     simulations_results = []
     for sim in simulations:
         qs = FancyResults.objects.filter(simulation=sim, total_flow__gt=0)
@@ -872,13 +960,13 @@ def graph_timeseries(simulations, y_variables=None):
                 scenario_name=sim.scenario.name,
                 scenario_id=sim.scenario.id,
                 scenario_timeseries=y_values,
-                scenario_timestamps=sim.scenario.get_timestamps(),
+                **scenario_timestamps_to_json(sim.scenario, compact_time_axis),
             )
         )
     return simulations_results
 
 
-def graph_timeseries_stacked(simulations, y_variables, energy_vector):
+def graph_timeseries_stacked(simulations, y_variables, energy_vector, compact_time_axis=False):
     simulations_results = []
     for simulation in simulations:
         qs = FancyResults.objects.filter(simulation=simulation, total_flow__gt=0, energy_vector=energy_vector)
@@ -954,13 +1042,13 @@ def graph_timeseries_stacked(simulations, y_variables, energy_vector):
                 scenario_name=simulation.scenario.name,
                 scenario_id=simulation.scenario.id,
                 scenario_timeseries=y_values[::-1],
-                scenario_timestamps=simulation.scenario.get_timestamps(),
+                **scenario_timestamps_to_json(simulation.scenario, compact_time_axis),
             )
         )
     return simulations_results
 
 
-def graph_timeseries_stacked_cpn(simulations, y_variables, energy_vector):
+def graph_timeseries_stacked_cpn(simulations, y_variables, energy_vector, compact_time_axis=False):
     simulations_results = []
     for simulation in simulations:
         qs = FancyResults.objects.filter(simulation=simulation, total_flow__gt=0, energy_vector=energy_vector)
@@ -1098,40 +1186,28 @@ def graph_timeseries_stacked_cpn(simulations, y_variables, energy_vector):
                 scenario_name=simulation.scenario.name,
                 scenario_id=simulation.scenario.id,
                 scenario_timeseries=y_values[::-1],
-                scenario_timestamps=simulation.scenario.get_timestamps(),
+                **scenario_timestamps_to_json(simulation.scenario, compact_time_axis),
             )
         )
     return simulations_results
 
 
 def graph_capacities(simulations, y_variables):
+    # imported here as dashboard.comparison depends on the models of this module
+    from dashboard.comparison import ScenarioComparison
+
+    # the capacities of all simulations are loaded at once, one query per table
+    comparison = ScenarioComparison(simulations)
+    installed_capacities = comparison.installed_capacities
+    optimized_capacities = comparison.optimized_capacities
+
     simulations_results = []
     multi_scenario = False
-    if len(simulations) > 1:
+    if len(comparison) > 1:
         multi_scenario = True
 
     if y_variables is None:
-        y_variables = (
-            Asset.objects.filter(scenario__simulation__in=simulations)
-            .exclude(
-                Q(asset_type__asset_type__contains="dso")
-                | Q(asset_type__asset_type__contains="demand")
-                | Q(asset_type__asset_type__in=["charging_power", "capacity"])
-            )
-            .filter(installed_capacity__isnull=False)
-            .annotate(
-                label=Case(
-                    When(
-                        Q(asset_type__asset_type="discharging_power"),
-                        then=Replace("name", Value(" output power"), Value("")),
-                    ),
-                    default="name",
-                )
-            )
-            .order_by("label")
-            .distinct()
-            .values_list("label", flat=True)
-        )
+        y_variables = installed_capacities.index.tolist()
     # TODO quickfix here
     temp = []
     for y_var in y_variables:
@@ -1139,7 +1215,9 @@ def graph_capacities(simulations, y_variables):
         if "Battery" in y_var:
             temp.append(y_var.lower())
 
-    for simulation in simulations:
+    for sim_id, scen_id, scen_name in zip(
+        comparison.simulation_ids, comparison.scenario_ids, comparison.scenario_names
+    ):
         y_values = (
             []
         )  # stores the capacity, both installed and optimized in separate dicts, of each individual asset/ component
@@ -1147,64 +1225,19 @@ def graph_capacities(simulations, y_variables):
 
         installed_capacity_dict = {
             "capacity": [],
-            "name": _("Installed Capacity")
-            if multi_scenario is False
-            else _("Inst. Cap.") + f"{simulation.scenario.name}",
+            "name": _("Installed Capacity") if multi_scenario is False else _("Inst. Cap.") + f"{scen_name}",
         }
         optimized_capacity_dict = {
             "capacity": [],
-            "name": _("Optimized Capacity")
-            if multi_scenario is False
-            else _("Opt. Cap.") + f"{simulation.scenario.name}",
+            "name": _("Optimized Capacity") if multi_scenario is False else _("Opt. Cap.") + f"{scen_name}",
         }
 
-        # read information about the installed capacity
-        qs1 = (
-            Asset.objects.filter(scenario__simulation=simulation)
-            .exclude(
-                Q(asset_type__asset_type__contains="dso")
-                | Q(asset_type__asset_type__contains="demand")
-                | Q(asset_type__asset_type__in=["charging_power", "capacity"])
-            )
-            .filter(installed_capacity__isnull=False)
-            .annotate(
-                label=Case(
-                    When(
-                        Q(asset_type__asset_type="discharging_power"),
-                        then=Replace("name", Value(" output power"), Value("")),
-                    ),
-                    default="name",
-                )
-            )
-            .order_by("label")
-        )
-
-        # read information about the optimized capacity
-        qs2 = (
-            FancyResults.objects.filter(simulation=simulation)
-            .exclude((Q(oemof_type="storage") & Q(direction="out")) | Q(asset_type="capacity"))
-            .annotate(label=Case(default="asset"))
-            .filter(
-                # label__in=qs1.values_list("label", flat=True),
-                label__in=temp,
-                optimized_capacity__isnull=False,
-            )
-            .order_by("label")
-        )
-
-        ic = {item[0]: item[1] for item in qs1.filter(label__in=temp).values_list("label", "installed_capacity")}
-        oc = {item[0]: item[1] for item in qs2.filter(label__in=temp).values_list("label", "optimized_capacity")}
+        ic = installed_capacities[sim_id].dropna().to_dict()
+        oc = optimized_capacities[sim_id].dropna().to_dict()
 
         for asset_name in temp:
-            if asset_name in ic:
-                installed_cap = ic[asset_name]
-            else:
-                installed_cap = 0
-
-            if asset_name in oc:
-                optimized_cap = oc[asset_name]
-            else:
-                optimized_cap = 0
+            installed_cap = ic.get(asset_name, 0)
+            optimized_cap = oc.get(asset_name, 0)
 
             if optimized_cap + installed_cap > 0:
                 x_values.append(asset_name)
@@ -1216,8 +1249,8 @@ def graph_capacities(simulations, y_variables):
 
         simulations_results.append(
             simulation_timeseries_to_json(
-                scenario_name=simulation.scenario.name,
-                scenario_id=simulation.scenario.id,
+                scenario_name=scen_name,
+                scenario_id=scen_id,
                 scenario_timeseries=y_values,
                 scenario_timestamps=x_values,
             )
@@ -1225,69 +1258,78 @@ def graph_capacities(simulations, y_variables):
     return simulations_results
 
 
-def get_costs(simulation, y_variables=None):
-    if y_variables is None:
-        y_variables = (
-            Asset.objects.filter(scenario=simulation.scenario)
-            .filter(installed_capacity__isnull=False)
-            .annotate(label=Case(default="name"))
-            .order_by("label")
-            .distinct()
-            .values_list("label", flat=True)
-        )
-    # read information about the installed capacity
-    qs1 = Asset.objects.filter(scenario__simulation=simulation).annotate(label=Case(default="name")).order_by("label")
-
-    # read information about the optimized capacity
-    qs2 = (
-        FancyResults.objects.filter(simulation=simulation)
-        .annotate(
-            label=Case(
-                When(
-                    Q(oemof_type="storage") & Q(direction="out"),
-                    then=Concat("asset", Value(" input power")),
-                ),
-                When(
-                    Q(oemof_type="storage") & Q(direction="in"),
-                    then=Concat("asset", Value(" output power")),
-                ),
-                When(
-                    Q(oemof_type="storage") & Q(asset_type="capacity"),
-                    then=Concat("asset", Value(" capacity")),
-                ),
-                default="asset",
-            )
+def cost_label(oemof_type, direction, asset_type, asset):
+    """Label of a flow matched with the assets in the costs tables"""
+    if oemof_type == "storage" and direction == "out":
+        return f"{asset} input power"
+    if oemof_type == "storage" and direction == "in":
+        return f"{asset} output power"
+    if oemof_type == "storage" and asset_type == "capacity":
+        return f"{asset} capacity"
+    return asset
+
+
+def cost_records(simulations, y_variables=None):
+    """Return the cost parameters of the assets of the simulations, together with their optimized capacity and flow
+
+    The assets and the flows of all the simulations are read with one query each.
+
+    :return: dict {simulation id: list of records (dicts)}
+    """
+    sim_ids = [simulation.id for simulation in simulations]
+    assets = list(
+        Asset.objects.filter(scenario__simulation__id__in=sim_ids)
+        .order_by("name")
+        .values(
+            "scenario__simulation__id",
+            "name",
+            "installed_capacity",
+            "capex_fix",
+            "capex_var",
+            "opex_fix",
+            "opex_var",
+            "opex_var_extra",
+            "lifetime",
+            "energy_price",
+            "parent_asset__name",
         )
-        .order_by("label")
-    )
-
-    qs1 = qs1.filter(label__in=y_variables).values(
-        "label",
-        "installed_capacity",
-        "capex_fix",
-        "capex_var",
-        "opex_fix",
-        "opex_var",
-        "opex_var_extra",
-        "lifetime",
-        "energy_price",
-        "parent_asset__name",
     )
+    flows = {}
+    for flow in FancyResults.objects.filter(simulation_id__in=sim_ids).values(
+        "simulation_id", "asset", "asset_type", "oemof_type", "direction", "optimized_capacity", "total_flow"
+    ):
+        label = cost_label(flow["oemof_type"], flow["direction"], flow["asset_type"], flow["asset"])
+        flows.setdefault((flow["simulation_id"], label), []).append(flow)
 
-    records = []
-    for el in qs1:
-        qs_asset_results = qs2.filter(label=el["label"].lower())
-        if qs_asset_results.count() == 1:
-            el.update(qs_asset_results.values("optimized_capacity", "total_flow", "direction").get())
-        elif qs_asset_results.count() > 1:
-            qs_asset_results = qs_asset_results.filter(optimized_capacity__isnull=False)
-            if qs_asset_results.count() == 1:
-                el.update(qs_asset_results.values("optimized_capacity", "total_flow", "direction").get())
-            elif qs_asset_results.count() > 1:
+    if y_variables is None:
+        labels = {}
+        for asset in assets:
+            if asset["installed_capacity"] is not None:
+                labels.setdefault(asset["scenario__simulation__id"], set()).add(asset["name"])
+    records = {sim_id: [] for sim_id in sim_ids}
+    for asset in assets:
+        sim_id = asset.pop("scenario__simulation__id")
+        label = asset.pop("name")
+        if label not in (labels.get(sim_id, ()) if y_variables is None else y_variables):
+            continue
+        el = {"label": label, **asset}
+        asset_results = flows.get((sim_id, label.lower()), [])
+        if len(asset_results) > 1:
+            asset_results = [flow for flow in asset_results if flow["optimized_capacity"] is not None]
+            if len(asset_results) > 1:
                 raise ValueError("should not have too much labels")
-        records.append(el)
+        if len(asset_results) == 1:
+            el.update({key: asset_results[0][key] for key in ("optimized_capacity", "total_flow", "direction")})
+        records[sim_id].append(el)
+    return records
 
-    wacc = simulation.scenario.project.economic_data.discount
+
+def costs_from_records(records, economic_data):
+    """Compute the costs of each asset from its cost records (see cost_records)
+
+    :param economic_data: dict with the "discount", "duration" and "exchange_rate" of the project
+    """
+    wacc = economic_data["discount"]
     df = pd.DataFrame.from_records(records)
 
     # assign optimized capacity to storage components
@@ -1312,7 +1354,7 @@ def get_costs(simulation, y_variables=None):
         / ((1 + wacc) ** x.lifetime - 1),
         axis=1,
     )
-    project_duration = simulation.scenario.project.economic_data.duration
+    project_duration = economic_data["duration"]
     df["capex_initial"] = df.apply(lambda x: x.optimized_capacity * x.capex_var, axis=1)
     df["capex_replacement"] = df.apply(
         lambda x: x.optimized_capacity * x.capex_var * int(project_duration / x.lifetime)
@@ -1352,14 +1394,38 @@ def get_costs(simulation, y_variables=None):
     df.drop(columns=["parent_asset__name"], inplace=True)
 
     # multiply by exchange rate, since costs are saved in USD in database
-    exchange_rate = simulation.scenario.project.economic_data.exchange_rate
+    exchange_rate = economic_data["exchange_rate"]
 
     # drop dataframe rows where all values are 0 (can happen for inverter in diesel only scenario)
     df = df.loc[~(df == 0).all(axis=1)]
     return df * exchange_rate
 
 
+def get_costs_of_simulations(simulations, y_variables=None):
+    """Return the costs of the assets of each simulation, with a fixed number of queries
+
+    :return: dict {simulation id: DataFrame of the costs, see get_costs}
+    """
+    simulations = list(simulations)
+    records = cost_records(simulations, y_variables)
+    economic_data = {
+        sim_id: {"discount": discount, "duration": duration, "exchange_rate": exchange_rate}
+        for sim_id, discount, duration, exchange_rate in Simulation.objects.filter(id__in=records.keys()).values_list(
+            "id",
+            "scenario__project__economic_data__discount",
+            "scenario__project__economic_data__duration",
+            "scenario__project__economic_data__exchange_rate",
+        )
+    }
+    return {sim_id: costs_from_records(records[sim_id], economic_data[sim_id]) for sim_id in records}
+
+
+def get_costs(simulation, y_variables=None):
+    return get_costs_of_simulations([simulation], y_variables)[simulation.id]
+
+
 def graph_costs(simulations, y_variables=None, arrangement=COSTS_PER_CATEGORY):  # COSTS_PER_CATEGORY
+    simulations = list(simulations)
     simulations_results = []
     multi_scenario = False
     if len(simulations) > 1:
@@ -1369,8 +1435,18 @@ def graph_costs(simulations, y_variables=None, arrangement=COSTS_PER_CATEGORY):
         x_values = [x for x in Scenario.objects.filter(simulation__in=simulations).values_list("name", flat=True)]
         y_values = []
 
+    # the costs of all simulations are computed from the same queries
+    scenarios = {
+        sim_id: (scen_id, scen_name)
+        for sim_id, scen_id, scen_name in Simulation.objects.filter(
+            id__in=[simulation.id for simulation in simulations]
+        ).values_list("id", "scenario__id", "scenario__name")
+    }
+    costs = get_costs_of_simulations(simulations, y_variables)
+
     for simulation in simulations:
-        df = get_costs(simulation, y_variables)
+        scen_id, scen_name = scenarios[simulation.id]
+        df = costs[simulation.id]
         df.drop(columns=["capex_initial", "capex_replacement"], inplace=True)
 
         if arrangement == COSTS_PER_ASSETS:
@@ -1384,7 +1460,7 @@ def graph_costs(simulations, y_variables=None, arrangement=COSTS_PER_CATEGORY):
                         "base": df.iloc[:, :i].sum(axis=1).values.tolist() if i > 0 else None,
                         "value": y,
                         "text": [name for j in range(len(x_values))],
-                        "name": name if multi_scenario is False else name + f" {simulation.scenario.name}",
+                        "name": name if multi_scenario is False else name + f" {scen_name}",
                         "hover": "<b>%{text}, </b><br><br>Block value: %{customdata:.2f}$<br>Stacked value: %{y:.2f}$<extra> %{x}</extra>",
                         "customdata": y
                         # https://stackoverflow.com/questions/59057881/python-plotly-how-to-customize-hover-template-on-with-what-information-to-show
@@ -1402,7 +1478,7 @@ def graph_costs(simulations, y_variables=None, arrangement=COSTS_PER_CATEGORY):
                         "base": df.iloc[:i, :].sum(axis=0).values.tolist() if i > 0 else None,
                         "value": y,
                         "text": [name for j in range(len(x_values))],
-                        "name": name if multi_scenario is False else name + f" {simulation.scenario.name}",
+                        "name": name if multi_scenario is False else name + f" {scen_name}",
                         "hover": "<b>%{text}</b><br><br>Block value: %{customdata:.2f}$<br>Stacked value: %{y:.2f}$",
                         "customdata": y,
                     }
@@ -1416,8 +1492,8 @@ def graph_costs(simulations, y_variables=None, arrangement=COSTS_PER_CATEGORY):
         if arrangement in [COSTS_PER_ASSETS, COSTS_PER_CATEGORY]:
             simulations_results.append(
                 simulation_timeseries_to_json(
-                    scenario_name=simulation.scenario.name,
-                    scenario_id=simulation.scenario.id,
+                    scenario_name=scen_name,
+                    scenario_id=scen_id,
                     scenario_timeseries=y_values,
                     scenario_timestamps=x_values,
                 )
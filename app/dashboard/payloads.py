@@ -0,0 +1,158 @@
+"""Compressed and cached JSON responses of the graph endpoints
+
+The graphs and tables of the results pages are JSON payloads of up to several MB, which used to be rebuilt, serialized
+and sent uncompressed on each visit. The payload of a graph only depends on the simulations it displays (and on a few
+parameters of the request), it never changes once the simulations are finished. Such a payload is therefore
+serialized once, stored gzip (and brotli, if the brotli package is installed) compressed in the shared cache under a
+key versioned by the simulations (see projects.caching) and served as it is stored, with a strong ETag so that the
+browser revalidates its copy with a 304 response instead of downloading it again.
+
+The payloads are serialized with orjson, which natively serializes the NumPy arrays, if it is installed, and with the
+standard json module otherwise.
+"""
+
+import gzip
+import hashlib
+import json
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags
+from django.utils.translation import get_language
+
+from projects.caching import NumpyJSONEncoder, get_or_set, object_version
+from projects.constants import DONE
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# payloads smaller than this (in bytes) are not worth compressing
+MIN_COMPRESS_SIZE = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 9
+# content codings by order of preference
+ENCODINGS = ("br", "gzip")
+IDENTITY = "identity"
+
+
+def dumps(data):
+    """Serialize data to JSON bytes, NumPy arrays and scalars included, NaN being serialized as null with orjson"""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=NumpyJSONEncoder().default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(data, cls=NumpyJSONEncoder).encode("utf-8")
+
+
+def build_payload(data):
+    """Serialize and compress data
+
+    :return: dict with the "etag" of the payload and its "bodies", one per available content coding
+    """
+    body = dumps(data)
+    payload = {"etag": hashlib.sha256(body).hexdigest()[:32], "bodies": {}}
+    if len(body) < MIN_COMPRESS_SIZE:
+        payload["bodies"][IDENTITY] = body
+        return payload
+    # the uncompressed body is not stored, it is only requested by clients not accepting gzip
+    payload["bodies"]["gzip"] = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    if brotli is not None:
+        payload["bodies"]["br"] = brotli.compress(body, quality=BROTLI_QUALITY)
+    return payload
+
+
+def accepted_encoding(request, bodies):
+    """Return the preferred content coding of the payload accepted by the client"""
+    accepted = {}
+    for coding in request.headers.get("Accept-Encoding", "").split(","):
+        name, _, params = coding.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for encoding in ENCODINGS:
+        if encoding in bodies and accepted.get(encoding, 0) > 0:
+            return encoding
+    return IDENTITY
+
+
+def payload_body(payload, encoding):
+    bodies = payload["bodies"]
+    if encoding in bodies:
+        return bodies[encoding]
+    if IDENTITY in bodies:
+        return bodies[IDENTITY]
+    return gzip.decompress(bodies["gzip"])
+
+
+def payload_response(request, payload, status=200, cacheable=True):
+    """Return the response sending the payload in the content coding preferred by the client
+
+    :param cacheable: if True, the response has a strong ETag and is answered with 304 if the client already has it
+    """
+    encoding = accepted_encoding(request, payload["bodies"])
+    # each content coding is a different representation of the payload and has its own ETag
+    etag = f'"{payload["etag"]}"' if encoding == IDENTITY else f'"{payload["etag"]}-{encoding}"'
+
+    if cacheable is True and status == 200:
+        known_etags = parse_etags(request.headers.get("If-None-Match", ""))
+        if etag in known_etags or "*" in known_etags:
+            response = HttpResponseNotModified()
+            response["ETag"] = etag
+            patch_cache_control(response, private=True, max_age=settings.GRAPH_PAYLOAD_MAX_AGE)
+            patch_vary_headers(response, ("Accept-Encoding",))
+            return response
+
+    response = HttpResponse(payload_body(payload, encoding), status=status, content_type="application/json")
+    if encoding != IDENTITY:
+        response["Content-Encoding"] = encoding
+    patch_vary_headers(response, ("Accept-Encoding",))
+    if cacheable is True and status == 200:
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, max_age=settings.GRAPH_PAYLOAD_MAX_AGE)
+    else:
+        patch_cache_control(response, no_store=True)
+    return response
+
+
+def json_payload_response(request, data, status=200):
+    """Compressed counterpart of JsonResponse for payloads which are not cached"""
+    return payload_response(request, build_payload(data), status=status, cacheable=False)
+
+
+def graph_payload_key(graph, simulations, *parts):
+    versions = [object_version(simulation) for simulation in simulations]
+    digest = hashlib.sha256(json.dumps([versions, get_language(), parts], default=str).encode("utf-8")).hexdigest()
+    return f"graph_payload:{graph}:{digest[:32]}"
+
+
+def graph_payload_response(request, graph, simulations, build, *parts):
+    """Return the response of a graph of the given simulations, the payload being built only once they are finished
+
+    :param graph: name of the graph
+    :param simulations: Simulation instances displayed in the graph, in the order in which they are displayed
+    :param build: function without arguments returning the data of the graph
+    :param parts: other parameters of the request the graph depends on
+    """
+    if len(simulations) == 0 or any(simulation.status != DONE for simulation in simulations):
+        # the results of a pending simulation are not final yet
+        return json_payload_response(request, build())
+    payload = get_or_set(
+        graph_payload_key(graph, simulations, *parts),
+        lambda: build_payload(build()),
+        timeout=settings.GRAPH_PAYLOAD_CACHE_TIMEOUT,
+    )
+    return payload_response(request, payload)
@@ -1,12 +1,16 @@
+from datetime import datetime
 from django.test import TestCase
+from django.urls import reverse
 
 # import uuid
 # from .models import Project, Simulation
 # from io import BytesIO
 # from django.urls import reverse
 from dashboard.models import SensitivityAnalysis
-from dashboard.helpers import dict_keyword_mapper, nested_dict_crawler, KPIFinder
-from projects.models import Asset
+from dashboard.helpers import dict_keyword_mapper, nested_dict_crawler, KPIFinder, fetch_user_projects_page
+from projects.constants import DONE
+from projects.models import Asset, Project, Scenario, Simulation, Viewer
+from users.models import CustomUser
 
 # class SimulationServiceTest(TestCase):
 #    fixtures = ['fixtures/benchmarks_fixture.json',]
@@ -105,3 +109,68 @@ class TestKPIFinder(TestCase):
 
     def test_kpi_finder_finds_doubled_path(self):
         self.assertEqual(self.kpis.get("b11"), [("b", "b1", "b11"), ("c", "b1", "b11")])
+
+
+class TestProjectListing(TestCase):
+    fixtures = ["fixtures/benchmarks_fixture.json", "fixtures/test_users.json"]
+
+    def setUp(self):
+        self.user = CustomUser.objects.get(username="testUser")
+        self.other_user = CustomUser.objects.get(username="testUser2")
+        for i in range(5):
+            project = Project.objects.create(
+                name=f"Village {i}", description="", country="NIGERIA", latitude=9, longitude=8, user=self.user
+            )
+            Scenario.objects.create(
+                name="scenario", project=project, start_date=datetime(2023, 1, 1), time_step=60, evaluated_period=7
+            )
+        self.shared_project = Project.objects.create(
+            name="Shared village", description="", country="NIGERIA", latitude=9, longitude=8, user=self.other_user
+        )
+        self.shared_project.viewers.add(Viewer.objects.create(user=self.user, share_rights="read"))
+        Project.objects.create(
+            name="Private village", description="", country="NIGERIA", latitude=9, longitude=8, user=self.other_user
+        )
+
+    def test_pages_cover_all_projects_once(self):
+        ids = []
+        cursor = None
+        pages = 0
+        while True:
+            projects, cursor = fetch_user_projects_page(self.user, cursor=cursor, page_size=3)
+            ids += [project.id for project in projects]
+            pages += 1
+            if cursor is None:
+                break
+        self.assertEqual(pages, 3)
+        expected = Project.objects.exclude(name="Private village").order_by("-date_created", "-pk")
+        self.assertEqual(ids, list(expected.values_list("id", flat=True)))
+
+    def test_projects_are_annotated(self):
+        with self.assertNumQueries(1):
+            projects, _ = fetch_user_projects_page(self.user)
+            projects = {project.name: project for project in projects}
+            project = projects["Benchmark test for simple case electricity bus"]
+            self.assertEqual(project.simulation_status, DONE)
+            self.assertTrue(project.has_results)
+            self.assertTrue(project.can_edit)
+            self.assertFalse(project.shared)
+            self.assertEqual(project.user.email, self.user.email)
+
+            self.assertIsNone(projects["Village 0"].simulation_status)
+            shared = projects["Shared village"]
+            self.assertTrue(shared.shared)
+            self.assertEqual(shared.share_rights, "read")
+            self.assertFalse(shared.can_edit)
+        self.assertEqual(projects["Village 0"].latest_scenario_id, projects["Village 0"].scenario.id)
+
+    def test_search_filters_projects(self):
+        projects, cursor = fetch_user_projects_page(self.user, search="village 3")
+        self.assertEqual([project.name for project in projects], ["Village 3"])
+        self.assertIsNone(cursor)
+
+    def test_project_list_view(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("projects_list_cpn"), {"q": "village"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["project_list"]), 6)
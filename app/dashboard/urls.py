@@ -158,6 +158,11 @@ urlpatterns = [
         request_financial_kpi_table,
         name="request_financial_kpi_table",
     ),
+    re_path(
+        r"^scenario/results/request_financial_outputs/(?P<scen_id>\d+)?$",
+        request_financial_outputs,
+        name="request_financial_outputs",
+    ),
     path(
         "scenario/results/download_scalars/<int:scen_id>",
         download_scalar_results,
@@ -6,6 +6,8 @@ from django.db.models import Count, Value, F, Q, Case, When
 from django.db.models.functions import Concat, Replace
 from django.http.response import Http404, HttpResponse
 from dashboard.helpers import *
+from dashboard.comparison import ScenarioComparison, table_row_values
+from dashboard.payloads import graph_payload_response
 from dashboard.models import (
     AssetsResults,
     KPICostsMatrixResults,
@@ -63,11 +65,13 @@ from io import BytesIO
 import xlsxwriter
 import json
 import datetime
+from django.conf import settings
+from projects.time_index import time_index
 import logging
 import traceback
 from projects.helpers import parameters_helper
 from cp_nigeria.helpers import (
-    FinancialTool,
+    get_financial_tool,
     get_project_summary,
     get_aggregated_cgs,
     set_outputs_table_format,
@@ -584,51 +588,65 @@ def request_kpi_table(request, proj_id=None):
 
     if compare_scen is not None:
         selected_scenarios = [compare_scen]
-    kpis = {}
-    scen_names = []
-    for scenario_id in selected_scenarios:
-        scenario = get_object_or_404(Scenario, pk=scenario_id)
-        scen_names.append(scenario.name)
-        kpi_scalar_results_obj = KPIScalarResults.objects.get(simulation=scenario.simulation)
-        kpi_scalar_results_dict = json.loads(kpi_scalar_results_obj.scalar_values)
-        kpis[scenario_id] = kpi_scalar_results_dict
+    # the KPIs of all the selected scenarios are loaded at once
+    comparison = ScenarioComparison.from_scenarios(selected_scenarios)
+    if len(comparison) == 0:
+        raise Http404("No simulation results for the selected scenarios")
+    selected_simulations = comparison.simulation_ids
+    simulations = sorted(
+        Simulation.objects.filter(id__in=selected_simulations), key=lambda sim: selected_simulations.index(sim.id)
+    )
 
-    proj = get_object_or_404(Project, id=scenario.project.id)
-    unit_conv = {"currency": proj.economic_data.currency, "Faktor": "%"}
+    proj = get_object_or_404(Project.objects.select_related("economic_data"), id=comparison.project_ids[0])
+    currency = proj.economic_data.currency
+    unit_conv = {"currency": currency, "Faktor": "%"}
     table = TABLES.get("management", None)
 
-    # do some unit substitution
-    for l in table.values():
-        for e in l:
-            if e["unit"] in unit_conv:
-                sub = unit_conv[e["unit"]]
-                e["unit"] = sub
+    if table is None:
+        allowed_styles = ", ".join(TABLES.keys())
+        return JsonResponse(
+            {"error": f"The kpi table sytle {table_style} is not implemented. Please try one of {allowed_styles}"},
+            status=404,
+            content_type="application/json",
+        )
+
+    def build_table():
+        kpis = comparison.kpi_dicts
+        multi_scenario = len(comparison) > 1
+        if multi_scenario is True:
+            kpi_deltas = comparison.deltas(comparison.kpis)
+            kpi_relative_deltas = comparison.relative_deltas(comparison.kpis)
+            kpi_ranks = comparison.rankings(comparison.kpis)
+
+        # do some unit substitution
+        for l in table.values():
+            for e in l:
+                if e["unit"] in unit_conv:
+                    sub = unit_conv[e["unit"]]
+                    e["unit"] = sub
 
-    if table is not None:
         for subtable_title, subtable_content in table.items():
             for param in subtable_content:
                 param["scen_values"] = [
-                    round_only_numbers(kpis[scen_id].get(param["id"], "not implemented yet"), 2)
-                    for scen_id in selected_scenarios
+                    round_only_numbers(kpis[sim_id].get(param["id"], "not implemented yet"), 2)
+                    for sim_id in selected_simulations
                 ]
+                if multi_scenario is True:
+                    # differences to the first selected scenario and rank of each scenario (1 for the lowest value)
+                    param["scen_deltas"] = table_row_values(kpi_deltas, param["id"])
+                    param["scen_relative_deltas"] = table_row_values(kpi_relative_deltas, param["id"], decimals=4)
+                    param["scen_ranks"] = table_row_values(kpi_ranks, param["id"], decimals=None)
+                else:
+                    # the rows of the table are shared by the requests
+                    param.pop("scen_deltas", None)
+                    param.pop("scen_relative_deltas", None)
+                    param.pop("scen_ranks", None)
                 param["description"] = KPI_helper.get_doc_definition(param["id"])
                 if "currency" in param["unit"]:
-                    param["unit"] = param["unit"].replace("currency", scenario.get_currency())
-        answer = JsonResponse(
-            {"data": table, "hdrs": ["Indicator"] + scen_names},
-            status=200,
-            content_type="application/json",
-        )
-
-    else:
-        allowed_styles = ", ".join(TABLES.keys())
-        answer = JsonResponse(
-            {"error": f"The kpi table sytle {table_style} is not implemented. Please try one of {allowed_styles}"},
-            status=404,
-            content_type="application/json",
-        )
+                    param["unit"] = param["unit"].replace("currency", currency)
+        return {"data": table, "hdrs": ["Indicator"] + comparison.scenario_names}
 
-    return answer
+    return graph_payload_response(request, "kpi_table", simulations, build_table, currency)
 
 
 @login_required
@@ -926,14 +944,17 @@ def scenario_visualize_timeseries(request, proj_id=None, scen_id=None):
             raise PermissionDenied
         simulations.append(scenario.simulation)
 
-    results_json = report_item_render_to_json(
-        report_item_id="all_timeseries",
-        data=REPORT_GRAPHS[GRAPH_TIMESERIES](simulations=simulations),
-        title="",
-        report_item_type=GRAPH_TIMESERIES,
-    )
+    compact_time_axis = request.GET.get("time_axis") == "compact"
+
+    def build_graph():
+        return report_item_render_to_json(
+            report_item_id="all_timeseries",
+            data=REPORT_GRAPHS[GRAPH_TIMESERIES](simulations=simulations, compact_time_axis=compact_time_axis),
+            title="",
+            report_item_type=GRAPH_TIMESERIES,
+        )
 
-    return JsonResponse(results_json, status=200, content_type="application/json", safe=False)
+    return graph_payload_response(request, GRAPH_TIMESERIES, simulations, build_graph, compact_time_axis)
 
 
 def scenario_visualize_stacked_timeseries(request, scen_id):
@@ -943,22 +964,29 @@ def scenario_visualize_stacked_timeseries(request, scen_id):
     ):
         raise PermissionDenied
 
-    results_json = []
-    for energy_vector in scenario.energy_vectors:
-        results_json.append(
-            report_item_render_to_json(
-                report_item_id=energy_vector,
-                data=REPORT_GRAPHS[GRAPH_TIMESERIES_STACKED](
-                    simulations=[scenario.simulation],
-                    y_variables=None,
-                    energy_vector=energy_vector,
-                ),
-                title=energy_vector,
-                report_item_type=GRAPH_TIMESERIES_STACKED,
+    compact_time_axis = request.GET.get("time_axis") == "compact"
+
+    def build_graph():
+        results_json = []
+        for energy_vector in scenario.energy_vectors:
+            results_json.append(
+                report_item_render_to_json(
+                    report_item_id=energy_vector,
+                    data=REPORT_GRAPHS[GRAPH_TIMESERIES_STACKED](
+                        simulations=[scenario.simulation],
+                        y_variables=None,
+                        energy_vector=energy_vector,
+                        compact_time_axis=compact_time_axis,
+                    ),
+                    title=energy_vector,
+                    report_item_type=GRAPH_TIMESERIES_STACKED,
+                )
             )
-        )
+        return results_json
 
-    return JsonResponse(results_json, status=200, content_type="application/json", safe=False)
+    return graph_payload_response(
+        request, GRAPH_TIMESERIES_STACKED, [scenario.simulation], build_graph, compact_time_axis
+    )
 
 
 def scenario_visualize_cpn_stacked_timeseries(request, scen_id):
@@ -968,54 +996,62 @@ def scenario_visualize_cpn_stacked_timeseries(request, scen_id):
     ):
         raise PermissionDenied
 
-    results_json = []
-    for energy_vector in ["Electricity"]:  # scenario.energy_vectors
-        results_json.append(
-            report_item_render_to_json(
-                report_item_id=energy_vector,
-                data=REPORT_GRAPHS[GRAPH_TIMESERIES_STACKED_CPN](
-                    simulations=[scenario.simulation],
-                    y_variables=None,
-                    energy_vector=energy_vector,
-                ),
-                title=energy_vector,
-                report_item_type=GRAPH_TIMESERIES_STACKED_CPN,
+    compact_time_axis = request.GET.get("time_axis") == "compact"
+
+    def build_graph():
+        results_json = []
+        for energy_vector in ["Electricity"]:  # scenario.energy_vectors
+            results_json.append(
+                report_item_render_to_json(
+                    report_item_id=energy_vector,
+                    data=REPORT_GRAPHS[GRAPH_TIMESERIES_STACKED_CPN](
+                        simulations=[scenario.simulation],
+                        y_variables=None,
+                        energy_vector=energy_vector,
+                        compact_time_axis=compact_time_axis,
+                    ),
+                    title=energy_vector,
+                    report_item_type=GRAPH_TIMESERIES_STACKED_CPN,
+                )
             )
-        )
 
-    color_mapping = {
-        "pv_plant_flow": "#F2CD5D",
-        "battery_flow": "#12AB6D",
-        "battery_charge_flow": "#12AB6D",
-        "battery_discharge_flow": "#71D0A1",
-        "total_demand_flow": "#A69F99",
-        "fulfilled_demand_flow": "#716A64",
-        "electricity_demand_flow": "#716A64",
-        "diesel_generator_flow": "#814400",
-        "diesel_fuel_consumption_flow": "#814400",
-        "excess_flow": "#EA9822",
-        "ac_bus_excess_flow": "#EA9822",
-        "dc_bus_excess_flow": "#EA9822",
-    }
+        color_mapping = {
+            "pv_plant_flow": "#F2CD5D",
+            "battery_flow": "#12AB6D",
+            "battery_charge_flow": "#12AB6D",
+            "battery_discharge_flow": "#71D0A1",
+            "total_demand_flow": "#A69F99",
+            "fulfilled_demand_flow": "#716A64",
+            "electricity_demand_flow": "#716A64",
+            "diesel_generator_flow": "#814400",
+            "diesel_fuel_consumption_flow": "#814400",
+            "excess_flow": "#EA9822",
+            "ac_bus_excess_flow": "#EA9822",
+            "dc_bus_excess_flow": "#EA9822",
+        }
 
-    timeseries_labels = [
-        f"{ts['label']}_flow" for i in range(len(results_json)) for ts in results_json[i]["data"][0]["timeseries"]
-    ]
+        timeseries_labels = [
+            f"{ts['label']}_flow" for i in range(len(results_json)) for ts in results_json[i]["data"][0]["timeseries"]
+        ]
 
-    descriptions = {
-        param: {
-            "verbose": OUTPUT_PARAMS[param]["verbose"] if param in OUTPUT_PARAMS else param,
-            "description": OUTPUT_PARAMS[param]["description"] if param in OUTPUT_PARAMS else "bla",
-            "line": {"shape": "hv", "dash": "dash" if param == "total_demand_flow" else "solid"},
-            "color": color_mapping[param],
+        descriptions = {
+            param: {
+                "verbose": OUTPUT_PARAMS[param]["verbose"] if param in OUTPUT_PARAMS else param,
+                "description": OUTPUT_PARAMS[param]["description"] if param in OUTPUT_PARAMS else "bla",
+                "line": {"shape": "hv", "dash": "dash" if param == "total_demand_flow" else "solid"},
+                "color": color_mapping[param],
+            }
+            for param in timeseries_labels
         }
-        for param in timeseries_labels
-    }
 
-    for scenario in results_json:
-        scenario["descriptions"] = descriptions
+        for scenario_json in results_json:
+            scenario_json["descriptions"] = descriptions
+
+        return results_json
 
-    return JsonResponse(results_json, status=200, content_type="application/json", safe=False)
+    return graph_payload_response(
+        request, GRAPH_TIMESERIES_STACKED_CPN, [scenario.simulation], build_graph, compact_time_axis
+    )
 
 
 # TODO exclude sink components
@@ -1035,25 +1071,27 @@ def scenario_visualize_capacities(request, proj_id, scen_id=None):
             raise PermissionDenied
         simulations.append(scenario.simulation)
 
-    results_json = report_item_render_to_json(
-        report_item_id="capacities",
-        data=REPORT_GRAPHS[GRAPH_CAPACITIES](simulations=simulations, y_variables=None),
-        title="",
-        report_item_type=GRAPH_CAPACITIES,
-    )
+    def build_graph():
+        results_json = report_item_render_to_json(
+            report_item_id="capacities",
+            data=REPORT_GRAPHS[GRAPH_CAPACITIES](simulations=simulations, y_variables=None),
+            title="",
+            report_item_type=GRAPH_CAPACITIES,
+        )
 
-    descriptions = {
-        OUTPUT_PARAMS[param]["verbose"]: OUTPUT_PARAMS[param]["description"]
-        for param in OUTPUT_PARAMS
-        if "_capacity" in param
-    }
+        descriptions = {
+            OUTPUT_PARAMS[param]["verbose"]: OUTPUT_PARAMS[param]["description"]
+            for param in OUTPUT_PARAMS
+            if "_capacity" in param
+        }
 
-    results_json["descriptions"] = descriptions
-    results_json["data"][0]["timestamps"] = [
-        OUTPUT_PARAMS[asset]["verbose"] for asset in results_json["data"][0]["timestamps"]
-    ]
+        results_json["descriptions"] = descriptions
+        results_json["data"][0]["timestamps"] = [
+            OUTPUT_PARAMS[asset]["verbose"] for asset in results_json["data"][0]["timestamps"]
+        ]
+        return results_json
 
-    return JsonResponse(results_json, status=200, content_type="application/json", safe=False)
+    return graph_payload_response(request, GRAPH_CAPACITIES, simulations, build_graph)
 
 
 def scenario_visualize_costs(request, proj_id, scen_id=None):
@@ -1072,18 +1110,20 @@ def scenario_visualize_costs(request, proj_id, scen_id=None):
             raise PermissionDenied
         simulations.append(scenario.simulation)
 
-    results_json = []
-    for arrangement in [COSTS_PER_ASSETS]:
-        results_json.append(
-            report_item_render_to_json(
-                report_item_id=arrangement,
-                data=REPORT_GRAPHS[GRAPH_COSTS](simulations=simulations, y_variables=None, arrangement=arrangement),
-                title=arrangement,
-                report_item_type=GRAPH_COSTS,
+    def build_graph():
+        results_json = []
+        for arrangement in [COSTS_PER_ASSETS]:
+            results_json.append(
+                report_item_render_to_json(
+                    report_item_id=arrangement,
+                    data=REPORT_GRAPHS[GRAPH_COSTS](simulations=simulations, y_variables=None, arrangement=arrangement),
+                    title=arrangement,
+                    report_item_type=GRAPH_COSTS,
+                )
             )
-        )
+        return results_json
 
-    return JsonResponse(results_json, status=200, content_type="application/json", safe=False)
+    return graph_payload_response(request, GRAPH_COSTS, simulations, build_graph)
 
 
 # TODO: Sector coupling must be refined (including transformer flows)
@@ -1095,23 +1135,21 @@ def scenario_visualize_sankey(request, scen_id, ts=None):
         raise PermissionDenied
     if ts is not None:
         ts = int(ts)
-    results_json = report_item_render_to_json(
-        report_item_id="sankey",
-        data=REPORT_GRAPHS[GRAPH_SANKEY](
-            simulation=scenario.simulation, energy_vector=scenario.energy_vectors, timestep=ts
-        ),
-        title="Sankey",
-        report_item_type=GRAPH_SANKEY,
-    )
 
-    return JsonResponse(results_json, status=200, content_type="application/json", safe=False)
+    def build_graph():
+        return report_item_render_to_json(
+            report_item_id="sankey",
+            data=REPORT_GRAPHS[GRAPH_SANKEY](
+                simulation=scenario.simulation, energy_vector=scenario.energy_vectors, timestep=ts
+            ),
+            title="Sankey",
+            report_item_type=GRAPH_SANKEY,
+        )
 
+    return graph_payload_response(request, GRAPH_SANKEY, [scenario.simulation], build_graph, ts)
 
-def scenario_visualize_cash_flow(request, scen_id):
-    scenario = get_object_or_404(Scenario, pk=scen_id)
 
-    # Initialize financial tool to calculate financial flows and test output graphs
-    ft = FinancialTool(scenario.project)
+def financial_cash_flow_graph(ft):
     initial_loan = ft.initial_loan_table
     replacement_loan = ft.replacement_loan_table
     revenue = ft.revenue_over_lifetime
@@ -1136,14 +1174,10 @@ def scenario_visualize_cash_flow(request, scen_id):
     for trace in graph_contents:
         graph_contents[trace]["description"] = OUTPUT_PARAMS[trace]["description"]
 
-    return JsonResponse({"x": x, "graph_contents": graph_contents, "title": title})
+    return {"x": x, "graph_contents": graph_contents, "title": title}
 
 
-def scenario_visualize_revenue(request, scen_id):
-    scenario = get_object_or_404(Scenario, pk=scen_id)
-
-    # Initialize financial tool to calculate financial flows and test output graphs
-    ft = FinancialTool(scenario.project)
+def financial_revenue_graph(ft):
     revenue = ft.revenue_over_lifetime
     costs = ft.om_costs_over_lifetime
 
@@ -1160,14 +1194,10 @@ def scenario_visualize_revenue(request, scen_id):
         graph_contents[trace].update(set_outputs_table_format(trace, ft.currency_symbol))
 
     title = "Operating revenues"
-    return JsonResponse({"x": x, "graph_contents": graph_contents, "title": title})
+    return {"x": x, "graph_contents": graph_contents, "title": title}
 
 
-def scenario_visualize_system_costs(request, scen_id):
-    save_to_db = True if request.GET.get("save_to_db") == "true" else False
-    scenario = get_object_or_404(Scenario, pk=scen_id)
-    # Initialize financial tool to get system costs for graph
-    ft = FinancialTool(scenario.project)
+def financial_system_costs_table(scenario, ft, save_to_db=False):
     system_costs = ft.system_params[
         ft.system_params["category"].isin(["capex_initial", "opex_total", "fuel_costs_total"])
     ].copy()
@@ -1203,21 +1233,16 @@ def scenario_visualize_system_costs(request, scen_id):
             scenario=scenario, attr_name="cost_table", cols=table_headers, rows=table_content, units_on=["cols"]
         )
 
-    return JsonResponse(
-        {
-            "assets": assets,
-            "graph_contents": graph_contents,
-            "descriptions": descriptions,
-            "data": table_content,
-            "headers": table_headers,
-        }
-    )
+    return {
+        "assets": assets,
+        "graph_contents": graph_contents,
+        "descriptions": descriptions,
+        "data": table_content,
+        "headers": table_headers,
+    }
 
 
-def scenario_visualize_capex(request, scen_id):
-    scenario = get_object_or_404(Scenario, pk=scen_id)
-    save_to_db = True if request.GET.get("save_to_db") == "true" else False
-    ft = FinancialTool(scenario.project)
+def financial_capex_table(scenario, ft, save_to_db=False):
     currency = ft.currency
     capex_df = ft.capex
     capex_by_category = capex_df.groupby("Category")[f"Total costs [{currency}]"].sum()
@@ -1243,21 +1268,16 @@ def scenario_visualize_capex(request, scen_id):
             scenario=scenario, attr_name="capex_table", cols=table_headers, rows=table_content, units_on=["cols"]
         )
 
-    return JsonResponse(
-        {
-            "chart_descriptions": descriptions,
-            "data": table_content,
-            "headers": table_headers,
-        }
-    )
+    return {
+        "chart_descriptions": descriptions,
+        "data": table_content,
+        "headers": table_headers,
+    }
 
 
-def scenario_visualize_opex(request, scen_id):
-    scenario = get_object_or_404(Scenario, pk=scen_id)
-    currency = scenario.project.economic_data.currency
-    save_to_db = True if request.GET.get("save_to_db") == "true" else False
-    ft = FinancialTool(scenario.project)
-    opex_df = ft.om_costs[f"Total costs [{currency}]"]
+def financial_opex_table(scenario, ft, save_to_db=False):
+    # copy so that the total row is not added to the om_costs of the financial tool
+    opex_df = ft.om_costs[f"Total costs [{ft.currency}]"].copy()
     opex_df.loc["total"] = opex_df.sum()
     # create table from data
     opex = opex_df.to_dict()
@@ -1282,92 +1302,14 @@ def scenario_visualize_opex(request, scen_id):
             scenario=scenario, attr_name="opex_table", cols=table_headers, rows=table_content, units_on=["cols"]
         )
 
-    return JsonResponse(
-        {
-            "chart_descriptions": descriptions,
-            "data": table_content,
-            "headers": table_headers,
-        }
-    )
-
-
-@login_required
-@json_view
-def request_project_summary_table(request, scen_id):
-    scenario = get_object_or_404(Scenario, pk=scen_id)
-    project_summary = get_project_summary(scenario.project)
-    currency_symbol = scenario.project.economic_data.currency_symbol
-    table_content = {}
-    for param in project_summary:
-        table_content[param] = set_outputs_table_format(param, currency_symbol)
-        table_content[param]["value"] = project_summary[param]
-
-    table_headers = {}
-    headers = [""]
-    for header in headers:
-        table_headers[header] = set_outputs_table_format(header, currency_symbol)
-
-    return JsonResponse(
-        {"data": table_content, "headers": table_headers},
-        status=200,
-        content_type="application/json",
-    )
-
-
-@login_required
-@json_view
-def request_community_summary_table(request, scen_id):
-    scenario = get_object_or_404(Scenario, pk=scen_id)
-    currency_symbol = scenario.project.economic_data.currency_symbol
-    save_to_db = True if request.GET.get("save_to_db") == "true" else False
-    # dict for community characteristics table
-    graph_data = {"labels": [], "values": [], "descriptions": []}
-    aggregated_cgs = get_aggregated_cgs(scenario.project, as_ts=True)
-    graph_data["timestamps"] = scenario.get_timestamps(json_format=True)
-
-    for key in aggregated_cgs:
-        if key != "shs":
-            graph_data["labels"].append(OUTPUT_PARAMS[key]["verbose"])
-            graph_data["descriptions"].append(OUTPUT_PARAMS[key]["description"])
-            graph_data["values"].append(aggregated_cgs[key]["total_demand"].tolist())
-        aggregated_cgs[key]["total_demand"] = round(sum(aggregated_cgs[key]["total_demand"]), 0)
-
-    aggregated_cgs = pd.DataFrame.from_dict(aggregated_cgs, orient="index")
-    aggregated_cgs.loc["total"] = aggregated_cgs.sum()
-    aggregated_cgs = aggregated_cgs.T.to_dict()
-    table_content = {}
-    headers = []
-    # create table content from aggregated cgs dictionary
-    for param in aggregated_cgs:
-        aggregated_cgs[param].pop("supply_source")
-        headers = [key for key in aggregated_cgs[param].keys()]
-        table_content[param] = set_outputs_table_format(param, currency_symbol)
-        table_content[param]["value"] = [f"{value:,.0f}" for value in aggregated_cgs[param].values()]
-
-    table_headers = {}
-    for header in headers:
-        table_headers[header] = set_outputs_table_format(header, currency_symbol)
-
-    if save_to_db:
-        save_table_for_report(
-            scenario=scenario, attr_name="demand_table", cols=table_headers, rows=table_content, units_on="cols"
-        )
-
-    return JsonResponse(
-        {"graph_data": graph_data, "data": table_content, "headers": table_headers},
-        status=200,
-        content_type="application/json",
-    )
-
+    return {
+        "chart_descriptions": descriptions,
+        "data": table_content,
+        "headers": table_headers,
+    }
 
-@login_required
-@json_view
-def request_system_size_table(request, scen_id):
-    scenario = get_object_or_404(Scenario, pk=scen_id)
-    save_to_db = True if request.GET.get("save_to_db") == "true" else False
-    # dict for community characteristics table
-    ft = FinancialTool(scenario.project)
 
+def financial_system_size_table(scenario, ft, save_to_db=False):
     opt_caps = ft.system_params[ft.system_params["category"].str.contains("capacity")].copy()
     opt_caps.drop(columns=["growth_rate", "label"], inplace=True)
     opt_caps = opt_caps.pivot(columns="category", index="supply_source")
@@ -1393,18 +1335,11 @@ def request_system_size_table(request, scen_id):
             scenario=scenario, attr_name="system_table", cols=table_headers, rows=table_content, units_on=["rows"]
         )
 
-    return JsonResponse(
-        {"data": table_content, "headers": table_headers},
-        status=200,
-        content_type="application/json",
-    )
+    return {"data": table_content, "headers": table_headers}
 
 
-def request_financial_kpi_table(request, scen_id):
-    scenario = get_object_or_404(Scenario, pk=scen_id)
-    save_to_db = True if request.GET.get("save_to_db") == "true" else False
-    # dict for community characteristics table
-    ft = FinancialTool(scenario.project)
+def financial_kpi_tables(scenario, ft, save_to_db=False):
+    """The tariff and the grant of the financial tool are modified in the process"""
     tariff = ft.calculate_tariff()
     financing_structure = ft.financial_kpis
     # TODO discuss if this should be in table, excluded or included in total investments
@@ -1462,13 +1397,151 @@ def request_financial_kpi_table(request, scen_id):
                 scenario=scenario, attr_name=table, cols=data["headers"], rows=data["data"], units_on=["rows"]
             )
 
+    return {"tables": tables}
+
+
+def scenario_visualize_cash_flow(request, scen_id):
+    scenario = get_object_or_404(Scenario, pk=scen_id)
+    ft = get_financial_tool(scenario.project)
+    return JsonResponse(financial_cash_flow_graph(ft))
+
+
+def scenario_visualize_revenue(request, scen_id):
+    scenario = get_object_or_404(Scenario, pk=scen_id)
+    ft = get_financial_tool(scenario.project)
+    return JsonResponse(financial_revenue_graph(ft))
+
+
+def scenario_visualize_system_costs(request, scen_id):
+    save_to_db = True if request.GET.get("save_to_db") == "true" else False
+    scenario = get_object_or_404(Scenario, pk=scen_id)
+    ft = get_financial_tool(scenario.project)
+    return JsonResponse(financial_system_costs_table(scenario, ft, save_to_db))
+
+
+def scenario_visualize_capex(request, scen_id):
+    scenario = get_object_or_404(Scenario, pk=scen_id)
+    save_to_db = True if request.GET.get("save_to_db") == "true" else False
+    ft = get_financial_tool(scenario.project)
+    return JsonResponse(financial_capex_table(scenario, ft, save_to_db))
+
+
+def scenario_visualize_opex(request, scen_id):
+    scenario = get_object_or_404(Scenario, pk=scen_id)
+    save_to_db = True if request.GET.get("save_to_db") == "true" else False
+    ft = get_financial_tool(scenario.project)
+    return JsonResponse(financial_opex_table(scenario, ft, save_to_db))
+
+
+@login_required
+@json_view
+def request_project_summary_table(request, scen_id):
+    scenario = get_object_or_404(Scenario, pk=scen_id)
+    project_summary = get_project_summary(scenario.project)
+    currency_symbol = scenario.project.economic_data.currency_symbol
+    table_content = {}
+    for param in project_summary:
+        table_content[param] = set_outputs_table_format(param, currency_symbol)
+        table_content[param]["value"] = project_summary[param]
+
+    table_headers = {}
+    headers = [""]
+    for header in headers:
+        table_headers[header] = set_outputs_table_format(header, currency_symbol)
+
     return JsonResponse(
-        {"tables": tables},
+        {"data": table_content, "headers": table_headers},
         status=200,
         content_type="application/json",
     )
 
 
+@login_required
+@json_view
+def request_community_summary_table(request, scen_id):
+    scenario = get_object_or_404(Scenario, pk=scen_id)
+    currency_symbol = scenario.project.economic_data.currency_symbol
+    save_to_db = True if request.GET.get("save_to_db") == "true" else False
+    # dict for community characteristics table
+    graph_data = {"labels": [], "values": [], "descriptions": []}
+    aggregated_cgs = get_aggregated_cgs(scenario.project, as_ts=True)
+    graph_data["timestamps"] = scenario.get_timestamps(json_format=True)
+
+    for key in aggregated_cgs:
+        if key != "shs":
+            graph_data["labels"].append(OUTPUT_PARAMS[key]["verbose"])
+            graph_data["descriptions"].append(OUTPUT_PARAMS[key]["description"])
+            graph_data["values"].append(aggregated_cgs[key]["total_demand"].tolist())
+        aggregated_cgs[key]["total_demand"] = round(sum(aggregated_cgs[key]["total_demand"]), 0)
+
+    aggregated_cgs = pd.DataFrame.from_dict(aggregated_cgs, orient="index")
+    aggregated_cgs.loc["total"] = aggregated_cgs.sum()
+    aggregated_cgs = aggregated_cgs.T.to_dict()
+    table_content = {}
+    headers = []
+    # create table content from aggregated cgs dictionary
+    for param in aggregated_cgs:
+        aggregated_cgs[param].pop("supply_source")
+        headers = [key for key in aggregated_cgs[param].keys()]
+        table_content[param] = set_outputs_table_format(param, currency_symbol)
+        table_content[param]["value"] = [f"{value:,.0f}" for value in aggregated_cgs[param].values()]
+
+    table_headers = {}
+    for header in headers:
+        table_headers[header] = set_outputs_table_format(header, currency_symbol)
+
+    if save_to_db:
+        save_table_for_report(
+            scenario=scenario, attr_name="demand_table", cols=table_headers, rows=table_content, units_on="cols"
+        )
+
+    return JsonResponse(
+        {"graph_data": graph_data, "data": table_content, "headers": table_headers},
+        status=200,
+        content_type="application/json",
+    )
+
+
+@login_required
+@json_view
+def request_system_size_table(request, scen_id):
+    scenario = get_object_or_404(Scenario, pk=scen_id)
+    save_to_db = True if request.GET.get("save_to_db") == "true" else False
+    ft = get_financial_tool(scenario.project)
+    return JsonResponse(
+        financial_system_size_table(scenario, ft, save_to_db), status=200, content_type="application/json"
+    )
+
+
+def request_financial_kpi_table(request, scen_id):
+    scenario = get_object_or_404(Scenario, pk=scen_id)
+    save_to_db = True if request.GET.get("save_to_db") == "true" else False
+    ft = get_financial_tool(scenario.project)
+    return JsonResponse(financial_kpi_tables(scenario, ft, save_to_db), status=200, content_type="application/json")
+
+
+@login_required
+@json_view
+def request_financial_outputs(request, scen_id):
+    """Return the outputs of all the financial endpoints above at once, computed from a single FinancialTool"""
+    scenario = get_object_or_404(Scenario, pk=scen_id)
+    save_to_db = True if request.GET.get("save_to_db") == "true" else False
+    ft = get_financial_tool(scenario.project)
+
+    outputs = {
+        "cash_flow": financial_cash_flow_graph(ft),
+        "revenue": financial_revenue_graph(ft),
+        "system_costs": financial_system_costs_table(scenario, ft, save_to_db),
+        "capex": financial_capex_table(scenario, ft, save_to_db),
+        "opex": financial_opex_table(scenario, ft, save_to_db),
+        "system_size": financial_system_size_table(scenario, ft, save_to_db),
+    }
+    # computed last as the tariff and the grant of the financial tool are modified in the process
+    outputs["financial_kpis"] = financial_kpi_tables(scenario, ft, save_to_db)
+
+    return JsonResponse(outputs, status=200, content_type="application/json")
+
+
 @login_required
 @require_http_methods(["GET"])
 def download_scalar_results(request, scen_id):
@@ -1568,15 +1641,10 @@ def download_timeseries_results(request, scen_id):
         assets_results_obj = AssetsResults.objects.get(simulation=scenario.simulation)
         assets_results_json = json.loads(assets_results_obj.assets_list)
         # Create the datetimes index. Constrains: step in minutes and evaluated_period in days
-        base_date = scenario.start_date
-        datetime_list = [
-            datetime.datetime.timestamp(base_date + datetime.timedelta(minutes=step))
-            for step in range(
-                0,
-                24 * scenario.evaluated_period * scenario.time_step,
-                scenario.time_step,
-            )
-        ]
+        # the POSIX timestamps of the local (naive) datetimes of the memoized time index
+        datetime_index = time_index(scenario.start_date, scenario.time_step, 24 * scenario.evaluated_period)
+        datetime_index = datetime_index.tz_localize(settings.TIME_ZONE, ambiguous=True, nonexistent="shift_forward")
+        datetime_list = ((datetime_index - pd.Timestamp(0, tz="UTC")) / pd.Timedelta(seconds=1)).tolist()
 
         output = BytesIO()
         workbook = xlsxwriter.Workbook(output)
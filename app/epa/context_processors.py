@@ -1,5 +1,13 @@
 from django.conf import settings
+from django.utils.functional import SimpleLazyObject
+
+from projects.permissions import get_project_permissions
 
 
 def debug(context):
     return {"DEBUG": settings.DEBUG}
+
+
+def project_permissions(request):
+    # the rights are only loaded if a template uses them
+    return {"project_permissions": SimpleLazyObject(lambda: get_project_permissions(request.user))}
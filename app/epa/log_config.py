@@ -0,0 +1,174 @@
+"""Logging configuration: records are written to the files by background threads
+
+Django calls configure_logging (LOGGING_CONFIG in the settings) with the LOGGING settings. After the usual dictConfig,
+if LOGGING_QUEUE is True the handlers of each configured logger are replaced by a QueueingHandler, which only puts the
+records on a queue, and a QueueListener thread hands them to the original handlers. The file writes therefore no longer
+happen in the request (or Django-Q task) thread. The listeners are started again in the processes forked by gunicorn
+and Django-Q, and flushed when the process exits.
+
+The module also provides the RateLimitFilter, which drops a message repeated too often by the same logger, and the
+JSONFormatter, which writes a record as one JSON object per line so that the log files can be parsed by other tools.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import logging.config
+import logging.handlers
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+
+from django.conf import settings
+
+# listeners of the queued loggers, {logger name: (QueueListener, QueueingHandler)}
+_listeners = {}
+
+# attributes of a LogRecord which are not extra fields
+RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class QueueingHandler(logging.handlers.QueueHandler):
+    """QueueHandler keeping the exception traceback and the extra fields of the records for the formatters"""
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        # the template of the message identifies the repeated messages (see RateLimitFilter)
+        record._msg_template = str(record.msg)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            # the traceback objects should not outlive the call, the formatters append exc_text
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class RateLimitFilter(logging.Filter):
+    """Let at most burst records with the same logger, level and message template through per period seconds
+
+    The first record let through after some were dropped mentions how many. A record handled by several handlers with
+    this filter is only counted once.
+    """
+
+    def __init__(self, period=60, burst=10):
+        super().__init__()
+        self.period = period
+        self.burst = burst
+        self.lock = threading.Lock()
+        # {(logger name, level, message template): [start of the period, records let through, records dropped]}
+        self.counters = {}
+
+    def filter(self, record):
+        passed = getattr(record, "_rate_limit_passed", None)
+        if passed is not None:
+            return passed
+
+        key = (record.name, record.levelno, getattr(record, "_msg_template", str(record.msg)))
+        now = time.monotonic()
+        with self.lock:
+            counter = self.counters.get(key)
+            if counter is None or now - counter[0] >= self.period:
+                dropped = counter[2] if counter is not None else 0
+                counter = self.counters[key] = [now, 0, 0]
+                if dropped:
+                    record.msg = f"{record.msg} ({dropped} similar messages were dropped)"
+            if counter[1] < self.burst:
+                counter[1] += 1
+                passed = True
+            else:
+                counter[2] += 1
+                passed = False
+            if len(self.counters) > 10000:
+                # forget the periods which are over
+                self.counters = {k: c for k, c in self.counters.items() if now - c[0] < self.period}
+        record._rate_limit_passed = passed
+        return passed
+
+
+class JSONFormatter(logging.Formatter):
+    """Format a record as a JSON object on one line, with its extra fields"""
+
+    def format(self, record):
+        record.message = record.getMessage()
+        data = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.message,
+            "process": record.process,
+            "thread": record.threadName,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exception"] = record.exc_text
+        for name, value in vars(record).items():
+            if name not in RECORD_ATTRIBUTES and not name.startswith("_"):
+                data[name] = value
+        return json.dumps(data, default=str)
+
+
+def parse_log_levels(levels):
+    """Parse a list of logger levels like "projects.requests=WARNING,django.db.backends=INFO" into LOGGING loggers"""
+    loggers = {}
+    for item in levels.split(","):
+        name, _, level = item.partition("=")
+        if name.strip() and level.strip():
+            loggers[name.strip()] = {"level": level.strip().upper()}
+    return loggers
+
+
+def queue_handlers(logger):
+    """Move the handlers of a logger behind a queue, return the listener writing the records"""
+    handlers = [handler for handler in logger.handlers if not isinstance(handler, logging.handlers.QueueHandler)]
+    if not handlers:
+        return None
+    listener = logging.handlers.QueueListener(queue.SimpleQueue(), *handlers, respect_handler_level=True)
+    queue_handler = QueueingHandler(listener.queue)
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(queue_handler)
+    listener.start()
+    _listeners[logger.name] = (listener, queue_handler)
+    return listener
+
+
+def stop_listeners():
+    """Write the records still in the queues and stop the listeners"""
+    for listener, _ in _listeners.values():
+        if listener._thread is not None:
+            listener.stop()
+
+
+def _restart_listeners():
+    # the listener threads are not copied in a forked process, the records would pile up in the queues. The records
+    # queued by the parent process are left to it.
+    for name, (listener, queue_handler) in list(_listeners.items()):
+        new_listener = logging.handlers.QueueListener(
+            queue.SimpleQueue(), *listener.handlers, respect_handler_level=True
+        )
+        queue_handler.queue = new_listener.queue
+        new_listener.start()
+        _listeners[name] = (new_listener, queue_handler)
+
+
+def configure_logging(logging_settings):
+    stop_listeners()
+    _listeners.clear()
+    logging.config.dictConfig(logging_settings)
+    if getattr(settings, "LOGGING_QUEUE", False) is not True:
+        return
+    for name in logging_settings.get("loggers", {}):
+        # "" is the root logger
+        queue_handlers(logging.getLogger(name or None))
+
+
+atexit.register(stop_listeners)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listeners)
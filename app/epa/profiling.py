@@ -0,0 +1,101 @@
+"""Opt-in profiling of the requests: wall time, number of SQL queries, repeated queries and slowest queries
+
+The RequestProfilerMiddleware is only active if the setting PROFILING_SAMPLE_RATE is greater than 0, a share of the
+requests is then drawn at random and profiled. Only the views whose module is listed in PROFILING_VIEW_MODULES (by
+default the CPN wizard views of cp_nigeria.views and the results views of dashboard.views) are reported, as one JSON
+line per request to the "epa.profiling" logger, which writes to a rotating log file (see LOGGING in the settings).
+
+The queries with the same SQL but different parameters are reported as "repeated": when a view runs the same query once
+per object of a list (N+1 pattern) it shows up there with a high count.
+"""
+
+import json
+import logging
+import random
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# length at which the SQL statements are truncated in the report
+SQL_MAX_LENGTH = 300
+
+
+class QueryRecorder:
+    """Database execute wrapper keeping the SQL, the parameters and the duration of each query"""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, params, time.perf_counter() - start))
+
+
+def summarize_queries(queries, top_n=5):
+    """Aggregate recorded queries
+
+    :param queries: list of (sql, params, duration in seconds) tuples
+    :param top_n: number of slowest and most repeated queries to report
+    :return: dict with the number and total duration of the queries, the most repeated queries and the slowest ones
+    """
+    repeated = Counter(sql for sql, _, _ in queries)
+    duplicated = Counter((sql, repr(params)) for sql, params, _ in queries)
+    slowest = sorted(queries, key=lambda query: query[2], reverse=True)[:top_n]
+    return {
+        "queries": len(queries),
+        "query_time_ms": round(sum(duration for _, _, duration in queries) * 1000, 2),
+        # same SQL and same parameters, the result could have been reused
+        "duplicates": sum(count - 1 for count in duplicated.values()),
+        "repeated": [
+            {"sql": sql[:SQL_MAX_LENGTH], "count": count} for sql, count in repeated.most_common(top_n) if count > 1
+        ],
+        "slowest": [
+            {"sql": sql[:SQL_MAX_LENGTH], "duration_ms": round(duration * 1000, 2)} for sql, _, duration in slowest
+        ],
+    }
+
+
+class RequestProfilerMiddleware:
+    def __init__(self, get_response):
+        self.sample_rate = getattr(settings, "PROFILING_SAMPLE_RATE", 0)
+        if self.sample_rate <= 0:
+            raise MiddlewareNotUsed
+        self.view_modules = tuple(getattr(settings, "PROFILING_VIEW_MODULES", ("cp_nigeria.views", "dashboard.views")))
+        self.top_n = getattr(settings, "PROFILING_TOP_QUERIES", 5)
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        match = getattr(request, "resolver_match", None)
+        view = f"{match.func.__module__}.{match.func.__name__}" if match is not None else None
+        if view is not None and view.startswith(self.view_modules):
+            report = {
+                "view": view,
+                "url_name": match.url_name,
+                "path": request.path,
+                "method": request.method,
+                "status": response.status_code,
+                "duration_ms": round(duration * 1000, 2),
+            }
+            report.update(summarize_queries(recorder.queries, top_n=self.top_n))
+            logger.info(json.dumps(report))
+        return response
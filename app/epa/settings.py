@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/3.0/ref/settings/
 """
 import ast
 import os
+import tempfile
 
 from django.contrib.messages import constants as messages
 
@@ -25,6 +26,9 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 STATICFILES_DIRS = (os.path.join(BASE_DIR, "static"),)
 STATIC_URL = "/static/"
 STATIC_ROOT = os.path.join(BASE_DIR, "cdn_static_root")
+# Folder where the parsed static tables (parameters and KPIs csv files) are pickled, disabled if empty
+# see projects/static_tables.py
+STATIC_TABLES_CACHE_DIR = os.getenv("STATIC_TABLES_CACHE_DIR", "")
 
 STATICFILES_FINDERS = ["django.contrib.staticfiles.finders.FileSystemFinder"]
 
@@ -70,6 +74,7 @@ if DEBUG is True:
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "epa.profiling.RequestProfilerMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -79,6 +84,11 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Profiling of a share of the requests to the CPN and results views (see epa.profiling), disabled if the rate is 0
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_VIEW_MODULES = os.getenv("PROFILING_VIEW_MODULES", "cp_nigeria.views,dashboard.views").split(",")
+PROFILING_TOP_QUERIES = int(os.getenv("PROFILING_TOP_QUERIES", "5"))
+
 FILE_UPLOAD_HANDLERS = [
     "django.core.files.uploadhandler.MemoryFileUploadHandler",
     "django.core.files.uploadhandler.TemporaryFileUploadHandler",
@@ -100,6 +110,7 @@ TEMPLATES = [
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
                 "epa.context_processors.debug",
+                "epa.context_processors.project_permissions",
             ]
         },
     }
@@ -195,6 +206,56 @@ MVS_GET_URL = f"{MVS_API_HOST}/check/"
 MVS_LP_FILE_URL = f"{MVS_API_HOST}/get_lp_file/"
 MVS_SA_POST_URL = f"{MVS_API_HOST}/sendjson/openplan/sensitivity-analysis"
 MVS_SA_GET_URL = f"{MVS_API_HOST}/check-sensitivity-analysis/"
+# The answers of MVS with the results of a simulation are streamed to a temporary file, kept in memory up to
+# MVS_RESULTS_SPOOL_SIZE MB
+MVS_RESULTS_SPOOL_SIZE = float(os.getenv("MVS_RESULTS_SPOOL_SIZE", "16"))
+
+# The PV output profiles of renewables.ninja are cached for the coordinates rounded to PV_PROFILE_PRECISION decimals
+# (1 decimal is about 11 km, the resolution of the MERRA-2 weather data is about 50 km), see cp_nigeria.pv_profiles
+PV_PROFILE_PRECISION = int(os.getenv("PV_PROFILE_PRECISION", "1"))
+
+# Client addresses allowed to scrape the simulation metrics (see projects.metrics), staff users are always allowed
+METRICS_ALLOWED_IPS = os.getenv("METRICS_ALLOWED_IPS", "127.0.0.1,::1").split(",")
+
+# The status of a pending simulation is asked to MVS at most once per SIMULATION_STATUS_TTL seconds whatever the number
+# of pollers, the lock of a running check expires after SIMULATION_STATUS_LOCK_TIMEOUT seconds (see
+# projects.simulation_status). A status stream (server-sent events) checks the status every
+# SIMULATION_STATUS_STREAM_INTERVAL seconds and is closed after SIMULATION_STATUS_STREAM_TIMEOUT seconds, the browser
+# then reconnects. An open stream holds a sync gunicorn worker (docker-compose runs --workers=2), so keep the timeout
+# low with sync workers or run gunicorn with threads (--threads) or an async worker class to serve many pending pages.
+SIMULATION_STATUS_TTL = float(os.getenv("SIMULATION_STATUS_TTL", "5"))
+SIMULATION_STATUS_LOCK_TIMEOUT = float(os.getenv("SIMULATION_STATUS_LOCK_TIMEOUT", "120"))
+SIMULATION_STATUS_STREAM_INTERVAL = float(os.getenv("SIMULATION_STATUS_STREAM_INTERVAL", "3"))
+SIMULATION_STATUS_STREAM_TIMEOUT = float(os.getenv("SIMULATION_STATUS_STREAM_TIMEOUT", "10"))
+
+# Cache shared by the server and the Django-Q processes (see projects.caching). CACHE_BACKEND is "db" (table
+# CACHE_LOCATION, created by the migrations or with "python manage.py createcachetable"), "file" (folder
+# CACHE_LOCATION), "locmem" (one cache per process, e.g. for development) or the dotted path of any other Django cache
+# backend (e.g. redis)
+CACHE_BACKENDS = {
+    "db": "django.core.cache.backends.db.DatabaseCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+}
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "db")
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS.get(CACHE_BACKEND, CACHE_BACKEND),
+        "LOCATION": os.getenv("CACHE_LOCATION", "epa_cache"),
+        "TIMEOUT": int(os.getenv("CACHE_TIMEOUT", "3600")),
+        "OPTIONS": {"MAX_ENTRIES": int(os.getenv("CACHE_MAX_ENTRIES", "5000"))},
+    }
+}
+# Folder of the files of the array store (see projects.caching.ArrayStore), the least recently used arrays are deleted
+# once they take more than ARRAY_STORE_MAX_SIZE MB
+ARRAY_STORE_DIR = os.getenv("ARRAY_STORE_DIR", os.path.join(tempfile.gettempdir(), "epa_array_store"))
+ARRAY_STORE_MAX_SIZE = float(os.getenv("ARRAY_STORE_MAX_SIZE", "512"))
+
+# The payloads of the graphs of finished simulations are stored compressed in the cache for
+# GRAPH_PAYLOAD_CACHE_TIMEOUT seconds (see dashboard.payloads). The browsers revalidate them with their ETag after
+# GRAPH_PAYLOAD_MAX_AGE seconds, a graph URL can display the results of a new simulation of the same scenario
+GRAPH_PAYLOAD_CACHE_TIMEOUT = int(os.getenv("GRAPH_PAYLOAD_CACHE_TIMEOUT", str(7 * 24 * 3600)))
+GRAPH_PAYLOAD_MAX_AGE = int(os.getenv("GRAPH_PAYLOAD_MAX_AGE", "0"))
 
 # Allow iframes to show in page
 X_FRAME_OPTIONS = "SAMEORIGIN"
@@ -202,9 +263,21 @@ X_FRAME_OPTIONS = "SAMEORIGIN"
 # API token to fetch exchange rates
 EXCHANGE_RATES_API_TOKEN = os.getenv("EXCHANGE_RATES_API_TOKEN")
 EXCHANGE_RATES_URL = f"https://v6.exchangerate-api.com/v6/{EXCHANGE_RATES_API_TOKEN}/latest/USD"
+# The exchange rates are stored in the database and refreshed by a Django-Q task at most every
+# EXCHANGE_RATES_MAX_AGE hours (see projects.exchange_rates)
+EXCHANGE_RATES_MAX_AGE = float(os.getenv("EXCHANGE_RATES_MAX_AGE", "12"))
+EXCHANGE_RATES_TIMEOUT = float(os.getenv("EXCHANGE_RATES_TIMEOUT", "10"))
 
 import sys
 
+from epa.log_config import parse_log_levels
+
+# Level of the root logger and levels of other loggers, e.g. LOG_LEVELS="projects.requests=WARNING,django=INFO"
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+# The log records are written to the files by background threads instead of the request threads (see epa.log_config)
+LOGGING_QUEUE = ast.literal_eval(os.getenv("LOGGING_QUEUE", "True"))
+LOGGING_CONFIG = "epa.log_config.configure_logging"
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -212,6 +285,14 @@ LOGGING = {
         "dtlnm": {
             "format": "%(asctime)s - %(levelname)8s - %(name)s - %(message)s",
             "datefmt": "%Y-%m-%d %H:%M:%S",
+        },
+        "json": {"()": "epa.log_config.JSONFormatter"},
+    },
+    "filters": {
+        "rate_limit": {
+            "()": "epa.log_config.RateLimitFilter",
+            "period": float(os.getenv("LOG_RATE_LIMIT_PERIOD", "60")),
+            "burst": int(os.getenv("LOG_RATE_LIMIT_BURST", "10")),
         }
     },
     "handlers": {
@@ -220,29 +301,56 @@ LOGGING = {
             "class": "logging.FileHandler",
             "filename": "django_epa_info.log",
             "formatter": "dtlnm",
+            "filters": ["rate_limit"],
         },
         "warnings_file": {
             "level": "WARNING",
             "class": "logging.FileHandler",
             "filename": "django_epa_warning.log",
             "formatter": "dtlnm",
+            "filters": ["rate_limit"],
+        },
+        "profiling_file": {
+            "level": "INFO",
+            "class": "logging.handlers.RotatingFileHandler",
+            "filename": "django_epa_profiling.log",
+            "maxBytes": 10 * 1024 * 1024,
+            "backupCount": 5,
+            "delay": True,
+            "formatter": "dtlnm",
         },
         "console": {
             "level": "WARNING",
             "class": "logging.StreamHandler",
             "stream": sys.stdout,
+            "filters": ["rate_limit"],
         },
     },
     "loggers": {
         "": {
             "handlers": ["info_file", "warnings_file", "console"],
-            "level": "DEBUG",
+            "level": LOG_LEVEL,
             "propagate": True,
         },
         "asyncio": {"level": "WARNING"},
+        "epa.profiling": {"handlers": ["profiling_file"], "level": "INFO", "propagate": False},
     },
 }
 
+# Optional log file with one JSON object per record
+if os.getenv("LOG_JSON_FILE"):
+    LOGGING["handlers"]["json_file"] = {
+        "level": "INFO",
+        "class": "logging.handlers.RotatingFileHandler",
+        "filename": os.getenv("LOG_JSON_FILE"),
+        "maxBytes": 10 * 1024 * 1024,
+        "backupCount": 5,
+        "formatter": "json",
+        "filters": ["rate_limit"],
+    }
+    LOGGING["loggers"][""]["handlers"].append("json_file")
+LOGGING["loggers"].update(parse_log_levels(os.getenv("LOG_LEVELS", "")))
+
 # DJANGO-Q CONFIGURATION
 # source: https://django-q.readthedocs.io/en/latest/configure.html
 Q_CLUSTER = {
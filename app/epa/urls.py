@@ -18,6 +18,7 @@ from django.conf.urls.i18n import i18n_patterns
 from django.urls import path, re_path, include
 from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 
+from projects.views import simulation_metrics
 from .views import imprint, privacy, about, license
 
 urlpatterns = (
@@ -35,5 +36,7 @@ urlpatterns = (
         path("", include("cp_nigeria.urls")),
     )
     + [re_path(r"^i18n/", include("django.conf.urls.i18n"))]
+    # scraped by monitoring tools, kept out of the language prefixed urls
+    + [path("metrics/simulations", simulation_metrics, name="simulation_metrics")]
     + staticfiles_urlpatterns()
 )
@@ -3,6 +3,7 @@ echo yes | python manage.py collectstatic && \
 python manage.py compilemessages
 python manage.py makemigrations users projects dashboard && \
 python manage.py migrate && \
+python manage.py createcachetable && \
 python manage.py update_assettype && \
 python manage.py update_bmquestions && \
 python manage.py loaddata 'fixtures/multivector_fixture.json' && \
@@ -0,0 +1,290 @@
+"""Cache shared by the server and the Django-Q processes
+
+Gunicorn and the Django-Q cluster run several processes, so what is memoized in the memory of one of them does not
+benefit the others. The results, demand and finance computations are therefore cached in the "default" Django cache,
+configured with the CACHE_BACKEND setting (a database table by default, see epa/settings.py), through the cache-aside
+helpers of this module:
+
+* the keys are versioned by the object they are computed from (simulation, scenario or project), so that a cached
+  value is never served once the object changed and no explicit invalidation is needed;
+* a value missing from the cache is computed by a single process, the other processes asking for it meanwhile wait for
+  it instead of computing it as well (stampede protection);
+* NumPy arrays are stored in the .npy format and JSON payloads as strings, which are returned as they are so that a
+  view can send them without serializing them again.
+
+Large arrays (e.g. timeseries) can rather be kept in the ArrayStore, a folder of .npy files shared by the processes of a
+host whose size is bounded by evicting the least recently used arrays.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.serializers.json import DjangoJSONEncoder
+
+from projects.models import Project, Scenario, Simulation
+
+logger = logging.getLogger(__name__)
+
+# maximal time (s) a process waits for another process to compute the same value
+CACHE_LOCK_TIMEOUT = 30
+CACHE_LOCK_POLL_INTERVAL = 0.1
+
+
+def _timestamp_version(date):
+    return "0" if date is None else format(int(date.timestamp() * 1e6), "x")
+
+
+def object_version(obj):
+    """Return the version of a simulation, scenario or project, which changes whenever its results or inputs change
+
+    * a simulation changes with its end date (set each time its results are fetched from MVS)
+    * a scenario changes with its simulation
+    * a project changes with its update date
+    """
+    if isinstance(obj, Simulation):
+        return f"simulation:{obj.id}:{_timestamp_version(obj.end_date)}"
+    if isinstance(obj, Scenario):
+        end_date = Simulation.objects.filter(scenario=obj).values_list("end_date", flat=True).first()
+        return f"scenario:{obj.id}:{_timestamp_version(end_date)}"
+    if isinstance(obj, Project):
+        return f"project:{obj.id}:{_timestamp_version(obj.date_updated)}"
+    raise TypeError(f"The cache keys cannot be versioned by a {type(obj).__name__}")
+
+
+def versioned_key(namespace, obj, *parts):
+    """Return the cache key of a value computed from a simulation, scenario or project
+
+    :param namespace: name of the cached computation, e.g. "kpi_table"
+    :param obj: Simulation, Scenario or Project instance the value is computed from
+    :param parts: other arguments of the computation, hashed into the key
+    """
+    key = f"{namespace}:{object_version(obj)}"
+    if parts:
+        digest = hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+        key = f"{key}:{digest}"
+    return key
+
+
+def _cache_aside(read, build, write, lock_key, lock_timeout):
+    """Return read(), or the value of build() written with write(value) if read() returned None
+
+    Only one process builds a missing value, the processes asking for it meanwhile wait until it is written (at most
+    lock_timeout seconds, then they build it themselves).
+    """
+    value = read()
+    if value is not None:
+        return value
+
+    if cache.add(lock_key, True, timeout=lock_timeout) is False:
+        # another process builds the value, wait for it unless the lock is released or expires
+        deadline = time.monotonic() + lock_timeout
+        while time.monotonic() < deadline and cache.get(lock_key) is not None:
+            time.sleep(CACHE_LOCK_POLL_INTERVAL)
+            value = read()
+            if value is not None:
+                return value
+        return build()
+
+    try:
+        value = build()
+        if value is not None:
+            write(value)
+    finally:
+        cache.delete(lock_key)
+    return value
+
+
+def get_or_set(key, build, timeout=DEFAULT_TIMEOUT, lock_timeout=CACHE_LOCK_TIMEOUT, encode=None, decode=None):
+    """Return the cached value of key, computed with build() and stored if it is missing (with stampede protection)
+
+    :param build: function without arguments returning the value, None values are not cached
+    :param timeout: lifetime of the value in seconds, the timeout of the cache by default
+    :param encode: function converting the value into the object stored in the cache
+    :param decode: function converting the object stored in the cache back into the value
+    """
+
+    def read():
+        stored = cache.get(key)
+        if stored is None or decode is None:
+            return stored
+        try:
+            return decode(stored)
+        except Exception as e:
+            logger.warning(f"The cached value of '{key}' could not be read: {e}")
+            return None
+
+    def write(value):
+        cache.set(key, value if encode is None else encode(value), timeout=timeout)
+
+    return _cache_aside(read, build, write, f"{key}:lock", lock_timeout)
+
+
+def encode_array(array):
+    buffer = io.BytesIO()
+    np.save(buffer, np.asarray(array), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def decode_array(data):
+    return np.load(io.BytesIO(data), allow_pickle=False)
+
+
+def encode_dataframe(df):
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError(f"A DataFrame was expected, got a {type(df).__name__}")
+    return pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def decode_dataframe(data):
+    return pickle.loads(data)
+
+
+class NumpyJSONEncoder(DjangoJSONEncoder):
+    """JSON encoder of JsonResponse also serializing the NumPy scalars and arrays"""
+
+    def default(self, o):
+        if isinstance(o, np.generic):
+            return o.item()
+        if isinstance(o, np.ndarray):
+            return o.tolist()
+        return super().default(o)
+
+
+def cached_array(key, build, timeout=DEFAULT_TIMEOUT):
+    """Cache-aside for a NumPy array, see get_or_set"""
+    return get_or_set(key, lambda: np.asarray(build()), timeout=timeout, encode=encode_array, decode=decode_array)
+
+
+def cached_dataframe(key, build, timeout=DEFAULT_TIMEOUT):
+    """Cache-aside for a pandas DataFrame, see get_or_set"""
+    return get_or_set(key, build, timeout=timeout, encode=encode_dataframe, decode=decode_dataframe)
+
+
+def cached_json(key, build, timeout=DEFAULT_TIMEOUT):
+    """Cache-aside for a JSON payload, see get_or_set
+
+    :param build: function returning the object to serialize
+    :return: the JSON string of the payload
+    """
+    return get_or_set(key, lambda: json.dumps(build(), cls=NumpyJSONEncoder), timeout=timeout)
+
+
+class ArrayStore:
+    """NumPy arrays stored as .npy files in a folder shared by the processes of a host
+
+    The files are written atomically, so that a process never reads a partial array. Reading an array updates the
+    modification time of its file, the files modified the least recently are deleted once the folder is larger than
+    max_size MB.
+    """
+
+    def __init__(self, directory=None, max_size=None):
+        self._directory = directory
+        self._max_size = max_size
+
+    @property
+    def directory(self):
+        return self._directory if self._directory is not None else settings.ARRAY_STORE_DIR
+
+    @property
+    def max_bytes(self):
+        max_size = self._max_size if self._max_size is not None else settings.ARRAY_STORE_MAX_SIZE
+        return int(max_size * 1024 * 1024)
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.npy")
+
+    def get(self, key):
+        """Return the stored array, None if it is missing"""
+        path = self.path(key)
+        try:
+            array = np.load(path, allow_pickle=False)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"The stored array '{key}' could not be read: {e}")
+            return None
+        return array
+
+    def set(self, key, array):
+        path = self.path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as fp:
+                np.save(fp, np.asarray(array), allow_pickle=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"The array '{key}' could not be stored: {e}")
+            return
+        self.evict()
+
+    def get_or_set(self, key, build):
+        """Return the stored array, computed with build() and stored if it is missing (with stampede protection)"""
+        return _cache_aside(
+            lambda: self.get(key),
+            lambda: np.asarray(build()),
+            lambda array: self.set(key, array),
+            f"array_store:{key}:lock",
+            CACHE_LOCK_TIMEOUT,
+        )
+
+    def delete(self, key):
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+
+    def files(self):
+        """Return the (modification time, size, path) of the stored arrays"""
+        files = []
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return files
+        for entry in entries:
+            if not entry.name.endswith(".npy"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                # deleted by another process meanwhile
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+        return files
+
+    def size(self):
+        return sum(size for _, size, _ in self.files())
+
+    def evict(self):
+        """Delete the least recently used arrays until the store is not larger than its maximal size"""
+        files = self.files()
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        for _, _, path in self.files():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+array_store = ArrayStore()
@@ -0,0 +1,95 @@
+"""Exchange rates of the currencies in relation to USD
+
+The rates are fetched from the exchange rates API (EXCHANGE_RATES_URL) by the Django-Q task refresh_exchange_rates and
+stored in the ExchangeRate table, so that the economic parameters forms read them from the database instead of waiting
+for the API. The task is scheduled the first time a rate is missing or older than EXCHANGE_RATES_MAX_AGE hours and does
+not call the API again before the rates are that old. When the API cannot be reached the last known rates are used.
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+import httpx as requests
+from django.conf import settings
+from django_q.models import Schedule
+
+from projects.models import ExchangeRate
+
+logger = logging.getLogger(__name__)
+
+REFRESH_TASK = "projects.exchange_rates.refresh_exchange_rates"
+
+
+def max_age():
+    return timedelta(hours=settings.EXCHANGE_RATES_MAX_AGE)
+
+
+def fetch_exchange_rates():
+    """Request the exchange rates of all currencies to the API
+
+    :return: dict {currency: rate}, None if the API could not be reached or did not answer with rates
+    """
+    try:
+        response = requests.get(settings.EXCHANGE_RATES_URL, timeout=settings.EXCHANGE_RATES_TIMEOUT)
+        response.raise_for_status()
+        rates = response.json()["conversion_rates"]
+    except (requests.HTTPError, ValueError, KeyError) as err:
+        logger.warning(f"The exchange rates could not be fetched, the last known rates are used: {err}")
+        return None
+    return rates
+
+
+def refresh_exchange_rates(force=False):
+    """Store the current exchange rates, unless the stored ones are less than EXCHANGE_RATES_MAX_AGE hours old
+
+    :return: number of stored rates, 0 if they were up to date or could not be fetched
+    """
+    now = datetime.now()
+    last_update = ExchangeRate.objects.order_by("-updated_at").values_list("updated_at", flat=True).first()
+    if force is False and last_update is not None and now - last_update < max_age():
+        return 0
+
+    rates = fetch_exchange_rates()
+    if not rates:
+        return 0
+    ExchangeRate.objects.bulk_create(
+        [ExchangeRate(currency=currency, rate=rate, updated_at=now) for currency, rate in rates.items()],
+        update_conflicts=True,
+        unique_fields=["currency"],
+        update_fields=["rate", "updated_at"],
+    )
+    logger.info(f"Updated {len(rates)} exchange rates")
+    return len(rates)
+
+
+def schedule_exchange_rates_refresh():
+    """Create the Django-Q schedule refreshing the exchange rates if it does not exist yet"""
+    Schedule.objects.get_or_create(
+        func=REFRESH_TASK,
+        defaults=dict(
+            name="exchange_rates_refresh",
+            schedule_type=Schedule.MINUTES,
+            minutes=max(int(settings.EXCHANGE_RATES_MAX_AGE * 60), 1),
+        ),
+    )
+
+
+def latest_exchange_rate(currency, default=1):
+    """Return the last known price of a currency in relation to USD, rounded to 2 decimals
+
+    The first time a rate is requested the rates are fetched synchronously, afterwards they are only read from the
+    database and refreshed in the background when they get older than EXCHANGE_RATES_MAX_AGE hours.
+
+    :param default: rate returned if the currency has never been fetched (e.g. the API was never reachable)
+    """
+    row = ExchangeRate.objects.filter(currency=currency).values_list("rate", "updated_at").first()
+    if row is None and not ExchangeRate.objects.exists():
+        refresh_exchange_rates(force=True)
+        row = ExchangeRate.objects.filter(currency=currency).values_list("rate", "updated_at").first()
+
+    if row is None or datetime.now() - row[1] >= max_age():
+        schedule_exchange_rates_refresh()
+    if row is None:
+        logger.warning(f"No exchange rate is known for {currency}, please enter it manually instead.")
+        return default
+    return round(row[0], 2)
@@ -31,6 +31,7 @@ from projects.helpers import (
     parameters_helper,
     PARAMETERS,
     DualNumberField,
+    TimeseriesField,
     parse_input_timeseries,
 )
 
@@ -652,13 +653,14 @@ class AssetCreateForm(OpenPlanModelForm):
         asset_type = AssetType.objects.get(asset_type=self.asset_type_name)
         [self.fields.pop(field) for field in list(self.fields) if field not in asset_type.visible_fields]
 
+        # the timestamps are only used for their number, the memoized time index avoids building datetime objects
         self.timestamps = None
         if self.existing_asset is not None:
-            self.timestamps = self.existing_asset.timestamps
+            self.timestamps = self.existing_asset.scenario.get_time_index()
         elif scenario_id is not None:
             qs = Scenario.objects.filter(id=scenario_id)
             if qs.exists():
-                self.timestamps = qs.get().get_timestamps()
+                self.timestamps = qs.get().get_time_index()
                 if proj_id is None:
                     proj_id = qs.get().project.id
 
@@ -723,6 +725,9 @@ class AssetCreateForm(OpenPlanModelForm):
         for field in self.fields:
             if field == "renewable_asset" and self.asset_type_name in RENEWABLE_ASSETS:
                 self.fields[field].initial = True
+            # uploaded timeseries are checked against the scenario horizon while they are parsed
+            if isinstance(self.fields[field], (DualNumberField, TimeseriesField)) and self.timestamps is not None:
+                self.fields[field].n_timesteps = len(self.timestamps)
             self.fields[field].widget.attrs.update({f"df-{field}": ""})
             if field == "input_timeseries":
                 self.fields[field].required = self.is_input_timeseries_empty()
@@ -889,22 +894,20 @@ class AssetCreateForm(OpenPlanModelForm):
         return cleaned_data
 
     def timeseries_same_as_timestamps(self, ts, param):
-        if isinstance(ts, np.ndarray):
-            ts = np.squeeze(ts).tolist()
-        if isinstance(ts, float) is False and isinstance(ts, int) is False:
-            if len(ts) > 1:
-                if self.timestamps is not None:
-                    if len(ts) != len(self.timestamps):
-                        # TODO look for verbose of param
-                        msg = (
-                            _("The number of values of the parameter ")
-                            + _(param)
-                            + f" ({len(ts)})"
-                            + _(" are not equal to the number of simulation timesteps")
-                            + f" ({len(self.timestamps)})"
-                            + _(". You can change the number of timesteps in the first step of scenario creation.")
-                        )
-                        self.add_error(param, msg)
+        n_values = np.size(ts)
+        if n_values > 1:
+            if self.timestamps is not None:
+                if n_values != len(self.timestamps):
+                    # TODO look for verbose of param
+                    msg = (
+                        _("The number of values of the parameter ")
+                        + _(param)
+                        + f" ({n_values})"
+                        + _(" are not equal to the number of simulation timesteps")
+                        + f" ({len(self.timestamps)})"
+                        + _(". You can change the number of timesteps in the first step of scenario creation.")
+                    )
+                    self.add_error(param, msg)
 
     class Meta:
         model = Asset
@@ -1,10 +1,8 @@
+import hashlib
 import json
 import os
-import io
 import csv
-from openpyxl import load_workbook
 from django import forms
-from django.contrib.staticfiles.storage import staticfiles_storage
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 from django.utils.html import html_safe
@@ -12,23 +10,34 @@ from projects.dtos import convert_to_dto
 from projects.models import Timeseries, AssetType
 from projects.constants import MAP_MVS_EPA
 from dashboard.helpers import KPIFinder
+from projects.static_tables import static_tables, LazyTable
+from projects.timeseries_parser import read_timeseries_file, check_timeseries_length
+
+
+def parse_parameters_list(filepath):
+    """Parse MVS_parameters_list.csv, the parameters are indexed by their EPA name"""
+    parameters = {}
+    if os.path.exists(filepath) is True:
+        with open(filepath, encoding="utf-8") as csvfile:
+            csvreader = csv.reader(csvfile, delimiter=",", quotechar='"')
+            for i, row in enumerate(csvreader):
+                if i == 0:
+                    hdr = row
+                    label_idx = hdr.index("label")
+                else:
+                    label = row[label_idx]
+                    label = MAP_MVS_EPA.get(label, label)
+                    parameters[label] = {}
+                    for k, v in zip(hdr, row):
+                        if k == "sensitivity_analysis":
+                            v = bool(int(v))
+                        parameters[label][k] = v
+    return parameters
 
-PARAMETERS = {}
-if os.path.exists(staticfiles_storage.path("MVS_parameters_list.csv")) is True:
-    with open(staticfiles_storage.path("MVS_parameters_list.csv"), encoding="utf-8") as csvfile:
-        csvreader = csv.reader(csvfile, delimiter=",", quotechar='"')
-        for i, row in enumerate(csvreader):
-            if i == 0:
-                hdr = row
-                label_idx = hdr.index("label")
-            else:
-                label = row[label_idx]
-                label = MAP_MVS_EPA.get(label, label)
-                PARAMETERS[label] = {}
-                for k, v in zip(hdr, row):
-                    if k == "sensitivity_analysis":
-                        v = bool(int(v))
-                    PARAMETERS[label][k] = v
+
+static_tables.register("MVS_parameters_list", "MVS_parameters_list.csv", parse_parameters_list)
+
+PARAMETERS = LazyTable("MVS_parameters_list")
 
 parameters_helper = KPIFinder(param_info_dict=PARAMETERS, unit_header=":Unit:")
 
@@ -62,6 +71,40 @@ def format_scenario_for_mvs(scenario_to_convert, testing=False):
     return remove_empty_elements(dumped_data)
 
 
+# Keys of the MVS payload which identify the project/scenario but do not influence the simulation results
+PAYLOAD_HASH_IGNORED_PROJECT_KEYS = ("project_id", "project_name", "scenario_id", "scenario_name")
+PAYLOAD_HASH_IGNORED_KEYS = ("unique_id",)
+
+
+def normalize_mvs_payload(d):
+    """Remove the identifiers of the project, scenario and assets from a payload returned by format_scenario_for_mvs"""
+    if isinstance(d, list):
+        return [normalize_mvs_payload(v) for v in d]
+    elif isinstance(d, dict):
+        answer = {k: normalize_mvs_payload(v) for k, v in d.items() if k not in PAYLOAD_HASH_IGNORED_KEYS}
+        if isinstance(answer.get("project_data"), dict):
+            answer["project_data"] = {
+                k: v for k, v in answer["project_data"].items() if k not in PAYLOAD_HASH_IGNORED_PROJECT_KEYS
+            }
+        # the order of the assets connected to a bus depends on their ids
+        for bus in answer.get("energy_busses", []):
+            if isinstance(bus, dict) and isinstance(bus.get("assets"), list):
+                bus["assets"] = sorted(bus["assets"], key=str)
+        return answer
+    else:
+        return d
+
+
+def mvs_payload_hash(payload):
+    """Return a sha256 hex digest of the normalized MVS payload
+
+    Two scenarios with the same hash are simulated with the exact same inputs, for example after the duplication of a
+    project, so the results of one can be reused for the other
+    """
+    normalized = json.dumps(normalize_mvs_payload(payload), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
 def sensitivity_analysis_payload(
     variable_parameter_name="",
     variable_parameter_range="",
@@ -197,6 +240,9 @@ class DualInputWidget(forms.MultiWidget):
 
 
 class DualNumberField(forms.MultiValueField):
+    # number of timesteps of the scenario, the uploaded timeseries must match it if provided
+    n_timesteps = None
+
     def __init__(self, default=None, param_name=None, **kwargs):
         fields = (forms.DecimalField(required=False), forms.CharField(required=False))
         kwargs.pop("max_length", None)
@@ -211,7 +257,7 @@ class DualNumberField(forms.MultiValueField):
         scalar_value, timeseries_file = values
 
         if timeseries_file is not None:
-            input_timeseries_values = parse_input_timeseries(timeseries_file)
+            input_timeseries_values = parse_input_timeseries(timeseries_file, n_timesteps=self.n_timesteps)
             answer = input_timeseries_values
         else:
             if scalar_value is None:
@@ -355,6 +401,9 @@ class TimeseriesInputWidget(forms.MultiWidget):
 
 
 class TimeseriesField(forms.MultiValueField):
+    # number of timesteps of the scenario, the uploaded timeseries must match it if provided
+    n_timesteps = None
+
     def __init__(self, default=None, param_name=None, asset_type=None, qs_ts=None, **kwargs):
         fields = (
             forms.DecimalField(required=False),
@@ -376,7 +425,7 @@ class TimeseriesField(forms.MultiValueField):
         scalar_value, timeseries_id, timeseries_file = values
 
         if timeseries_file is not None:
-            input_timeseries_values = parse_input_timeseries(timeseries_file)
+            input_timeseries_values = parse_input_timeseries(timeseries_file, n_timesteps=self.n_timesteps)
             answer = input_timeseries_values
             input_dict = dict(type="upload", extra_info=timeseries_file.name)
         elif timeseries_id != "":
@@ -471,73 +520,13 @@ class TimeseriesField(forms.MultiValueField):
             widget.attrs["class"] = " ".join(css)
 
 
-def parse_csv_timeseries(file_str):
-    io_string = io.StringIO(file_str)
-    delimiter = ","
-    if file_str.count(";") > 0:
-        delimiter = ";"
-
-    # check if the number of , is an integer time the number of line return
-    # if not, the , is probably not a column separator and a decimal separator indeed
-    if file_str.count(",") % (file_str.count("\n") + 1) != 0:
-        delimiter = ";"
-
-    reader = csv.reader(io_string, delimiter=delimiter)
-    timeseries_values = []
-    for row in reader:
-        if len(row) == 1:
-            value = row[0]
-        else:
-            # assumes the first row is timestamps and read the second one, ignore any other row
-            value = row[1]
-        # convert potential comma used as decimal point to decimal point
-        timeseries_values.append(float(value.replace(",", ".")))
-    return timeseries_values
-
-
-def parse_input_timeseries(timeseries_file):
-    if timeseries_file.name.endswith("xls") or timeseries_file.name.endswith("xlsx"):
-        wb = load_workbook(filename=timeseries_file)
-        worksheet = wb.active
-        timeseries_values = []
-        n_col = worksheet.max_column
-
-        col_idx = 0
-
-        if n_col > 1:
-            col_idx = 1
+def parse_input_timeseries(timeseries_file, n_timesteps=None):
+    """Parse an uploaded timeseries file, see projects.timeseries_parser for the supported formats
 
-        for j in range(0, worksheet.max_row):
-            try:
-                timeseries_values.append(float(worksheet.cell(row=j + 1, column=col_idx + 1).value))
-            except ValueError:
-                pass
-
-    else:
-        timeseries_file_str = timeseries_file.read().decode("utf-8")
-
-        if timeseries_file_str != "":
-            if timeseries_file.name.endswith("json"):
-                timeseries_values = json.loads(timeseries_file_str)
-            elif timeseries_file.name.endswith("csv"):
-                timeseries_values = parse_csv_timeseries(timeseries_file_str)
-
-            elif timeseries_file.name.endswith("txt"):
-                nlines = timeseries_file_str.count("\n") + 1
-                if nlines == 1:
-                    timeseries_values = json.loads(timeseries_file_str)
-                else:
-                    timeseries_values = parse_csv_timeseries(timeseries_file_str)
-            else:
-                raise TypeError(
-                    _(
-                        f'Input timeseries file type of "{timeseries_file.name}" is not supported. The supported formats are "json", "csv", "txt", "xls" and "xlsx"'
-                    )
-                )
-        else:
-            raise ValidationError(
-                _('Input timeseries file "%(fname)s" is empty'),
-                code="empty_file",
-                params={"fname": timeseries_file.name},
-            )
-    return timeseries_values
+    :param timeseries_file: uploaded file
+    :param n_timesteps: if provided, number of timesteps of the scenario a timeseries must match
+    :return: list of the values
+    """
+    values = read_timeseries_file(timeseries_file)
+    check_timeseries_length(values, n_timesteps, fname=timeseries_file.name)
+    return values.tolist()
@@ -0,0 +1,266 @@
+"""Incremental reading of large JSON documents
+
+The answers of the MVS API contain the results of a simulation as a JSON string, which itself contains the raw flows
+of the simulation as another JSON string. Decoding such an answer at once holds several copies of it in memory, the
+flow matrix being moreover decoded into nested lists of Python floats. A JSONStream reads a document from a text file
+a chunk at a time instead: the values are either decoded, kept as raw JSON text or skipped one after the other, and a
+string value can itself be read as a text file, so that the nested documents are read incrementally as well.
+"""
+
+import json
+import re
+
+CHUNK_SIZE = 1 << 16
+
+# characters changing the nesting level or the string state while scanning a value
+_STRUCTURE = re.compile(r'[\[\]{}"\\]')
+_STRING = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r"[\s,\]}]")
+_WHITESPACE = re.compile(r"\s*")
+
+
+class JSONStream:
+    """Reader of the values of a JSON document, one at a time
+
+    The object members are iterated with items() and the array elements with elements(). Each member or element must
+    be consumed (with load, read_raw, skip, string_reader or a nested iteration) before the iteration goes on.
+    """
+
+    def __init__(self, fp, chunk_size=CHUNK_SIZE):
+        """
+        :param fp: text file like object, only its read(size) method is used
+        """
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self._string_reader = None
+
+    def _refill(self):
+        """Append the next chunk of the file to the unread part of the buffer, return False at the end of the file"""
+        chunk = self.fp.read(self.chunk_size)
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return chunk != ""
+
+    def peek(self):
+        """Skip the whitespaces and return the next character, "" at the end of the document"""
+        if self._string_reader is not None:
+            # skip the rest of the last string read as a file
+            while self._string_reader.closed is False:
+                self._string_reader.read(self.chunk_size)
+            self._string_reader = None
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if self._refill() is False:
+                return ""
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in the JSON document, found '{found}'")
+        self.pos += 1
+
+    def _scan(self, keep):
+        """Move after the next value, return its raw text if keep is True"""
+        parts = []
+        first = self.peek()
+        if first == "":
+            raise ValueError("Unexpected end of the JSON document")
+        start = self.pos
+
+        if first not in '{["':
+            # number, true, false or null
+            while True:
+                match = _SCALAR_END.search(self.buffer, self.pos)
+                if match is not None:
+                    self.pos = match.start()
+                    break
+                parts.append(self.buffer[start:])
+                self.pos = len(self.buffer)
+                start = 0
+                if self._refill() is False:
+                    break
+            parts.append(self.buffer[start : self.pos])
+            return "".join(parts) if keep else None
+
+        depth = 0
+        in_string = False
+        i = self.pos
+        while True:
+            match = (_STRING if in_string else _STRUCTURE).search(self.buffer, i) if i < len(self.buffer) else None
+            if match is None:
+                # the value goes on in the next chunk, an escaped character may even start it
+                if keep:
+                    parts.append(self.buffer[start:])
+                offset = max(i - len(self.buffer), 0)
+                self.pos = len(self.buffer)
+                if self._refill() is False:
+                    raise ValueError("Unexpected end of the JSON document")
+                start = 0
+                i = offset
+                continue
+            char = match.group()
+            i = match.end()
+            if char == "\\":
+                i += 1
+            elif char == '"':
+                in_string = not in_string
+                if in_string is False and depth == 0:
+                    break
+            elif char in "[{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    break
+        self.pos = i
+        if keep:
+            parts.append(self.buffer[start:i])
+            return "".join(parts)
+        return None
+
+    def read_raw(self):
+        """Return the raw JSON text of the next value"""
+        return self._scan(keep=True)
+
+    def skip(self):
+        self._scan(keep=False)
+
+    def load(self):
+        """Decode the next value"""
+        return json.loads(self.read_raw())
+
+    def _members(self, opening, closing, with_keys):
+        self.expect(opening)
+        if self.peek() == closing:
+            self.pos += 1
+            return
+        while True:
+            if with_keys is True:
+                key = self.load()
+                self.expect(":")
+                yield key
+            else:
+                yield None
+            char = self.peek()
+            self.pos += 1
+            if char == closing:
+                return
+            if char != ",":
+                raise ValueError(f"Expected ',' or '{closing}' in the JSON document, found '{char}'")
+
+    def items(self):
+        """Iterate over the keys of the next object, the stream being positioned on the value of each key"""
+        return self._members("{", "}", with_keys=True)
+
+    def elements(self):
+        """Iterate over the next array, the stream being positioned on each element"""
+        return self._members("[", "]", with_keys=False)
+
+    def array_chunks(self):
+        """Iterate over the next array, whose elements are arrays of numbers, decoding the elements a chunk at a time
+
+        This is much faster than decoding the elements one by one, e.g. for the rows of a large matrix.
+
+        :return: iterator over lists of the decoded elements
+        """
+        self.expect("[")
+        while True:
+            char = self.peek()
+            if char == "]":
+                self.pos += 1
+                return
+            if char == ",":
+                self.pos += 1
+                continue
+            if char != "[":
+                raise ValueError(f"Expected an array in the JSON document, found '{char}'")
+            # end of the last element which is complete in the buffer, the elements having exactly one "[" and "]"
+            end = self.buffer.rfind("]", self.pos)
+            if end != -1 and self.buffer.count("]", self.pos, end + 1) > self.buffer.count("[", self.pos, end + 1):
+                # this is the end of the array itself
+                end = self.buffer.rfind("]", self.pos, end)
+            if end < self.pos:
+                if self._refill() is False:
+                    raise ValueError("Unexpected end of the JSON document")
+                continue
+            elements = json.loads(f"[{self.buffer[self.pos : end + 1]}]")
+            self.pos = end + 1
+            yield elements
+
+    def string_reader(self):
+        """Return a text file like object reading the decoded content of the next value, which is a string"""
+        self.expect('"')
+        self._string_reader = JSONStringReader(self)
+        return self._string_reader
+
+
+class JSONStringReader:
+    """Text file like object decoding a JSON string of a JSONStream chunk by chunk"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.closed = False
+
+    def _segment_end(self, buffer, pos, limit):
+        """Return the end of the part of the string which can be decoded and whether it is the end of the string
+
+        An escape sequence (and a surrogate pair) split between two chunks is left for the next read.
+        """
+        stop = len(buffer) if limit is None else min(len(buffer), pos + limit)
+        i = pos
+        while True:
+            match = _STRING.search(buffer, i, stop) if i < stop else None
+            if match is None:
+                return max(i, stop), False
+            j = match.start()
+            if match.group() == '"':
+                return j, True
+            length = 6 if buffer[j + 1 : j + 2] == "u" else 2
+            if length == 6 and buffer[j + 2 : j + 3] in "dD" and buffer[j + 3 : j + 4] in "89abAB":
+                # high surrogate, decode it together with the low surrogate following it
+                if j + 8 > len(buffer):
+                    return j, False
+                if buffer[j + 6 : j + 8] == "\\u":
+                    length = 12
+            if j + length > len(buffer):
+                return j, False
+            i = j + length
+
+    def read(self, size=-1):
+        parts = []
+        total = 0
+        stream = self.stream
+        while self.closed is False and (size is None or size < 0 or total < size):
+            if stream.pos >= len(stream.buffer) and stream._refill() is False:
+                raise ValueError("Unterminated string in the JSON document")
+            limit = None if size is None or size < 0 else size - total
+            end, closed = self._segment_end(stream.buffer, stream.pos, limit)
+            if end == stream.pos and closed is False:
+                # incomplete escape sequence at the end of the buffer
+                if stream._refill() is False:
+                    raise ValueError("Unterminated string in the JSON document")
+                continue
+            text = json.loads(f'"{stream.buffer[stream.pos : end]}"')
+            stream.pos = end + 1 if closed else end
+            self.closed = closed
+            parts.append(text)
+            total += len(text)
+        return "".join(parts)
+
+
+class TextReader:
+    """Text file like object reading a string, without copying it as io.StringIO does"""
+
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+
+    def read(self, size=-1):
+        end = len(self.text) if size is None or size < 0 else self.pos + size
+        chunk = self.text[self.pos : end]
+        self.pos += len(chunk)
+        return chunk
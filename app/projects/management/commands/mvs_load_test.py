@@ -0,0 +1,118 @@
+import time
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from epa.settings import MVS_POST_URL
+from projects.constants import DONE, PENDING
+from projects.helpers import format_scenario_for_mvs
+from projects.models import Scenario, Simulation
+from projects.requests import mvs_simulation_request, mvs_simulation_check_status, parse_mvs_results
+
+REQUEST_FAILED = "REQUEST_FAILED"
+TIMEOUT = "TIMEOUT"
+
+
+class Command(BaseCommand):
+    help = (
+        "Submit concurrent simulation requests of the given scenarios to the MVS API (or the local stand-in, "
+        "see the mvs_standin command) and report the time until their results are available"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("scen_id", nargs="+", type=int, help="Scenarios to submit, used in turn")
+        parser.add_argument("-n", "--number", type=int, default=10, help="Total number of simulation requests")
+        parser.add_argument("--concurrency", type=int, default=10, help="Number of requests in flight")
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="Time (s) between two status checks")
+        parser.add_argument("--timeout", type=float, default=600.0, help="Time (s) after which a request is dropped")
+        parser.add_argument(
+            "--ingest",
+            action="store_true",
+            help="Parse the results into the database (within a transaction rolled back afterwards)",
+        )
+
+    def handle(self, *args, **options):
+        payloads = []
+        for scen_id in options["scen_id"]:
+            try:
+                scenario = Scenario.objects.get(pk=scen_id)
+            except Scenario.DoesNotExist:
+                raise CommandError(f'Scenario "{scen_id}" does not exist')
+            payloads.append((scen_id, format_scenario_for_mvs(scenario)))
+
+        self.options = options
+        # ingestion writes to the database, it is serialized to avoid lock errors with SQLite
+        self.ingest_lock = threading.Lock()
+        jobs = [payloads[i % len(payloads)] for i in range(options["number"])]
+
+        self.stdout.write(f"Submitting {len(jobs)} simulations to {MVS_POST_URL} ({options['concurrency']} at a time)")
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as pool:
+            reports = list(pool.map(lambda job: self.run_job(*job), jobs))
+        total_time = time.perf_counter() - start
+
+        self.print_report(reports, total_time)
+
+    def run_job(self, scen_id, payload):
+        """Submit a simulation, poll its status until it is finished and optionally parse the results"""
+        report = dict(status=REQUEST_FAILED, time_to_results=None, ingestion=None)
+        start = time.perf_counter()
+        answer = mvs_simulation_request(payload)
+        if answer is None:
+            return report
+
+        token = answer["id"]
+        status = answer["status"]
+        while status == PENDING:
+            if time.perf_counter() - start > self.options["timeout"]:
+                status = TIMEOUT
+                break
+            time.sleep(self.options["poll_interval"])
+            response = mvs_simulation_check_status(token)
+            # transient errors of the API are retried at the next poll
+            if response is not None:
+                answer = response
+                status = answer["status"]
+
+        report["status"] = status
+        if status == DONE and self.options["ingest"] is True:
+            with self.ingest_lock:
+                ingestion_start = time.perf_counter()
+                self.ingest(scen_id, answer["results"])
+                report["ingestion"] = time.perf_counter() - ingestion_start
+        if status != TIMEOUT:
+            report["time_to_results"] = time.perf_counter() - start
+        return report
+
+    def ingest(self, scen_id, results):
+        try:
+            with transaction.atomic():
+                Simulation.objects.filter(scenario_id=scen_id).delete()
+                simulation = Simulation.objects.create(scenario_id=scen_id, start_date=datetime.now(), status=DONE)
+                parse_mvs_results(simulation, results)
+                transaction.set_rollback(True)
+        finally:
+            # each worker thread opens its own connection
+            connection.close()
+
+    def print_report(self, reports, total_time):
+        statuses = Counter(report["status"] for report in reports)
+        self.stdout.write(", ".join(f"{status}: {count}" for status, count in statuses.items()))
+
+        for key, label in (("time_to_results", "Time to results"), ("ingestion", "Ingestion")):
+            timings = np.array([report[key] for report in reports if report[key] is not None])
+            if timings.size == 0:
+                continue
+            p50, p95 = np.percentile(timings, [50, 95])
+            self.stdout.write(
+                f"{label} (s): min {timings.min():.2f}, median {p50:.2f}, p95 {p95:.2f}, max {timings.max():.2f}"
+            )
+
+        self.stdout.write(
+            f"Total: {total_time:.1f}s, throughput {statuses.get(DONE, 0) / total_time * 60:.1f} simulations/min"
+        )
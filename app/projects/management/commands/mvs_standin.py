@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+
+from projects.mvs_standin import create_standin_server
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a local stand-in of the MVS API returning synthetic results. "
+        "Point the app to it with MVS_API_HOST=http://<host>:<port> and USE_PROXY=False"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+        parser.add_argument("--port", type=int, default=5001, help="Port to listen on")
+        parser.add_argument(
+            "--latency", type=float, default=5.0, help="Mean duration (s) before the results of a job are available"
+        )
+        parser.add_argument("--jitter", type=float, default=0.0, help="Uniform variation (s) around the latency")
+        parser.add_argument(
+            "--failure-rate", type=float, default=0.0, help="Probability for a simulation to end with an ERROR status"
+        )
+        parser.add_argument(
+            "--http-error-rate", type=float, default=0.0, help="Probability for a request to be answered with a 503"
+        )
+        parser.add_argument(
+            "--timesteps", type=int, default=None, help="Length of the result flows, derived from the scenario if unset"
+        )
+        parser.add_argument(
+            "--extra-flows", type=int, default=0, help="Number of dummy flows added to the results of each simulation"
+        )
+
+    def handle(self, *args, **options):
+        server = create_standin_server(
+            host=options["host"],
+            port=options["port"],
+            http_error_rate=options["http_error_rate"],
+            latency=options["latency"],
+            jitter=options["jitter"],
+            failure_rate=options["failure_rate"],
+            n_timesteps=options["timesteps"],
+            extra_flows=options["extra_flows"],
+        )
+        host, port = server.server_address[:2]
+        self.stdout.write(f"MVS stand-in server listening on http://{host}:{port}, stop it with CTRL-C")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from projects.constants import PENDING
+from projects.metrics import STAGES, collect_stage_durations
+from projects.models import Simulation
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+class Command(BaseCommand):
+    help = "Print percentile summaries of the durations of the lifecycle stages of the stored simulations"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=float, default=None, help="Only consider the simulations of the last days")
+        parser.add_argument("--status", default=None, help="Only consider the simulations with this status")
+
+    def handle(self, *args, **options):
+        qs = Simulation.objects.all()
+        if options["days"] is not None:
+            qs = qs.filter(start_date__gte=datetime.now() - timedelta(days=options["days"]))
+        if options["status"] is not None:
+            qs = qs.filter(status=options["status"])
+        timings_list = list(qs.values_list("timings", flat=True))
+
+        self.stdout.write(f"{len(timings_list)} simulations, {qs.filter(status=PENDING).count()} pending")
+        header = "".join(f"p{p:<9}" for p in PERCENTILES)
+        self.stdout.write(f"{'stage (s)':<16}{'count':<8}{header}{'max':<10}")
+        for stage, values in collect_stage_durations(timings_list).items():
+            if values.size == 0:
+                self.stdout.write(f"{stage:<16}{0:<8}")
+                continue
+            percentiles = "".join(f"{value:<10.3f}" for value in np.percentile(values, PERCENTILES))
+            self.stdout.write(f"{stage:<16}{values.size:<8}{percentiles}{values.max():<10.3f}")
+
+        polls = sum((timings or {}).get("polls", 0) for timings in timings_list)
+        poll_hits = sum((timings or {}).get("poll_hits", 0) for timings in timings_list)
+        if polls:
+            self.stdout.write(f"Status checks: {polls}, hit rate {poll_hits / polls:.1%}")
+        self.stdout.write("\n".join(f"  {stage}: {description}" for stage, description in STAGES.items()))
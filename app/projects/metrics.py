@@ -0,0 +1,153 @@
+"""Timing of the stages of the lifecycle of the simulations
+
+Each Simulation keeps the durations of its stages (in seconds) in its `timings` field, together with the bookkeeping of
+the status checks of the MVS API:
+
+    {
+        "stages": {"serialization": 0.21, "mvs_post": 0.4, "queue_wait": 95.2, ...},
+        "submitted_at": 1700000000.0,
+        "last_pending_poll_at": 1700000095.6,
+        "polls": 7,
+        "poll_hits": 1,
+    }
+
+The stages are listed in STAGES. queue_wait and poll_latency split the time until the results are fetched: queue_wait
+is certainly spent on the MVS side (queue and optimization), poll_latency is an upper bound of the delay added by our
+polling interval.
+
+The metrics of all stored simulations are exposed in the Prometheus text format by the simulation_metrics view and
+summarized by the simulation_timings management command.
+"""
+
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+from projects.constants import PENDING
+
+STAGES = {
+    "serialization": "Serialization of the scenario into the MVS payload (format_scenario_for_mvs)",
+    "mvs_post": "Submission of the payload to the MVS API",
+    "queue_wait": "Time between the submission and the last status check finding the simulation still pending",
+    "poll_latency": "Time between the last status check finding the simulation pending and the one finding it finished",
+    "status_check": "Cumulated duration of the status requests to the MVS API",
+    "ingestion": "Parsing of the results into the database (parse_mvs_results)",
+    "first_render": "Computation and rendering of the results page the first time it is visited",
+}
+
+# upper bounds (s) of the buckets of the stage durations histogram
+STAGE_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800)
+
+METRICS_PREFIX = "epa_simulation"
+
+
+def simulation_stages(simulation):
+    """Return the dict of the stage durations of the simulation, creating it if needed"""
+    if not simulation.timings:
+        simulation.timings = {}
+    return simulation.timings.setdefault("stages", {})
+
+
+@contextmanager
+def stage_timer(timings, stage):
+    """Add the duration of the block to the given stage of a stage durations dict"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = round(timings.get(stage, 0) + time.perf_counter() - start, 6)
+
+
+def record_submission(simulation, stages):
+    """Store the stages measured before the Simulation instance existed and mark the submission time"""
+    simulation_stages(simulation).update(stages)
+    simulation.timings["submitted_at"] = time.time()
+
+
+def record_poll(simulation, finished):
+    """Count a status check of the simulation and split the waiting time once it is finished
+
+    :param simulation: Simulation instance
+    :param finished: True if the status check found the simulation finished (done or error)
+    """
+    now = time.time()
+    stages = simulation_stages(simulation)
+    timings = simulation.timings
+    timings["polls"] = timings.get("polls", 0) + 1
+    if finished is False:
+        timings["last_pending_poll_at"] = now
+        return
+
+    timings["poll_hits"] = timings.get("poll_hits", 0) + 1
+    submitted_at = timings.get("submitted_at")
+    if submitted_at is not None:
+        last_pending_poll_at = timings.get("last_pending_poll_at", submitted_at)
+        stages["queue_wait"] = round(last_pending_poll_at - submitted_at, 6)
+        stages["poll_latency"] = round(now - last_pending_poll_at, 6)
+
+
+def record_first_render(simulation, start):
+    """Store the render duration of the results page if it is the first one since the simulation finished
+
+    :param simulation: Simulation instance
+    :param start: value of time.perf_counter() at the beginning of the rendering
+    """
+    if simulation is None or simulation.status == PENDING:
+        return
+    stages = simulation_stages(simulation)
+    if "first_render" not in stages:
+        stages["first_render"] = round(time.perf_counter() - start, 6)
+        simulation.save(update_fields=["timings"])
+
+
+def collect_stage_durations(timings_list):
+    """Gather the durations of each stage over several simulations
+
+    :param timings_list: iterable over the `timings` field of simulations
+    :return: dict mapping each stage of STAGES to a numpy array of its durations
+    """
+    durations = {stage: [] for stage in STAGES}
+    for timings in timings_list:
+        for stage, duration in (timings or {}).get("stages", {}).items():
+            if stage in durations:
+                durations[stage].append(duration)
+    return {stage: np.array(values, dtype=float) for stage, values in durations.items()}
+
+
+def prometheus_metrics(timings_list, pending):
+    """Render the simulation metrics in the Prometheus text exposition format
+
+    :param timings_list: iterable over the `timings` field of simulations
+    :param pending: number of simulations waiting for the MVS API
+    :return: str
+    """
+    timings_list = list(timings_list)
+    durations = collect_stage_durations(timings_list)
+    buckets = np.array(STAGE_BUCKETS, dtype=float)
+
+    name = f"{METRICS_PREFIX}_stage_duration_seconds"
+    lines = [f"# HELP {name} Duration of the stages of the simulations", f"# TYPE {name} histogram"]
+    for stage, values in durations.items():
+        cumulative_counts = (values[:, None] <= buckets).sum(axis=0)
+        for bound, count in zip(STAGE_BUCKETS, cumulative_counts):
+            lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {count}')
+        lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {values.size}')
+        lines.append(f'{name}_sum{{stage="{stage}"}} {values.sum():.6f}')
+        lines.append(f'{name}_count{{stage="{stage}"}} {values.size}')
+
+    polls = sum((timings or {}).get("polls", 0) for timings in timings_list)
+    poll_hits = sum((timings or {}).get("poll_hits", 0) for timings in timings_list)
+    hit_ratio = round(poll_hits / polls, 6) if polls else 0.0
+    for metric, kind, help_text, value in (
+        ("pending", "gauge", "Number of simulations waiting for the MVS API", pending),
+        ("polls_total", "counter", "Number of status checks of the simulations", polls),
+        ("poll_hits_total", "counter", "Number of status checks finding the simulation finished", poll_hits),
+        ("poll_hit_ratio", "gauge", "Share of the status checks finding the simulation finished", hit_ratio),
+    ):
+        lines += [
+            f"# HELP {METRICS_PREFIX}_{metric} {help_text}",
+            f"# TYPE {METRICS_PREFIX}_{metric} {kind}",
+            f"{METRICS_PREFIX}_{metric} {value}",
+        ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.4 on 2026-10-19 13:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0024_bus_price_alter_assettype_asset_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="simulation",
+            name="payload_hash",
+            field=models.CharField(blank=True, db_index=True, max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.4 on 2026-10-19 13:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0025_simulation_payload_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="simulation",
+            name="timings",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.4 on 2026-10-19 14:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0026_simulation_timings"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="simulation",
+            name="status_check_lock",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="simulation",
+            name="status_checked_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.4 on 2026-10-19 14:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0027_simulation_status_check"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExchangeRate",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("currency", models.CharField(max_length=3, unique=True)),
+                ("rate", models.FloatField()),
+                ("updated_at", models.DateTimeField()),
+            ],
+        ),
+    ]
@@ -1,6 +1,5 @@
 import json
 import uuid
-from datetime import timedelta
 
 import oemof.thermal.compression_heatpumps_and_chillers as cmpr_hp_chiller
 from django.conf import settings
@@ -30,6 +29,7 @@ from projects.constants import (
     TIMESERIES_TYPES,
 )
 from users.models import CustomUser
+from projects.time_index import compact_time_axis, scenario_time_axis, time_index, time_index_json
 
 
 class Feedback(models.Model):
@@ -57,6 +57,17 @@ class EconomicData(models.Model):
         return CURRENCY_SYMBOLS.get(self.currency, self.currency)
 
 
+class ExchangeRate(models.Model):
+    """Last known price of a currency in relation to USD, see projects.exchange_rates"""
+
+    currency = models.CharField(max_length=3, unique=True)
+    rate = models.FloatField()
+    updated_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.currency}: {self.rate}"
+
+
 class Viewer(models.Model):
     share_rights = models.CharField(max_length=10, choices=(("edit", _("Edit")), ("read", _("Read"))))
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
@@ -149,6 +160,11 @@ class Project(models.Model):
                             f"The user registered under {email} for the project '{self.name}' already have '{share_rights}' access"
                         )
 
+            if success is True:
+                from projects.permissions import invalidate_project_permissions
+
+                invalidate_project_permissions(user.id)
+
         else:
             message = _("We could not find a user registered under the email address you provided: ") + email
         return (success, message)
@@ -164,6 +180,9 @@ class Project(models.Model):
         if viewers is not None:
             existing_viewers = viewers.intersection(self.viewers.all())
             if existing_viewers.exists():
+                from projects.permissions import invalidate_project_permissions
+
+                invalidate_project_permissions(*existing_viewers.values_list("user_id", flat=True))
                 for viewer_id in existing_viewers.values_list("id", flat=True):
                     self.viewers.remove(viewer_id)
                 success = True
@@ -208,18 +227,26 @@ class Scenario(models.Model):
     def __str__(self):
         return self.name
 
-    def get_timestamps(self, json_format=False):
-        answer = []
+    @property
+    def time_axis(self):
+        """(start, step in minutes, number of timestamps) of the scenario, see projects.time_index"""
+        return scenario_time_axis(self.start_date, self.time_step, self.evaluated_period)
+
+    def get_time_index(self):
+        """Return the timestamps of the scenario as a pandas.DatetimeIndex (memoized)"""
+        return time_index(*self.time_axis)
 
-        n_occurence_per_day = int((24 * 60) / self.time_step)
+    def get_timestamps(self, json_format=False, compact=False):
+        """Return the timestamps of the scenario
 
-        for i in range(self.evaluated_period):
-            for j in range(n_occurence_per_day):
-                iter_date = self.start_date + timedelta(days=i + 1, minutes=self.time_step * (j + 1))
-                if json_format is True:
-                    iter_date = iter_date.isoformat().replace("T", " ")
-                answer.append(iter_date)
-        return answer
+        :param json_format: if True, the timestamps are strings formatted for the browser
+        :param compact: if True, return the time axis as a {start, step, count} dict instead of the list of timestamps
+        """
+        if compact is True:
+            return compact_time_axis(*self.time_axis)
+        if json_format is True:
+            return list(time_index_json(*self.time_axis))
+        return self.get_time_index().to_pydatetime().tolist()
 
     def get_currency(self):
         return self.project.economic_data.currency
@@ -38,6 +38,13 @@ class Simulation(AbstractSimulation):
     user_rating = models.PositiveSmallIntegerField(
         null=True, choices=USER_RATING, default=None
     )
+    # hash of the normalized MVS payload, see projects.helpers.mvs_payload_hash
+    payload_hash = models.CharField(max_length=64, null=True, blank=True, db_index=True)
+    # durations of the lifecycle stages and status checks bookkeeping, see projects.metrics
+    timings = models.JSONField(default=dict, blank=True)
+    # start of the last status check with MVS and expiry of the lock of a running check, see projects.simulation_status
+    status_checked_at = models.DateTimeField(null=True, blank=True)
+    status_check_lock = models.DateTimeField(null=True, blank=True)
 
 
 class ParameterChangeTracker(models.Model):
@@ -0,0 +1,293 @@
+"""Local stand-in for the MVS API, used to test the simulation pipeline without the remote server
+
+The stand-in implements the endpoints used in projects/requests.py (see MVS_*_URL in epa/settings.py). The simulation
+requests are not optimized: the results are random flows for every asset of the posted scenario, formatted like the
+answers of the MVS API so they can be parsed by projects.requests.parse_mvs_results. The latency, the size of the
+results and the failure rates of the server are configurable, see the mvs_standin management command.
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from projects.constants import DONE, ERROR, PENDING
+
+logger = logging.getLogger(__name__)
+
+STANDIN_MVS_VERSION = "standin"
+ASSET_CATEGORIES = ("energy_providers", "energy_consumption", "energy_conversion", "energy_production")
+STORAGE_SUBASSETS = ("input_power", "output_power", "capacity")
+COST_MATRIX_CATEGORIES = (
+    "annuity_om",
+    "annuity_total",
+    "costs_investment_over_lifetime",
+    "costs_om_total",
+    "costs_total",
+    "costs_upfront_in_year_zero",
+    "levelized_cost_of_energy_of_asset",
+)
+SCALAR_KPIS = (
+    "annuity_om",
+    "annuity_total",
+    "costs_total",
+    "degree_of_autonomy",
+    "levelized_costs_of_electricity_equivalent",
+    "onsite_energy_fraction",
+    "renewable_factor",
+    "renewable_share_of_local_generation",
+    "total_emissions",
+    "total_excess",
+    "total_feedin",
+)
+
+
+def as_list(value):
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+
+def number_of_timesteps(payload):
+    settings = payload.get("simulation_settings", {})
+    evaluated_period = settings.get("evaluated_period", {}).get("value", 365)
+    time_step = settings.get("time_step", 60)
+    return int(evaluated_period * 24 * 60 / time_step)
+
+
+def payload_flows(payload):
+    """List the flows of the energy system described by a MVS payload
+
+    :param payload: output of projects.helpers.format_scenario_for_mvs
+    :return: list of (bus, energy_vector, direction, asset, asset_type, oemof_type) tuples, the direction is given
+    with respect to the bus, as in the raw results of the MVS
+    """
+    bus_vectors = {bus["label"]: bus["energy_vector"] for bus in payload.get("energy_busses", [])}
+    flows = []
+    for category in ASSET_CATEGORIES + ("energy_storage",):
+        for asset in payload.get(category, []):
+            for bus in as_list(asset.get("inflow_direction")):
+                flow = (bus, bus_vectors.get(bus, asset.get("energy_vector")), "out", asset["label"])
+                flows.append(flow + (asset.get("asset_type", ""), asset.get("type_oemof", "")))
+            for bus in as_list(asset.get("outflow_direction")):
+                flow = (bus, bus_vectors.get(bus, asset.get("energy_vector")), "in", asset["label"])
+                flows.append(flow + (asset.get("asset_type", ""), asset.get("type_oemof", "")))
+    return flows
+
+
+def synthetic_simulation_results(payload, n_timesteps=None, extra_flows=0, seed=None):
+    """Return random simulation results for the energy system of a MVS payload
+
+    :param payload: output of projects.helpers.format_scenario_for_mvs
+    :param n_timesteps: length of the flows, derived from the simulation settings of the payload if not provided
+    :param extra_flows: number of dummy flows added to the raw results to increase the size of the answer
+    :param seed: seed of the random number generator
+    :return: the results as a json string, as returned by the MVS API
+    """
+    rng = np.random.default_rng(seed)
+    if n_timesteps is None:
+        n_timesteps = number_of_timesteps(payload)
+
+    flows = payload_flows(payload)
+    bus = flows[0][0] if flows else "bus"
+    energy_vector = flows[0][1] if flows else "Electricity"
+    flows += [(bus, energy_vector, "in", f"standin_flow_{i}", "standin", "source") for i in range(extra_flows)]
+
+    values = rng.random((n_timesteps, len(flows))).round(4)
+    capacities = rng.random(len(flows)).round(2) * 100
+    raw_results = pd.DataFrame(np.vstack([values, capacities]), columns=pd.MultiIndex.from_tuples(flows))
+
+    asset_flows = {}
+    for i, flow in enumerate(flows):
+        asset_flows.setdefault(flow[3], (values[:, i], capacities[i]))
+
+    results = {}
+    for category in ASSET_CATEGORIES:
+        results[category] = []
+        for asset in payload.get(category, []):
+            flow, capacity = asset_flows.get(asset["label"], (np.zeros(n_timesteps), 0))
+            asset_results = {k: v for k, v in asset.items() if k != "input_timeseries"}
+            asset_results["flow"] = {"value": flow.tolist(), "unit": asset.get("unit", "kW")}
+            asset_results["optimizedAddCap"] = {"value": float(capacity), "unit": asset.get("unit", "kW")}
+            results[category].append(asset_results)
+
+    results["energy_storage"] = []
+    for asset in payload.get("energy_storage", []):
+        flow, capacity = asset_flows.get(asset["label"], (np.zeros(n_timesteps), 0))
+        asset_results = {k: v for k, v in asset.items() if k not in STORAGE_SUBASSETS}
+        for sub_asset in STORAGE_SUBASSETS:
+            sub_results = dict(asset.get(sub_asset, {}))
+            sub_results["flow"] = {"value": flow.tolist(), "unit": "kW"}
+            sub_results["optimizedAddCap"] = {"value": float(capacity), "unit": "kW"}
+            asset_results[sub_asset] = sub_results
+        results["energy_storage"].append(asset_results)
+
+    labels = [asset["label"] for category in results for asset in results[category]]
+    results["kpi"] = {
+        "scalars": {kpi: float(rng.random()) for kpi in SCALAR_KPIS},
+        "cost_matrix": {label: {c: float(rng.random() * 1000) for c in COST_MATRIX_CATEGORIES} for label in labels},
+    }
+    results["raw_results"] = raw_results.to_json(orient="split")
+    return json.dumps(results)
+
+
+def synthetic_sensitivity_analysis_steps(payload, seed=None):
+    """Return one random value for each output parameter and each step of a sensitivity analysis payload"""
+    rng = np.random.default_rng(seed)
+    settings = payload.get("sensitivity_analysis_settings", {})
+    output_names = settings.get("output_parameter_names", [])
+    return [
+        {name: {"value": [float(rng.random())], "path": name} for name in output_names}
+        for _ in as_list(settings.get("variable_parameter_range"))
+    ]
+
+
+class StandinJobStore:
+    """Keep track of the jobs submitted to the stand-in server
+
+    :param latency: mean duration in seconds between the submission of a job and the availability of its results
+    :param jitter: the latency of each job is drawn uniformly within latency +/- jitter
+    :param failure_rate: probability for a job to end with an ERROR status
+    :param n_timesteps: length of the flows in the results, derived from the payload if None
+    :param extra_flows: number of dummy flows added to the results of each job
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, failure_rate=0.0, n_timesteps=None, extra_flows=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.n_timesteps = n_timesteps
+        self.extra_flows = extra_flows
+        self.jobs = {}
+        self.lock = threading.Lock()
+
+    def submit(self, payload, sensitivity_analysis=False):
+        token = str(uuid.uuid4())
+        latency = max(0.0, self.latency + random.uniform(-self.jitter, self.jitter))
+        job = dict(
+            payload=payload,
+            sensitivity_analysis=sensitivity_analysis,
+            ready_at=time.monotonic() + latency,
+            fails=random.random() < self.failure_rate,
+            results=None,
+        )
+        with self.lock:
+            self.jobs[token] = job
+        return token
+
+    def status(self, token):
+        """Return the answer of the MVS API to a status check of the job, None if the token is unknown"""
+        with self.lock:
+            job = self.jobs.get(token)
+        if job is None:
+            return None
+
+        answer = dict(server_info="MVS stand-in", mvs_version=STANDIN_MVS_VERSION, id=token, status=PENDING)
+        if time.monotonic() < job["ready_at"]:
+            if job["sensitivity_analysis"] is True:
+                # the schema of the sensitivity analysis answers requires those keys
+                answer["results"] = dict(reference_simulation_id=token, sensitivity_analysis_steps=[])
+            else:
+                answer["results"] = None
+        elif job["fails"] is True:
+            answer["status"] = ERROR
+            answer["results"] = {ERROR: "Simulated failure of the MVS stand-in server"}
+        else:
+            answer["status"] = DONE
+            if job["results"] is None:
+                if job["sensitivity_analysis"] is True:
+                    job["results"] = dict(
+                        reference_simulation_id=token,
+                        sensitivity_analysis_steps=synthetic_sensitivity_analysis_steps(job["payload"]),
+                    )
+                else:
+                    job["results"] = synthetic_simulation_results(
+                        job["payload"], n_timesteps=self.n_timesteps, extra_flows=self.extra_flows
+                    )
+            answer["results"] = job["results"]
+        return answer
+
+
+class StandinRequestHandler(BaseHTTPRequestHandler):
+    """Serve the MVS API endpoints, the job store and error rate are set on the server instance"""
+
+    def send_json(self, content, status=200):
+        body = json.dumps(content).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def transient_error(self):
+        if random.random() < self.server.http_error_rate:
+            self.send_json({"detail": "Simulated unavailability of the MVS stand-in server"}, status=503)
+            return True
+        return False
+
+    def do_POST(self):
+        if self.transient_error():
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length))
+        except (ValueError, json.decoder.JSONDecodeError):
+            self.send_json({"detail": "The payload is not valid json"}, status=422)
+            return
+
+        path = self.path.rstrip("/")
+        if path == "/sendjson/openplan/sensitivity-analysis":
+            token = self.server.store.submit(payload, sensitivity_analysis=True)
+            self.send_json(self.server.store.status(token))
+        elif path == "/sendjson":
+            if "energy_busses" not in payload or "simulation_settings" not in payload:
+                self.send_json({"detail": "The payload is not a MVS scenario"}, status=422)
+                return
+            token = self.server.store.submit(payload)
+            self.send_json(self.server.store.status(token))
+        else:
+            self.send_json({"detail": "Not found"}, status=404)
+
+    def do_GET(self):
+        if self.transient_error():
+            return
+        endpoint, _, token = self.path.strip("/").rpartition("/")
+        if endpoint in ("check", "check-sensitivity-analysis"):
+            answer = self.server.store.status(token)
+            if answer is None:
+                self.send_json({"detail": f"Unknown simulation id {token}"}, status=404)
+            else:
+                self.send_json(answer)
+        elif endpoint == "get_lp_file":
+            body = b"\\* LP file not available with the MVS stand-in server *\\\n"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self.send_json({"detail": "Not found"}, status=404)
+
+    def log_message(self, format, *args):
+        logger.debug(f"MVS stand-in: {format % args}")
+
+
+def create_standin_server(host="127.0.0.1", port=5001, http_error_rate=0.0, **store_kwargs):
+    """Return a stand-in server, call serve_forever() on it to start serving requests
+
+    :param http_error_rate: probability for a request to be answered with a 503 error
+    :param store_kwargs: keyword arguments passed to StandinJobStore
+    """
+    server = ThreadingHTTPServer((host, port), StandinRequestHandler)
+    server.daemon_threads = True
+    server.store = StandinJobStore(**store_kwargs)
+    server.http_error_rate = http_error_rate
+    return server
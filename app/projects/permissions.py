@@ -0,0 +1,134 @@
+"""Access rights of the users to the projects
+
+A user can read or edit a project if they own it or if it was shared with them (see Project.viewers). Instead of
+querying the viewers of a project for each check, the rights of a user to all projects are loaded with a single query
+the first time they are needed within a request and kept on the user instance of the request (request.user).
+
+The rights are exposed to the views through the project_rights_required decorator and to the templates through the
+project_permissions context variable (see epa.context_processors.project_permissions), e.g.
+{% if project.id in project_permissions.editable %}
+"""
+
+import inspect
+import itertools
+from functools import wraps
+
+from django.core.exceptions import PermissionDenied
+from django.db.models import CharField, Value
+from django.http import Http404
+
+from projects.models import Project
+
+OWNER = "owner"
+EDIT = "edit"
+READ = "read"
+RIGHTS_RANKS = {READ: 1, EDIT: 2, OWNER: 3}
+
+# generation of the rights of each user id in this process, bumped when the viewers of a project change so that a
+# resolver loaded earlier in the same request reloads the rights
+_generation_counter = itertools.count(1)
+_generations = {}
+
+
+def invalidate_project_permissions(*user_ids):
+    """Mark the loaded rights of the given users as outdated"""
+    for user_id in user_ids:
+        _generations[user_id] = next(_generation_counter)
+
+
+class ProjectPermissions:
+    """Rights of a user to all projects, loaded once from the database"""
+
+    def __init__(self, user):
+        self.user = user
+        self._rights = None
+        self._editable = None
+        self._generation = None
+
+    @property
+    def rights(self):
+        """Dict mapping the ids of the projects the user can access to their rights (OWNER, EDIT or READ)"""
+        generation = _generations.get(self.user.pk)
+        if self._rights is None or generation != self._generation:
+            self._generation = generation
+            self._rights = self.load()
+            self._editable = None
+        return self._rights
+
+    def load(self):
+        if not self.user.is_authenticated:
+            return {}
+        owned = Project.objects.filter(user=self.user).annotate(rights=Value(OWNER, output_field=CharField()))
+        shared = Project.viewers.through.objects.filter(viewer__user=self.user)
+        rights = {}
+        for proj_id, right in owned.values_list("id", "rights").union(
+            shared.values_list("project_id", "viewer__share_rights"), all=True
+        ):
+            # a project can be shared several times with the same user, the highest rights prevail
+            if RIGHTS_RANKS.get(right, 0) > RIGHTS_RANKS.get(rights.get(proj_id), 0):
+                rights[proj_id] = right
+        return rights
+
+    def get(self, proj_id):
+        try:
+            return self.rights.get(int(proj_id))
+        except (TypeError, ValueError):
+            return None
+
+    def is_owner(self, proj_id):
+        return self.get(proj_id) == OWNER
+
+    def can_edit(self, proj_id):
+        return self.get(proj_id) in (OWNER, EDIT)
+
+    def can_read(self, proj_id):
+        return self.get(proj_id) in (OWNER, EDIT, READ)
+
+    @property
+    def editable(self):
+        """Ids of the projects the user can edit"""
+        rights = self.rights
+        if self._editable is None:
+            self._editable = {proj_id for proj_id, right in rights.items() if right in (OWNER, EDIT)}
+        return self._editable
+
+    @property
+    def readable(self):
+        """Ids of the projects the user can read"""
+        return self.rights.keys()
+
+
+def get_project_permissions(user):
+    """Return the ProjectPermissions of the user, memoized on the user instance (request.user lives as long as the
+    request)"""
+    permissions = getattr(user, "_project_permissions", None)
+    if permissions is None:
+        permissions = ProjectPermissions(user)
+        setattr(user, "_project_permissions", permissions)
+    return permissions
+
+
+def project_rights_required(rights=EDIT, proj_kwarg="proj_id"):
+    """Decorator of the views taking a project id, raise PermissionDenied if the user of the request lacks the rights
+
+    :param rights: EDIT or READ (OWNER to restrict the view to the owner of the project)
+    :param proj_kwarg: name of the keyword argument of the view containing the project id
+    """
+    checks = {OWNER: "is_owner", EDIT: "can_edit", READ: "can_read"}
+
+    def decorator(view):
+        signature = inspect.signature(view)
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            proj_id = signature.bind_partial(request, *args, **kwargs).arguments.get(proj_kwarg)
+            permissions = get_project_permissions(request.user)
+            if not getattr(permissions, checks[rights])(proj_id):
+                if permissions.get(proj_id) is None and not Project.objects.filter(id=proj_id).exists():
+                    raise Http404("No Project matches the given query.")
+                raise PermissionDenied
+            return view(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,39 +1,64 @@
 from datetime import datetime
 import httpx as requests
+import codecs
 import json
+import shutil
+import tempfile
 import numpy as np
+from django.core.cache import cache
 
 # from requests.exceptions import HTTPError
-from epa.settings import PROXY_CONFIG, MVS_POST_URL, MVS_GET_URL, MVS_SA_POST_URL, MVS_SA_GET_URL, EXCHANGE_RATES_URL
+from epa.settings import (
+    PROXY_CONFIG,
+    MVS_POST_URL,
+    MVS_GET_URL,
+    MVS_SA_POST_URL,
+    MVS_SA_GET_URL,
+    MVS_RESULTS_SPOOL_SIZE,
+)
 from dashboard.models import (
     FancyResults,
     AssetsResults,
     KPICostsMatrixResults,
     KPIScalarResults,
     FlowResults,
+    BusBalance,
 )
 from projects.constants import DONE, PENDING, ERROR
+from projects.json_stream import JSONStream, TextReader
+from projects.metrics import record_poll, simulation_stages, stage_timer
+from projects.models import Simulation
 import logging
 
 logger = logging.getLogger(__name__)
 
+# cache key of the version of the MVS server reported in its last answer
+MVS_VERSION_CACHE_KEY = "mvs_version"
 
-def request_exchange_rate(currency):
-    try:
-        response = requests.get(EXCHANGE_RATES_URL)
-        response.raise_for_status()
 
-    except requests.HTTPError as http_err:
-        logger.warning(
-            f"An error occurred: {http_err}. Custom exchange rate could not "
-            f"be fetched, please enter it manually instead."
-        )
-        exchange_rate = 1
-    else:
-        data = response.json()
-        exchange_rate = round(data["conversion_rates"][currency], 2)
+def remember_mvs_version(version):
+    """Share the version of the MVS server reported in one of its answers with the other processes"""
+    if version:
+        cache.set(MVS_VERSION_CACHE_KEY, version, timeout=None)
+
 
-    return exchange_rate
+def current_mvs_version():
+    """Return the version of the MVS server reported in its last answer
+
+    The results of a simulation are only reused for a scenario with the same inputs if they were computed by this
+    version. If the version was evicted from the cache, the one of the simulation finished last is used (None if no
+    simulation ever finished)
+    """
+    version = cache.get(MVS_VERSION_CACHE_KEY)
+    if version is None:
+        version = (
+            Simulation.objects.filter(status__in=(DONE, ERROR))
+            .exclude(mvs_version=None)
+            .order_by("-end_date")
+            .values_list("mvs_version", flat=True)
+            .first()
+        )
+    return version
 
 
 def mvs_simulation_request(data: dict):
@@ -73,10 +98,53 @@ def mvs_simulation_check_status(token):
         logger.error(f"Other error occurred: {err}")
         return None
     else:
-        logger.info("Success!")
+        logger.debug("Success!")
         return json.loads(response.text)
 
 
+def spooled_file():
+    return tempfile.SpooledTemporaryFile(max_size=int(MVS_RESULTS_SPOOL_SIZE * 1024 * 1024))
+
+
+def mvs_simulation_check_status_stream(token):
+    """Same as mvs_simulation_check_status, without holding the whole answer of MVS in memory
+
+    The answer is streamed to a temporary file and read incrementally. If the results of the simulation are a JSON
+    string (i.e. the simulation is done), they are decoded to another temporary file, which is returned instead of the
+    string and should be closed by the caller.
+    """
+    body = spooled_file()
+    try:
+        with requests.stream("GET", MVS_GET_URL + token, proxies=PROXY_CONFIG, verify=False) as response:
+            response.raise_for_status()
+            for chunk in response.iter_bytes():
+                body.write(chunk)
+    except requests.HTTPError as http_err:
+        logger.error(f"HTTP error occurred: {http_err}")
+        body.close()
+        return None
+    except Exception as err:
+        logger.error(f"Other error occurred: {err}")
+        body.close()
+        return None
+
+    logger.debug("Success!")
+    answer = {}
+    with body:
+        body.seek(0)
+        stream = JSONStream(codecs.getreader("utf-8")(body))
+        for key in stream.items():
+            if key == "results" and stream.peek() == '"':
+                # the text is kept utf-8 encoded, a text file in memory would take up to 4 bytes per character
+                results = spooled_file()
+                shutil.copyfileobj(stream.string_reader(), codecs.getwriter("utf-8")(results))
+                results.seek(0)
+                answer[key] = codecs.getreader("utf-8")(results)
+            else:
+                answer[key] = stream.load()
+    return answer
+
+
 def mvs_sa_check_status(token):
     try:
         response = requests.get(MVS_SA_GET_URL + token, proxies=PROXY_CONFIG, verify=False)
@@ -88,20 +156,26 @@ def mvs_sa_check_status(token):
         logger.error(f"Other error occurred: {err}")
         return None
     else:
-        logger.info("Success!")
+        logger.debug("Success!")
         return json.loads(response.text)
 
 
 def fetch_mvs_simulation_results(simulation):
     if simulation.status == PENDING:
-        response = mvs_simulation_check_status(token=simulation.mvs_token)
+        stages = simulation_stages(simulation)
+        with stage_timer(stages, "status_check"):
+            response = mvs_simulation_check_status_stream(token=simulation.mvs_token)
+        record_poll(simulation, finished=response is not None and response.get("status") in (DONE, ERROR))
         try:
             simulation.status = response["status"]
             simulation.errors = json.dumps(response["results"][ERROR]) if simulation.status == ERROR else None
-            simulation.results = (
-                parse_mvs_results(simulation, response["results"]) if simulation.status == DONE else None
-            )
+            if simulation.status == DONE:
+                with stage_timer(stages, "ingestion"), response["results"] as results:
+                    parse_mvs_results(simulation, results)
+            # the results are saved in the result tables, the raw answer of MVS is not stored
+            simulation.results = None
             simulation.mvs_version = response["mvs_version"]
+            remember_mvs_version(simulation.mvs_version)
             logger.info(f"The simulation {simulation.id} is finished")
         except:
             simulation.status = ERROR
@@ -126,44 +200,105 @@ def fetch_mvs_sa_results(simulation):
     return simulation.status != PENDING
 
 
+MVS_ASSET_CATEGORIES = [
+    "energy_consumption",
+    "energy_conversion",
+    "energy_production",
+    "energy_providers",
+    "energy_storage",
+]
+
+
+def read_raw_results(stream):
+    """Read the raw results, a DataFrame saved to json using "split", the flow matrix being decoded a chunk of rows at a time
+
+    :param stream: JSONStream positioned on the raw results object
+    :return: the columns, the index and the data (as a float array, NaN for the missing values) of the raw results
+    """
+    columns = []
+    index = []
+    rows = []
+    for key in stream.items():
+        if key == "columns":
+            columns = stream.load()
+        elif key == "index":
+            index = stream.load()
+        elif key == "data":
+            rows = [np.array(chunk, dtype=float) for chunk in stream.array_chunks()]
+        else:
+            stream.skip()
+    data = np.vstack(rows) if rows else np.empty((0, len(columns)))
+    return columns, index, data
+
+
+def read_mvs_results(fp):
+    """Read the sections of the results of a simulation which are saved in the database
+
+    The KPIs and the asset categories are kept as raw JSON text and the other sections are skipped, so that only the
+    raw results are decoded.
+
+    :param fp: text file with the results of a simulation as returned by the MVS API
+    :return: dict with the JSON text of the "scalars" and "cost_matrix" KPIs, the JSON text of each asset category in
+        "assets" and the (columns, index, data) of the "raw_results", if they are in the results
+    """
+    sections = {"kpi": {}, "assets": {}}
+    stream = JSONStream(fp)
+    for key in stream.items():
+        if key == "kpi":
+            for kpi in stream.items():
+                if kpi in ("scalars", "cost_matrix"):
+                    sections["kpi"][kpi] = stream.read_raw()
+                else:
+                    stream.skip()
+        elif key in MVS_ASSET_CATEGORIES:
+            sections["assets"][key] = stream.read_raw()
+        elif key == "raw_results":
+            # the raw results are usually a JSON string themselves
+            raw_stream = JSONStream(stream.string_reader()) if stream.peek() == '"' else stream
+            sections["raw_results"] = read_raw_results(raw_stream)
+        else:
+            stream.skip()
+    return sections
+
+
 def parse_mvs_results(simulation, response_results):
-    data = json.loads(response_results)
-    asset_key_list = [
-        "energy_consumption",
-        "energy_conversion",
-        "energy_production",
-        "energy_providers",
-        "energy_storage",
-    ]
-
-    if not set(asset_key_list).issubset(data.keys()):
+    """Save the results of a simulation in the result tables
+
+    The results are not kept as a whole, only the sections saved in the tables are read from them
+
+    :param response_results: the results as a JSON string or as a text file
+    """
+    fp = TextReader(response_results) if isinstance(response_results, str) else response_results
+    data = read_mvs_results(fp)
+
+    if not set(MVS_ASSET_CATEGORIES).issubset(data["assets"].keys()):
         raise KeyError("There are missing keys from the received dictionary.")
 
     # Write Scalar KPIs to db
     qs = KPIScalarResults.objects.filter(simulation=simulation)
     if qs.exists():
         kpi_scalar = qs.first()
-        kpi_scalar.scalar_values = json.dumps(data["kpi"]["scalars"])
+        kpi_scalar.scalar_values = data["kpi"]["scalars"]
         kpi_scalar.save()
     else:
-        KPIScalarResults.objects.create(scalar_values=json.dumps(data["kpi"]["scalars"]), simulation=simulation)
+        KPIScalarResults.objects.create(scalar_values=data["kpi"]["scalars"], simulation=simulation)
     # Write Cost Matrix KPIs to db
     qs = KPICostsMatrixResults.objects.filter(simulation=simulation)
     if qs.exists():
         kpi_costs = qs.first()
-        kpi_costs.cost_values = json.dumps(data["kpi"]["cost_matrix"])
+        kpi_costs.cost_values = data["kpi"]["cost_matrix"]
         kpi_costs.save()
     else:
-        KPICostsMatrixResults.objects.create(cost_values=json.dumps(data["kpi"]["cost_matrix"]), simulation=simulation)
-    # Write Assets to db
-    data_subdict = {category: v for category, v in data.items() if category in asset_key_list}
+        KPICostsMatrixResults.objects.create(cost_values=data["kpi"]["cost_matrix"], simulation=simulation)
+    # Write Assets to db, the JSON text of each category is written as it was received
+    assets_list = "{%s}" % ", ".join(f"{json.dumps(category)}: {v}" for category, v in data["assets"].items())
     qs = AssetsResults.objects.filter(simulation=simulation)
     if qs.exists():
         asset_results = qs.first()
-        asset_results.asset_list = json.dumps(data_subdict)
+        asset_results.assets_list = assets_list
         asset_results.save()
     else:
-        AssetsResults.objects.create(assets_list=json.dumps(data_subdict), simulation=simulation)
+        AssetsResults.objects.create(assets_list=assets_list, simulation=simulation)
 
     qs = FancyResults.objects.filter(simulation=simulation)
     if qs.exists():
@@ -172,9 +307,8 @@ def parse_mvs_results(simulation, response_results):
         # TODO add safety here with json schema
         # Raw results is a panda dataframe which was saved to json using "split"
         if "raw_results" in data:
-            results = data["raw_results"]
-            js = json.loads(results)
-            js_data = np.array(js["data"])
+            columns, index, js_data = data["raw_results"]
+            bus_balance = BusBalance.from_split(columns, index, js_data)
 
             hdrs = [
                 "bus",
@@ -188,17 +322,50 @@ def parse_mvs_results(simulation, response_results):
             ]
 
             # each columns already contains the values of the hdrs except for flow_data and optimized_capacity
-            # we append those values here
-            for i, col in enumerate(js["columns"]):
-                col.append(js_data[:-1, i].tolist())
-                col.append(js_data[-1, i])
-
-                kwargs = {hdr: item for hdr, item in zip(hdrs, col)}
+            # we append those values here, the missing values being None as in the received results
+            for i, col in enumerate(columns):
+                flow = js_data[:-1, i]
+                flow_data = flow.tolist()
+                if np.isnan(flow).any():
+                    flow_data = [None if np.isnan(value) else value for value in flow_data]
+                optimized_capacity = None if np.isnan(js_data[-1, i]) else float(js_data[-1, i])
+
+                kwargs = {hdr: item for hdr, item in zip(hdrs, list(col) + [flow_data, optimized_capacity])}
                 kwargs["simulation"] = simulation
                 fr = FancyResults(**kwargs)
                 fr.save()
 
-    return response_results
+            # the energy balance of the busses is materialized once for the results views
+            FlowResults.objects.update_or_create(
+                simulation=simulation, defaults=dict(flow_data="", bus_balance=bus_balance.to_bytes())
+            )
+
+
+def clone_mvs_results(simulation, source):
+    """Copy the results of a finished simulation to another simulation without contacting the MVS server
+
+    :param simulation: Simulation instance receiving the results, its previous results are deleted
+    :param source: Simulation instance with status DONE, typically with the same payload_hash as simulation
+    """
+    simulation.status = source.status
+    simulation.results = source.results
+    simulation.errors = source.errors
+    simulation.mvs_token = source.mvs_token
+    simulation.mvs_version = source.mvs_version
+    simulation.end_date = datetime.now()
+    simulation.save()
+
+    for model in (KPIScalarResults, KPICostsMatrixResults, AssetsResults, FlowResults, FancyResults):
+        model.objects.filter(simulation=simulation).delete()
+        clones = []
+        for result in model.objects.filter(simulation=source).order_by("id"):
+            result.pk = None
+            result.simulation = simulation
+            clones.append(result)
+        # bulk_create does not call FancyResults.save(), the total_flow is copied from the source results
+        model.objects.bulk_create(clones)
+
+    return simulation
 
 
 def mvs_sensitivity_analysis_request(data: dict):
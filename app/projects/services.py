@@ -39,7 +39,7 @@ from plotly.graph_objs import Scatter
 
 from projects.constants import PENDING
 from projects.models import Simulation
-from projects.requests import fetch_mvs_simulation_results
+from projects.simulation_status import poll_simulation_status
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +52,8 @@ EXCHANGE_SERVER = os.getenv("EXCHANGE_SERVER", "dummy.com")
 # email addresses to which the feedback emails will be sent
 RECIPIENTS = os.getenv("RECIPIENTS", "dummy@dummy.com,dummy2@dummy.com").split(",")
 
+SIMULATION_CHECK_TASK = "projects.services.check_simulation_objects"
+
 r"""Functions meant to be powered by Django-Q.
 
 Those functions require Django-Q cluster to run along with Django Server.
@@ -64,12 +66,12 @@ def check_simulation_objects(**kwargs):
     pending_simulations = Simulation.objects.filter(status=PENDING)
     if pending_simulations.count() == 0:
         logger.debug(f"No pending simulation found. Deleting Scheduler.")
-        Schedule.objects.all().delete()
-    # fetch_mvs_simulation_results mostly waits for MVS API to respond, so no ProcessPool is required.
+        # the other schedules (e.g. the exchange rates refresh) are kept
+        Schedule.objects.filter(func=SIMULATION_CHECK_TASK).delete()
+    # poll_simulation_status mostly waits for MVS API to respond, so no ProcessPool is required.
+    # The simulations whose status is being checked by a web request are skipped
     with ThreadPoolExecutor() as pool:
-        pool.map(fetch_mvs_simulation_results, pending_simulations)
-    logger.debug(f"Finished round for checking Simulation objects status.")
-
+        pool.map(poll_simulation_status, pending_simulations)
     logger.debug(f"Finished round for checking Simulation objects status.")
 
 
@@ -93,13 +95,13 @@ def create_or_delete_simulation_scheduler(**kwargs):
     """
     mvs_token = kwargs.get("mvs_token", "")
 
-    if Schedule.objects.count() == 0:
+    if Schedule.objects.filter(func=SIMULATION_CHECK_TASK).count() == 0:
         logger.info(
             f"No Scheduler found. Creating a new Scheduler to check Simulation {mvs_token}."
         )
         schedule = Schedule.objects.create(
             name=f"djangoQ_Scheduler-{mvs_token}",
-            func="projects.services.check_simulation_objects",
+            func=SIMULATION_CHECK_TASK,
             # args='5',
             schedule_type=Schedule.MINUTES,
             minutes=1
@@ -255,6 +257,18 @@ class RenewableNinjas:
         self.s.headers = {"Authorization": "Token " + self.token}
         self.data = []
 
+    # parameters of the PV system and weather data of the PV output profiles
+    pv_parameters = {
+        "date_from": "2019-01-01",
+        "date_to": "2019-12-31",
+        "dataset": "merra2",
+        "capacity": 1.0,
+        "system_loss": 0.1,
+        "tracking": 0,
+        "tilt": 35,
+        "azim": 180,
+    }
+
     def get_pv_output(self, coordinates):
         ##
         # Get PV data
@@ -262,37 +276,29 @@ class RenewableNinjas:
 
         url = self.api_base + "data/pv"
 
-        args = {
-            "lat": coordinates["lat"],
-            "lon": coordinates["lon"],
-            "date_from": "2019-01-01",
-            "date_to": "2019-12-31",
-            "dataset": "merra2",
-            "capacity": 1.0,
-            "system_loss": 0.1,
-            "tracking": 0,
-            "tilt": 35,
-            "azim": 180,
-            "format": "json",
-        }
+        args = {"lat": coordinates["lat"], "lon": coordinates["lon"], **self.pv_parameters, "format": "json"}
 
         r = self.s.get(url, params=args)
 
         # Parse JSON to get a pandas.DataFrame of data and dict of metadata
-        parsed_response = json.loads(r.text)
-
-        pv_data = pd.read_json(json.dumps(parsed_response["data"]), orient="index")
-        metadata = parsed_response["metadata"]
-
-        self.data = pv_data
+        parsed_response = r.json()
+        self.data = self.parse_pv_data(parsed_response["data"])
         return
 
-    def create_pv_graph(self):
-        date_range = pd.Series(pd.date_range("2019-01-01", "2019-12-31"))
-        daily_avg = [
-            np.mean(self.data.loc[day.strftime("%Y-%m-%d")]) for day in date_range
-        ]
-        plot_div = plot(
-            [Scatter(x=date_range, y=daily_avg, mode="lines")], output_type="div"
-        )
+    @staticmethod
+    def parse_pv_data(data):
+        """Return the DataFrame of the data of a renewables.ninja answer, indexed by the timestamps of its keys"""
+        timestamps = pd.Index(list(data.keys()), dtype=str)
+        if timestamps.str.isdigit().all():
+            # timestamps in ms
+            index = pd.to_datetime(timestamps.astype(np.int64), unit="ms")
+        else:
+            index = pd.to_datetime(timestamps)
+        return pd.DataFrame.from_records(list(data.values()), index=index)
+
+    def create_pv_graph(self, freq="D"):
+        """Return the plot of the mean PV output per day (freq="D") or per month (freq="MS")"""
+        date_range = pd.date_range(self.pv_parameters["date_from"], self.pv_parameters["date_to"], freq=freq)
+        averages = self.data.iloc[:, 0].resample(freq).mean().reindex(date_range)
+        plot_div = plot([Scatter(x=date_range, y=averages.values, mode="lines")], output_type="div")
         return plot_div
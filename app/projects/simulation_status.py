@@ -0,0 +1,113 @@
+"""Coordination of the status checks of the pending simulations with MVS
+
+The status of a pending simulation is polled by the browser of each user watching it, by the review step of the CPN
+wizard and by the Django-Q job check_simulation_objects. Instead of asking MVS each time, the Simulation row acts as a
+short-lived status cache: MVS is only asked again once SIMULATION_STATUS_TTL seconds have passed since the last check,
+the other polls are answered with the status stored in the database.
+
+A check is claimed with a conditional UPDATE of the Simulation row, which is atomic across the gunicorn workers and the
+Django-Q cluster, so that only one check per simulation is in flight at a time. The claim is released once the check is
+over and expires after SIMULATION_STATUS_LOCK_TIMEOUT seconds in case the process running it died.
+"""
+
+import json
+import logging
+import time
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import Q
+
+from projects.constants import PENDING
+from projects.models import Simulation
+from projects.requests import fetch_mvs_simulation_results
+
+logger = logging.getLogger(__name__)
+
+
+def claim_status_check(simulation, now=None):
+    """Try to claim the right to check the status of the simulation with MVS
+
+    :return: True if the claim succeeded, False if the status was checked less than SIMULATION_STATUS_TTL seconds ago
+        or if another check is in flight
+    """
+    if now is None:
+        now = datetime.now()
+    lock_until = now + timedelta(seconds=settings.SIMULATION_STATUS_LOCK_TIMEOUT)
+    claimed = (
+        Simulation.objects.filter(id=simulation.id, status=PENDING)
+        .filter(Q(status_check_lock__isnull=True) | Q(status_check_lock__lt=now))
+        .filter(
+            Q(status_checked_at__isnull=True)
+            | Q(status_checked_at__lte=now - timedelta(seconds=settings.SIMULATION_STATUS_TTL))
+        )
+        .update(status_checked_at=now, status_check_lock=lock_until)
+    )
+    if claimed == 1:
+        # keep the instance in line with the row, it is saved at the end of the check
+        simulation.status_checked_at = now
+        simulation.status_check_lock = lock_until
+    return claimed == 1
+
+
+def release_status_check(simulation):
+    simulation.status_check_lock = None
+    Simulation.objects.filter(id=simulation.id).update(status_check_lock=None)
+
+
+def poll_simulation_status(simulation):
+    """Update the status of a simulation, asking MVS only if no other check is running or was run recently
+
+    :param simulation: Simulation instance, refreshed with the cached status if MVS is not asked
+    :return: True if the simulation is finished (done or error)
+    """
+    if simulation.status != PENDING:
+        return True
+    if claim_status_check(simulation) is True:
+        try:
+            fetch_mvs_simulation_results(simulation)
+        finally:
+            release_status_check(simulation)
+    else:
+        logger.debug(f"The status of the simulation {simulation.id} is read from the database")
+        try:
+            simulation.refresh_from_db(fields=["status", "results", "errors", "end_date", "elapsed_seconds"])
+        except Simulation.DoesNotExist:
+            # the simulation was canceled in the meantime
+            return False
+    return simulation.status != PENDING
+
+
+def format_event(event, data):
+    """Format a message of a server-sent events stream"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def simulation_status_events(sim_id, interval=None, timeout=None, sleep=time.sleep):
+    """Server-sent events reporting the status of a simulation until it is finished
+
+    The status is polled every interval seconds through poll_simulation_status, so that MVS is not asked more often
+    than with polling requests. A "status" event is sent after each poll while the simulation is pending and a
+    "finished" event once it is done or failed (or deleted). Otherwise the stream ends after timeout seconds and the
+    browser reconnects after the "retry" delay. The stream holds a worker while it is open, hence its short lifetime.
+    """
+    if interval is None:
+        interval = settings.SIMULATION_STATUS_STREAM_INTERVAL
+    if timeout is None:
+        timeout = settings.SIMULATION_STATUS_STREAM_TIMEOUT
+    # the browser reconnects after the stream ends
+    yield f"retry: {int(interval * 1000)}\n\n"
+
+    deadline = time.monotonic() + timeout
+    while True:
+        simulation = Simulation.objects.filter(id=sim_id).first()
+        if simulation is None:
+            yield format_event("finished", {"id": sim_id, "status": None})
+            return
+        if poll_simulation_status(simulation) is True:
+            yield format_event("finished", {"id": sim_id, "status": simulation.status})
+            return
+        yield format_event("status", {"id": sim_id, "status": simulation.status})
+        if time.monotonic() + interval > deadline:
+            return
+        sleep(interval)
@@ -0,0 +1,147 @@
+"""Registry of the static tables (csv files of the static folder) describing parameters, KPIs and business models
+
+The tables used to be parsed when their module was imported, so every process (server, management command, django-q
+worker) paid the parsing of all tables even if it never used them. Each table is now registered with the function
+parsing it and is only parsed on first use, the result is then kept in memory. If the setting
+STATIC_TABLES_CACHE_DIR is provided, the parsed tables are also pickled in this folder and reused by the next processes
+as long as the csv file was not modified.
+
+The modules exposing the tables (e.g. projects.helpers.PARAMETERS) keep a module level name bound to a LazyTable,
+which behaves like a read-only dict and triggers the parsing when it is first accessed.
+"""
+
+import logging
+import os
+import pickle
+import threading
+from collections.abc import Mapping
+
+from django.conf import settings as django_settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+
+logger = logging.getLogger(__name__)
+
+
+class StaticTableRegistry:
+    """Parse the registered static tables on first use and cache the results"""
+
+    def __init__(self):
+        self.parsers = {}
+        self.tables = {}
+        self.lock = threading.RLock()
+
+    def register(self, name, filepath, parser):
+        """Register a static table
+
+        :param name: name under which the table is accessed
+        :param filepath: path of the file relative to the static folder
+        :param parser: function taking the absolute path of the file as single argument and returning the parsed table
+        """
+        self.parsers[name] = (filepath, parser)
+
+    def get(self, name):
+        if name not in self.tables:
+            with self.lock:
+                if name not in self.tables:
+                    self.tables[name] = self.load(name)
+        return self.tables[name]
+
+    def clear(self, name=None):
+        """Drop the parsed tables (or only the named one) from memory, they are parsed again on next access"""
+        with self.lock:
+            if name is None:
+                self.tables.clear()
+            else:
+                self.tables.pop(name, None)
+
+    def load(self, name):
+        filepath, parser = self.parsers[name]
+        path = staticfiles_storage.path(filepath)
+        mtime = os.path.getmtime(path) if os.path.exists(path) else None
+
+        cache_path = self.cache_path(name)
+        if cache_path is not None and mtime is not None and os.path.exists(cache_path):
+            try:
+                with open(cache_path, "rb") as fp:
+                    cached_mtime, table = pickle.load(fp)
+                if cached_mtime == mtime:
+                    return table
+            except Exception as e:
+                logger.warning(f"The cache of the static table '{name}' could not be read: {e}")
+
+        table = parser(path)
+
+        if cache_path is not None and mtime is not None:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                # write to a temporary file first so that concurrent processes never read a partial pickle
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as fp:
+                    pickle.dump((mtime, table), fp, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except Exception as e:
+                logger.warning(f"The static table '{name}' could not be cached: {e}")
+        return table
+
+    @staticmethod
+    def cache_path(name):
+        cache_dir = getattr(django_settings, "STATIC_TABLES_CACHE_DIR", None)
+        if not cache_dir:
+            return None
+        return os.path.join(cache_dir, f"{name}.pickle")
+
+
+static_tables = StaticTableRegistry()
+
+
+class LazyTable(Mapping):
+    """Read-only dict view on a registered static table, the table is parsed on first access
+
+    :param name: name of the table in the registry
+    :param key: if the parser of the table returns a dict of several tables, name of the one to expose
+    """
+
+    def __init__(self, name, key=None, registry=static_tables):
+        self.name = name
+        self.key = key
+        self.registry = registry
+
+    @property
+    def data(self):
+        table = self.registry.get(self.name)
+        if self.key is not None:
+            table = table[self.key]
+        return table
+
+    def __getitem__(self, item):
+        return self.data[item]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, item):
+        return item in self.data
+
+    def __repr__(self):
+        return f"LazyTable({self.name!r}, key={self.key!r})"
+
+    def __deepcopy__(self, memo):
+        # a copy would not save anything, the copies share the cached table
+        return self
+
+
+class StaticTableAttribute:
+    """Class attribute bound to a registered static table, the table is parsed on first access
+
+    As for a plain class attribute, all instances share the same object
+    """
+
+    def __init__(self, name, registry=static_tables):
+        self.name = name
+        self.registry = registry
+
+    def __get__(self, instance, owner=None):
+        return self.registry.get(self.name)
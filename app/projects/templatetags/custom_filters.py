@@ -3,8 +3,7 @@ import pandas as pd
 from django.utils.safestring import mark_safe
 
 from django import template
-from django.db.models import Q
-from projects.models import Project
+from projects.permissions import get_project_permissions, OWNER, READ
 
 register = template.Library()
 
@@ -41,36 +40,12 @@ def get_scenario_list_from_project(project):
 
 @register.filter
 def has_viewer_edit_rights(proj_id, user):
-    try:
-        project = Project.objects.get(pk=proj_id)
-    except Project.DoesNotExist:
-        project = None
-    answer = False
-    if project is not None:
-        if project.user == user:
-            answer = True
-        else:
-            qs = project.viewers.filter(Q(user__email=user.email) & Q(share_rights="edit"))
-            if qs.exists():
-                answer = True
-    return answer
+    return get_project_permissions(user).can_edit(proj_id)
 
 
 @register.filter
 def has_viewer_read_rights(proj_id, user):
-    try:
-        project = Project.objects.get(pk=proj_id)
-    except Project.DoesNotExist:
-        project = None
-    answer = False
-    if project is not None:
-        if project.user == user:
-            answer = True
-        else:
-            qs = project.viewers.filter(Q(user__email=user.email) & Q(share_rights="read"))
-            if qs.exists():
-                answer = True
-    return answer
+    return get_project_permissions(user).get(proj_id) in (OWNER, READ)
 
 
 @register.filter
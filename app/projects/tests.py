@@ -1,17 +1,69 @@
 import pytest
+import io
 import json
-from django.test import TestCase
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest import mock
+import jsonschema
+import numpy as np
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.conf import settings as django_settings
+from django.core.management import call_command
 from django.test.client import RequestFactory
+from django.template import Context, Template
 from projects.models import Project, Scenario, Viewer, Asset
 from users.models import CustomUser
-from django.core.exceptions import ValidationError
+from django.core.exceptions import MiddlewareNotUsed, ValidationError
 
 from projects.scenario_topology_helpers import (
     load_scenario_from_dict,
     load_project_from_dict,
 )
+from projects.models import Simulation
+from projects.constants import DONE, PENDING, ERROR
+from projects.helpers import (
+    format_scenario_for_mvs,
+    mvs_payload_hash,
+    parse_input_timeseries,
+    sensitivity_analysis_payload,
+    SA_RESPONSE_SCHEMA,
+)
+from projects.static_tables import StaticTableRegistry, LazyTable
+from projects.permissions import get_project_permissions, EDIT, OWNER, READ
+from projects.metrics import prometheus_metrics, record_first_render
+from projects.simulation_status import claim_status_check, simulation_status_events
+from projects.exchange_rates import latest_exchange_rate, refresh_exchange_rates, schedule_exchange_rates_refresh
+from projects.services import check_simulation_objects
+from projects.models import ExchangeRate
+from django_q.models import Schedule
+import httpx
+from projects.timeseries_parser import SNIFF_SAMPLE_SIZE, sniff_csv_format
+from projects.time_index import time_index
+from projects.caching import ArrayStore, cached_array, cached_dataframe, cached_json, get_or_set, versioned_key
+from django.core.cache import cache
+import pandas as pd
+from projects.mvs_standin import create_standin_server, synthetic_simulation_results
+from projects.requests import (
+    mvs_simulation_request,
+    mvs_simulation_check_status,
+    mvs_sensitivity_analysis_request,
+    mvs_sa_check_status,
+    parse_mvs_results,
+    fetch_mvs_simulation_results,
+    mvs_simulation_check_status_stream,
+    current_mvs_version,
+    remember_mvs_version,
+)
+from projects.json_stream import JSONStream
+from dashboard.models import AssetsResults, FancyResults, KPIScalarResults
+from epa.profiling import RequestProfilerMiddleware, summarize_queries
+from epa import log_config
+import logging
 
 
 class BasicOperationsTest(TestCase):
@@ -316,3 +368,755 @@ class UploadTimeseriesTest(TestCase):
             }
             response = self.client.post(self.post_url, data, format="multipart")
             self.assertEqual(response.status_code, 422)
+
+
+class TimeseriesParserTest(TestCase):
+    def test_sniff_csv_format(self):
+        self.assertEqual(sniff_csv_format('"2020-01-01 10:00",1\n"2020-01-01 11:00",2'), (",", ".", 2, False))
+        self.assertEqual(sniff_csv_format("1;8,5\n2;3,3"), (";", ",", 2, False))
+        self.assertEqual(sniff_csv_format("1,2\n2\n3,0"), (";", ",", 1, False))
+        self.assertEqual(sniff_csv_format("time\tvalue\n0\t1.5"), ("\t", ".", 2, True))
+
+    def test_csv_with_header(self):
+        timeseries_file = SimpleUploadedFile("ts.csv", b"time,value\n2020,1.5\n2021,2\n")
+        self.assertEqual(parse_input_timeseries(timeseries_file), [1.5, 2])
+
+    def test_single_column_csv_with_decimal_commas(self):
+        timeseries_file = SimpleUploadedFile("ts.csv", b"1,5\n2,25\n3,75\n")
+        self.assertEqual(parse_input_timeseries(timeseries_file), [1.5, 2.25, 3.75])
+
+    def test_large_single_column_csv_with_decimal_commas(self):
+        # the file is larger than the sample its format is guessed from
+        content = "".join(f"{100 + i},125\n" for i in range(8760)).encode("utf-8")
+        self.assertGreater(len(content), SNIFF_SAMPLE_SIZE)
+        values = parse_input_timeseries(SimpleUploadedFile("ts.csv", content))
+        self.assertEqual(len(values), 8760)
+        self.assertEqual(values[:2], [100.125, 101.125])
+
+    def test_npy_file(self):
+        buffer = io.BytesIO()
+        np.save(buffer, np.array([[0, 1.5], [1, 2.5]]))
+        self.assertEqual(parse_input_timeseries(SimpleUploadedFile("ts.npy", buffer.getvalue())), [1.5, 2.5])
+
+    def test_length_is_checked_against_horizon(self):
+        with self.assertRaises(ValidationError):
+            parse_input_timeseries(SimpleUploadedFile("ts.csv", b"1\n2\n3\n"), n_timesteps=4)
+        self.assertEqual(parse_input_timeseries(SimpleUploadedFile("ts.json", b"[1]"), n_timesteps=4), [1])
+
+    def test_unsupported_format_raises_error(self):
+        with self.assertRaises(TypeError):
+            parse_input_timeseries(SimpleUploadedFile("ts.notsupported", b"1\n2"))
+
+
+class JSONStreamTest(TestCase):
+    def setUp(self):
+        inner = {"data": [[1.5, None, 3], [4, 0.005, -6]], "label": 'a "quoted" \\ é 😀'}
+        self.results = {"raw_results": json.dumps(inner), "kpi": {"scalars": {"x]}": [1, {"y": True}]}}, "other": None}
+        self.document = json.dumps({"status": "DONE", "results": json.dumps(self.results)})
+
+    def test_nested_strings_are_read_incrementally(self):
+        for chunk_size in (1, 3, 1024):
+            stream = JSONStream(io.StringIO(self.document), chunk_size=chunk_size)
+            read = {}
+            for key in stream.items():
+                if key != "results":
+                    read[key] = stream.load()
+                    continue
+                results = JSONStream(stream.string_reader(), chunk_size=chunk_size)
+                for section in results.items():
+                    if section == "raw_results":
+                        raw_results = JSONStream(results.string_reader(), chunk_size=chunk_size)
+                        for raw_key in raw_results.items():
+                            if raw_key == "data":
+                                read["rows"] = [raw_results.load() for _ in raw_results.elements()]
+                            else:
+                                read[raw_key] = raw_results.load()
+                    elif section == "kpi":
+                        read["kpi"] = results.read_raw()
+                    else:
+                        results.skip()
+            self.assertEqual(read["status"], DONE)
+            self.assertEqual(read["rows"], [[1.5, None, 3], [4, 0.005, -6]])
+            self.assertEqual(read["label"], 'a "quoted" \\ é 😀')
+            self.assertEqual(json.loads(read["kpi"]), self.results["kpi"])
+
+    def test_string_can_be_read_in_chunks(self):
+        stream = JSONStream(io.StringIO(self.document), chunk_size=2)
+        self.assertEqual(next(stream.items()), "status")
+        stream.skip()
+        stream.expect(",")
+        self.assertEqual(stream.load(), "results")
+        stream.expect(":")
+        reader = stream.string_reader()
+        self.assertEqual("".join(iter(lambda: reader.read(5), "")), json.dumps(self.results))
+
+    def test_truncated_document(self):
+        stream = JSONStream(io.StringIO(self.document[:-10]))
+        with self.assertRaises(ValueError):
+            for key in stream.items():
+                stream.skip()
+
+
+class ScenarioTimestampsTest(TestCase):
+    def setUp(self):
+        self.scenario = Scenario(start_date=datetime(2023, 3, 1), time_step=30, evaluated_period=3)
+
+    def test_timestamps_match_the_scenario_steps(self):
+        expected = [
+            self.scenario.start_date + timedelta(days=i + 1, minutes=30 * (j + 1)) for i in range(3) for j in range(48)
+        ]
+        self.assertEqual(self.scenario.get_timestamps(), expected)
+        self.assertEqual(
+            self.scenario.get_timestamps(json_format=True), [t.isoformat().replace("T", " ") for t in expected]
+        )
+        self.assertEqual(
+            self.scenario.get_timestamps(compact=True), {"start": "2023-03-02 00:30:00", "step": 30, "count": 144}
+        )
+
+    def test_time_index_is_memoized(self):
+        self.assertIs(self.scenario.get_time_index(), time_index(datetime(2023, 3, 2, 0, 30), 30, 144))
+
+
+class MVSStandinTest(TestCase):
+    fixtures = ["fixtures/benchmarks_fixture.json"]
+
+    def setUp(self):
+        self.server = create_standin_server(port=0)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        host = "http://{}:{}".format(*self.server.server_address[:2])
+        self.patches = [
+            mock.patch("projects.requests.PROXY_CONFIG", {}),
+            mock.patch("projects.requests.MVS_POST_URL", f"{host}/sendjson/"),
+            mock.patch("projects.requests.MVS_GET_URL", f"{host}/check/"),
+            mock.patch("projects.requests.MVS_SA_POST_URL", f"{host}/sendjson/openplan/sensitivity-analysis"),
+            mock.patch("projects.requests.MVS_SA_GET_URL", f"{host}/check-sensitivity-analysis/"),
+        ]
+        for patch in self.patches:
+            patch.start()
+        self.scenario = Scenario.objects.get(id=2)
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_standin_results_can_be_parsed(self):
+        answer = mvs_simulation_request(format_scenario_for_mvs(self.scenario))
+        self.assertEqual(answer["status"], DONE)
+        answer = mvs_simulation_check_status(answer["id"])
+        self.assertEqual(answer["status"], DONE)
+
+        simulation = Simulation.objects.get(scenario=self.scenario)
+        FancyResults.objects.filter(simulation=simulation).delete()
+        parse_mvs_results(simulation, answer["results"])
+        qs = FancyResults.objects.filter(simulation=simulation)
+        self.assertEqual(qs.filter(asset="pv_plant_01").count(), 1)
+        self.assertEqual(len(json.loads(qs.first().flow_data)), 7 * 24)
+
+    def test_streamed_answer_is_parsed_like_the_decoded_answer(self):
+        answer = mvs_simulation_request(format_scenario_for_mvs(self.scenario))
+        decoded = mvs_simulation_check_status(answer["id"])
+        streamed = mvs_simulation_check_status_stream(answer["id"])
+        self.assertEqual(streamed["status"], DONE)
+        self.assertEqual(streamed["mvs_version"], decoded["mvs_version"])
+
+        simulation = Simulation.objects.get(scenario=self.scenario)
+        FancyResults.objects.filter(simulation=simulation).delete()
+        with streamed["results"] as results:
+            parse_mvs_results(simulation, results)
+
+        data = json.loads(decoded["results"])
+        raw_results = json.loads(data["raw_results"])
+        self.assertEqual(
+            json.loads(KPIScalarResults.objects.get(simulation=simulation).scalar_values), data["kpi"]["scalars"]
+        )
+        self.assertEqual(
+            json.loads(AssetsResults.objects.get(simulation=simulation).assets_list),
+            {category: data[category] for category in data if category.startswith("energy_")},
+        )
+        qs = FancyResults.objects.filter(simulation=simulation).order_by("id")
+        self.assertEqual(qs.count(), len(raw_results["columns"]))
+        self.assertEqual(json.loads(qs.first().flow_data), [row[0] for row in raw_results["data"][:-1]])
+
+    def test_fetched_results_are_only_saved_in_the_result_tables(self):
+        answer = mvs_simulation_request(format_scenario_for_mvs(self.scenario))
+        simulation = Simulation.objects.get(scenario=self.scenario)
+        FancyResults.objects.filter(simulation=simulation).delete()
+        simulation.status = PENDING
+        simulation.mvs_token = answer["id"]
+        fetch_mvs_simulation_results(simulation)
+
+        simulation = Simulation.objects.get(pk=simulation.pk)
+        self.assertEqual(simulation.status, DONE)
+        self.assertIsNone(simulation.results)
+        self.assertTrue(FancyResults.objects.filter(simulation=simulation, asset="pv_plant_01").exists())
+
+    def test_standin_pending_then_error(self):
+        self.server.store.latency = 60
+        answer = mvs_simulation_request(format_scenario_for_mvs(self.scenario))
+        self.assertEqual(mvs_simulation_check_status(answer["id"])["status"], PENDING)
+
+        self.server.store.latency = 0
+        self.server.store.failure_rate = 1
+        answer = mvs_simulation_request(format_scenario_for_mvs(self.scenario))
+        answer = mvs_simulation_check_status(answer["id"])
+        self.assertEqual(answer["status"], ERROR)
+        self.assertIn(ERROR, answer["results"])
+
+    def test_standin_sensitivity_analysis_answer_is_valid(self):
+        payload = format_scenario_for_mvs(self.scenario)
+        payload.update(
+            sensitivity_analysis_payload(
+                variable_parameter_name="optimized_capacity",
+                variable_parameter_range=[1, 2, 3],
+                variable_parameter_ref_val=2,
+                output_parameter_names=["costs_total"],
+            )
+        )
+        answer = mvs_sensitivity_analysis_request(payload)
+        answer = mvs_sa_check_status(answer["id"])
+        jsonschema.validate(answer, SA_RESPONSE_SCHEMA)
+        self.assertEqual(len(answer["results"]["sensitivity_analysis_steps"]), 3)
+
+
+class SimulationReuseTest(TestCase):
+    fixtures = ["fixtures/benchmarks_fixture.json", "fixtures/test_users.json"]
+
+    def duplicate_scenario(self, scenario):
+        response = self.client.post(reverse("project_duplicate", args=[scenario.project.id]))
+        return Project.objects.get(id=response.url.split("/")[-1]).scenario_set.get()
+
+    def setUp(self):
+        cache.clear()
+        self.client.login(username="testUser", password="ASas12,.")
+        # the duplication fills the parameters missing in the fixture with their default values
+        self.scenario = self.duplicate_scenario(Scenario.objects.get(id=2))
+        payload = format_scenario_for_mvs(self.scenario)
+        self.simulation = Simulation.objects.create(
+            scenario=self.scenario,
+            status=DONE,
+            mvs_token="token",
+            mvs_version="1.0.0",
+            payload_hash=mvs_payload_hash(payload),
+        )
+        parse_mvs_results(self.simulation, synthetic_simulation_results(payload, seed=0))
+
+        self.new_scenario = self.duplicate_scenario(self.scenario)
+
+    def test_payload_hash_ignores_identifiers(self):
+        self.assertEqual(mvs_payload_hash(format_scenario_for_mvs(self.new_scenario)), self.simulation.payload_hash)
+
+        asset = self.new_scenario.asset_set.exclude(capex_var=None).first()
+        asset.capex_var += 1
+        asset.save()
+        self.assertNotEqual(mvs_payload_hash(format_scenario_for_mvs(self.new_scenario)), self.simulation.payload_hash)
+
+    def test_identical_scenario_results_are_cloned(self):
+        with mock.patch("projects.views.mvs_simulation_request") as mvs_request:
+            self.client.post(reverse("request_mvs_simulation", args=[self.new_scenario.id]))
+        mvs_request.assert_not_called()
+
+        simulation = Simulation.objects.get(scenario=self.new_scenario)
+        self.assertEqual(simulation.status, DONE)
+        self.assertEqual(simulation.payload_hash, self.simulation.payload_hash)
+        source_results = FancyResults.objects.filter(simulation=self.simulation).order_by("id")
+        results = FancyResults.objects.filter(simulation=simulation).order_by("id")
+        self.assertEqual(results.count(), source_results.count())
+        self.assertEqual(
+            list(results.values_list("asset", "flow_data", "total_flow")),
+            list(source_results.values_list("asset", "flow_data", "total_flow")),
+        )
+        self.assertEqual(
+            simulation.kpiscalarresults_set.get().scalar_values,
+            self.simulation.kpiscalarresults_set.get().scalar_values,
+        )
+        self.assertEqual(simulation.assetsresults_set.count(), 1)
+
+    def test_force_rerun_dispatches_a_simulation(self):
+        answer = dict(id="token", status=PENDING, results=None)
+        with mock.patch("projects.views.mvs_simulation_request", return_value=answer) as mvs_request, mock.patch(
+            "projects.views.create_or_delete_simulation_scheduler"
+        ):
+            self.client.post(reverse("request_mvs_simulation", args=[self.new_scenario.id]), {"force_rerun": "on"})
+        mvs_request.assert_called_once()
+
+        simulation = Simulation.objects.get(scenario=self.new_scenario)
+        self.assertEqual(simulation.status, PENDING)
+        self.assertEqual(simulation.payload_hash, self.simulation.payload_hash)
+        self.assertFalse(FancyResults.objects.filter(simulation=simulation).exists())
+
+    def test_results_of_another_mvs_version_are_not_reused(self):
+        remember_mvs_version("1.1.0")
+        answer = dict(id="token", mvs_version="1.1.0", status=PENDING, results=None)
+        with mock.patch("projects.views.mvs_simulation_request", return_value=answer) as mvs_request, mock.patch(
+            "projects.views.create_or_delete_simulation_scheduler"
+        ):
+            self.client.post(reverse("request_mvs_simulation", args=[self.new_scenario.id]))
+        mvs_request.assert_called_once()
+
+        simulation = Simulation.objects.get(scenario=self.new_scenario)
+        self.assertEqual(simulation.status, PENDING)
+        self.assertEqual(simulation.mvs_version, "1.1.0")
+        self.assertEqual(current_mvs_version(), "1.1.0")
+
+
+class SimulationMetricsTest(TestCase):
+    fixtures = ["fixtures/benchmarks_fixture.json"]
+
+    def setUp(self):
+        self.server = create_standin_server(port=0, latency=0.3)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        host = "http://{}:{}".format(*self.server.server_address[:2])
+        self.patches = [
+            mock.patch("projects.requests.PROXY_CONFIG", {}),
+            mock.patch("projects.requests.MVS_POST_URL", f"{host}/sendjson/"),
+            mock.patch("projects.requests.MVS_GET_URL", f"{host}/check/"),
+            mock.patch("projects.views.create_or_delete_simulation_scheduler"),
+        ]
+        for patch in self.patches:
+            patch.start()
+        self.client.login(username="testUser", password="ASas12,.")
+        self.scenario = Scenario.objects.get(id=2)
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def run_simulation(self):
+        self.client.post(reverse("request_mvs_simulation", args=[self.scenario.id]), {"force_rerun": "on"})
+        simulation = Simulation.objects.get(scenario=self.scenario)
+        self.assertEqual(simulation.status, PENDING)
+        fetch_mvs_simulation_results(simulation)
+        time.sleep(0.4)
+        fetch_mvs_simulation_results(simulation)
+        self.assertEqual(simulation.status, DONE)
+        return Simulation.objects.get(scenario=self.scenario)
+
+    def test_stages_are_recorded(self):
+        simulation = self.run_simulation()
+        stages = simulation.timings["stages"]
+        for stage in ("serialization", "mvs_post", "queue_wait", "poll_latency", "status_check", "ingestion"):
+            self.assertIn(stage, stages)
+        self.assertEqual(simulation.timings["polls"], 2)
+        self.assertEqual(simulation.timings["poll_hits"], 1)
+        self.assertGreater(stages["poll_latency"], 0.3)
+
+    def test_first_render_is_recorded_once(self):
+        simulation = self.run_simulation()
+        record_first_render(simulation, time.perf_counter() - 2)
+        record_first_render(simulation, time.perf_counter())
+        self.assertGreaterEqual(Simulation.objects.get(id=simulation.id).timings["stages"]["first_render"], 2)
+
+    def test_prometheus_metrics(self):
+        timings_list = [
+            {"stages": {"ingestion": 0.2}, "polls": 3, "poll_hits": 1},
+            {"stages": {"ingestion": 4}, "polls": 1, "poll_hits": 1},
+            {},
+        ]
+        metrics = prometheus_metrics(timings_list, pending=2).splitlines()
+        self.assertIn('epa_simulation_stage_duration_seconds_bucket{stage="ingestion",le="0.25"} 1', metrics)
+        self.assertIn('epa_simulation_stage_duration_seconds_bucket{stage="ingestion",le="5"} 2', metrics)
+        self.assertIn('epa_simulation_stage_duration_seconds_count{stage="ingestion"} 2', metrics)
+        self.assertIn('epa_simulation_stage_duration_seconds_count{stage="mvs_post"} 0', metrics)
+        self.assertIn("epa_simulation_pending 2", metrics)
+        self.assertIn("epa_simulation_poll_hit_ratio 0.5", metrics)
+
+    def test_metrics_endpoint_is_local(self):
+        self.run_simulation()
+        response = self.client.get(reverse("simulation_metrics"))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('epa_simulation_stage_duration_seconds_count{stage="ingestion"} 1', response.content.decode())
+
+        response = self.client.get(reverse("simulation_metrics"), REMOTE_ADDR="10.0.0.1")
+        self.assertEqual(response.status_code, 403)
+
+    def test_simulation_timings_command(self):
+        self.run_simulation()
+        out = io.StringIO()
+        call_command("simulation_timings", stdout=out)
+        self.assertIn("Status checks: 2, hit rate 50.0%", out.getvalue())
+
+
+class SimulationStatusTest(TestCase):
+    fixtures = ["fixtures/benchmarks_fixture.json"]
+
+    def setUp(self):
+        self.server = create_standin_server(port=0, latency=0.3)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        host = "http://{}:{}".format(*self.server.server_address[:2])
+        self.patches = [
+            mock.patch("projects.requests.PROXY_CONFIG", {}),
+            mock.patch("projects.requests.MVS_POST_URL", f"{host}/sendjson/"),
+            mock.patch("projects.requests.MVS_GET_URL", f"{host}/check/"),
+            mock.patch("projects.views.create_or_delete_simulation_scheduler"),
+        ]
+        for patch in self.patches:
+            patch.start()
+        self.client.login(username="testUser", password="ASas12,.")
+        scenario = Scenario.objects.get(id=2)
+        self.client.post(reverse("request_mvs_simulation", args=[scenario.id]), {"force_rerun": "on"})
+        self.simulation = Simulation.objects.get(scenario=scenario)
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def poll(self):
+        response = self.client.get(reverse("fetch_simulation_results", args=[self.simulation.id]))
+        return response.json()["areResultReady"]
+
+    def test_polls_within_ttl_are_served_from_the_database(self):
+        with override_settings(SIMULATION_STATUS_TTL=60):
+            self.assertFalse(self.poll())
+            time.sleep(0.4)
+            self.assertFalse(self.poll())
+        self.simulation.refresh_from_db()
+        self.assertEqual(self.simulation.timings["polls"], 1)
+        self.assertIsNone(self.simulation.status_check_lock)
+
+        with override_settings(SIMULATION_STATUS_TTL=0):
+            self.assertTrue(self.poll())
+        self.simulation.refresh_from_db()
+        self.assertEqual(self.simulation.status, DONE)
+
+    def test_running_check_is_not_duplicated(self):
+        self.assertTrue(claim_status_check(self.simulation))
+        with override_settings(SIMULATION_STATUS_TTL=0):
+            self.assertFalse(claim_status_check(self.simulation))
+            # the lock of a check whose process died expires
+            self.assertTrue(claim_status_check(self.simulation, now=datetime.now() + timedelta(hours=1)))
+
+    def test_status_stream_pushes_the_end_of_the_simulation(self):
+        with override_settings(SIMULATION_STATUS_TTL=0):
+            events = list(simulation_status_events(self.simulation.id, interval=0.2, timeout=5))
+        self.assertTrue(events[0].startswith("retry: 200"))
+        self.assertTrue(events[1].startswith("event: status"))
+        self.assertEqual(events[-1], f'event: finished\ndata: {{"id": {self.simulation.id}, "status": "{DONE}"}}\n\n')
+
+        response = self.client.get(reverse("simulation_status_stream", args=[self.simulation.id]))
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertIn("event: finished", b"".join(response.streaming_content).decode())
+
+
+class ExchangeRateTest(TestCase):
+    def setUp(self):
+        self.response = mock.Mock(status_code=200)
+        self.response.json.return_value = {"result": "success", "conversion_rates": {"USD": 1, "NGN": 774.123}}
+        self.get = mock.patch("projects.exchange_rates.requests.get", return_value=self.response)
+        self.api = self.get.start()
+
+    def tearDown(self):
+        self.get.stop()
+
+    def test_rates_are_served_from_the_database(self):
+        self.assertEqual(latest_exchange_rate("NGN"), 774.12)
+        self.assertEqual(latest_exchange_rate("NGN"), 774.12)
+        self.assertEqual(latest_exchange_rate("XXX", default=1), 1)
+        self.assertEqual(self.api.call_count, 1)
+        self.assertEqual(refresh_exchange_rates(), 0)
+        self.assertEqual(self.api.call_count, 1)
+
+    def test_last_known_rate_is_used_offline(self):
+        refresh_exchange_rates()
+        ExchangeRate.objects.update(updated_at=datetime.now() - timedelta(days=2))
+        self.api.side_effect = httpx.ConnectError("offline")
+        self.assertEqual(refresh_exchange_rates(), 0)
+        self.assertEqual(latest_exchange_rate("NGN"), 774.12)
+        # the stale rates are refreshed in the background
+        self.assertTrue(Schedule.objects.filter(func="projects.exchange_rates.refresh_exchange_rates").exists())
+
+    def test_simulation_scheduler_keeps_other_schedules(self):
+        schedule_exchange_rates_refresh()
+        check_simulation_objects()
+        self.assertEqual(Schedule.objects.count(), 1)
+
+
+class RequestProfilerTest(TestCase):
+    fixtures = ["fixtures/benchmarks_fixture.json"]
+
+    def setUp(self):
+        self.client.login(username="testUser", password="ASas12,.")
+
+    def test_summarize_queries(self):
+        queries = [("SELECT a WHERE id = %s", (i % 2,), 0.001 * i) for i in range(4)] + [("SELECT b", (), 0.01)]
+        summary = summarize_queries(queries, top_n=2)
+        self.assertEqual(summary["queries"], 5)
+        self.assertEqual(summary["duplicates"], 2)
+        self.assertEqual(summary["repeated"], [{"sql": "SELECT a WHERE id = %s", "count": 4}])
+        self.assertEqual([query["duration_ms"] for query in summary["slowest"]], [10, 3])
+
+    @override_settings(PROFILING_SAMPLE_RATE=1)
+    def test_cpn_views_are_profiled(self):
+        with self.assertLogs("epa.profiling", "INFO") as logs:
+            self.client.get(reverse("projects_list_cpn"))
+        report = json.loads(logs.records[0].getMessage())
+        self.assertEqual(report["view"], "cp_nigeria.views.projects_list_cpn")
+        self.assertEqual(report["status"], 200)
+        self.assertGreater(report["queries"], 0)
+        self.assertEqual(len(report["slowest"]), min(5, report["queries"]))
+
+    @override_settings(PROFILING_SAMPLE_RATE=1)
+    def test_other_views_are_not_profiled(self):
+        with mock.patch("epa.profiling.logger") as profiling_logger:
+            self.client.get(reverse("project_search"))
+        profiling_logger.info.assert_not_called()
+
+    @override_settings(PROFILING_SAMPLE_RATE=0)
+    def test_profiler_is_disabled_by_default(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            RequestProfilerMiddleware(lambda request: None)
+
+
+class LoggingTest(TestCase):
+    def setUp(self):
+        self.records = []
+        self.handler = logging.Handler()
+        self.handler.emit = self.records.append
+        self.logger = logging.getLogger("epa.tests.logging")
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        listener, _ = log_config._listeners.pop(self.logger.name, (None, None))
+        if listener is not None and listener._thread is not None:
+            listener.stop()
+
+    def test_records_are_handled_by_the_listener_thread(self):
+        threads = []
+
+        def handle(record):
+            threads.append(threading.current_thread())
+            self.records.append(record)
+
+        self.handler.handle = handle
+        listener = log_config.queue_handlers(self.logger)
+        self.assertEqual(self.logger.handlers[0].__class__, log_config.QueueingHandler)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            self.logger.exception("Simulation %s failed", 3)
+        listener.stop()
+        record = self.records[0]
+        self.assertEqual(record.getMessage(), "Simulation 3 failed")
+        self.assertIn("ValueError: boom", record.exc_text)
+        self.assertEqual(record.threadName, threading.current_thread().name)
+        self.assertNotEqual(threads, [threading.current_thread()])
+
+    def test_repeated_messages_are_rate_limited(self):
+        self.handler.addFilter(log_config.RateLimitFilter(period=60, burst=2))
+        with mock.patch("epa.log_config.time.monotonic", return_value=0):
+            for i in range(5):
+                self.logger.warning("Simulation %s is pending", i)
+            self.logger.warning("Another message")
+        self.assertEqual(len(self.records), 3)
+        with mock.patch("epa.log_config.time.monotonic", return_value=61):
+            self.logger.warning("Simulation %s is pending", 5)
+        self.assertEqual(self.records[-1].getMessage(), "Simulation 5 is pending (3 similar messages were dropped)")
+
+    def test_json_formatter(self):
+        self.handler.setFormatter(log_config.JSONFormatter())
+        self.logger.info("Request profiled", extra={"view": "cpn_scenario", "queries": 12})
+        data = json.loads(self.handler.format(self.records[0]))
+        self.assertEqual(data["message"], "Request profiled")
+        self.assertEqual(data["level"], "INFO")
+        self.assertEqual(data["logger"], "epa.tests.logging")
+        self.assertEqual(data["queries"], 12)
+        self.assertEqual(data["view"], "cpn_scenario")
+
+    def test_log_levels_setting(self):
+        self.assertEqual(
+            log_config.parse_log_levels("projects.requests=warning, django=INFO,"),
+            {"projects.requests": {"level": "WARNING"}, "django": {"level": "INFO"}},
+        )
+
+
+class StaticTablesTest(TestCase):
+    def setUp(self):
+        self.registry = StaticTableRegistry()
+        self.calls = []
+
+        def parser(path):
+            self.calls.append(path)
+            return {"path": path}
+
+        self.registry.register("kpis", "MVS_kpis_list.csv", parser)
+
+    def test_table_is_parsed_once_on_first_access(self):
+        table = LazyTable("kpis", registry=self.registry)
+        self.assertEqual(self.calls, [])
+        self.assertIn("path", table)
+        self.assertEqual(dict(table), {"path": self.calls[0]})
+        self.assertEqual(len(self.calls), 1)
+
+    def test_parsed_table_is_pickled_until_the_file_changes(self):
+        with tempfile.TemporaryDirectory() as cache_dir, self.settings(STATIC_TABLES_CACHE_DIR=cache_dir):
+            self.registry.get("kpis")
+            self.assertTrue(os.path.exists(os.path.join(cache_dir, "kpis.pickle")))
+
+            # a new process reads the pickled table
+            self.registry.clear()
+            self.registry.get("kpis")
+            self.assertEqual(len(self.calls), 1)
+
+            path = self.calls[0]
+            with mock.patch("projects.static_tables.os.path.getmtime", return_value=os.path.getmtime(path) + 1):
+                self.registry.clear()
+                self.registry.get("kpis")
+            self.assertEqual(len(self.calls), 2)
+
+    def test_registered_tables_are_parsed(self):
+        from projects.helpers import PARAMETERS
+        from dashboard.helpers import KPI_PARAMETERS, TABLES
+        from cp_nigeria.helpers import FinancialTool, OUTPUT_PARAMS
+
+        self.assertIs(PARAMETERS["age_installed"]["sensitivity_analysis"], True)
+        self.assertIn("renewable_factor", KPI_PARAMETERS)
+        self.assertEqual(len(TABLES["management"]["General"]), 5)
+        self.assertGreater(len(OUTPUT_PARAMS), 0)
+        self.assertIn("Category", FinancialTool.cost_assumptions.columns)
+
+
+class CachingTest(TestCase):
+    fixtures = ["fixtures/benchmarks_fixture.json"]
+
+    def setUp(self):
+        cache.clear()
+        self.scenario = Scenario.objects.get(id=2)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_keys_are_versioned_by_the_simulation(self):
+        key = versioned_key("flows", self.scenario, "Electricity bus")
+        self.assertEqual(key, versioned_key("flows", self.scenario, "Electricity bus"))
+        self.assertNotEqual(key, versioned_key("flows", self.scenario, "Heat bus"))
+
+        simulation, _ = Simulation.objects.update_or_create(scenario=self.scenario, defaults={"end_date": datetime.now()})
+        sim_key = versioned_key("flows", simulation)
+        self.assertNotEqual(key, versioned_key("flows", self.scenario, "Electricity bus"))
+        simulation.end_date += timedelta(seconds=1)
+        simulation.save()
+        self.assertNotEqual(sim_key, versioned_key("flows", simulation))
+
+    def test_typed_values_are_built_once(self):
+        build = mock.Mock(side_effect=lambda: np.arange(5, dtype=float))
+        for _ in range(2):
+            np.testing.assert_array_equal(cached_array("array", build), np.arange(5, dtype=float))
+        self.assertEqual(build.call_count, 1)
+
+        df = pd.DataFrame({"a": [1, 2]}, index=["x", "y"])
+        self.assertTrue(cached_dataframe("df", lambda: df).equals(df))
+        self.assertTrue(cached_dataframe("df", mock.Mock()).equals(df))
+
+        payload = cached_json("json", lambda: {"values": np.array([1.5, 2.0]), "total": np.float64(3.5)})
+        self.assertEqual(json.loads(payload), {"values": [1.5, 2.0], "total": 3.5})
+        self.assertEqual(cached_json("json", mock.Mock()), payload)
+
+    def test_waiting_process_gets_the_value_of_the_building_one(self):
+        cache.add("value:lock", True)
+
+        def build_elsewhere(seconds):
+            cache.set("value", 42)
+            cache.delete("value:lock")
+
+        build = mock.Mock(return_value=0)
+        with mock.patch("projects.caching.time.sleep", side_effect=build_elsewhere):
+            self.assertEqual(get_or_set("value", build), 42)
+        build.assert_not_called()
+
+    def test_array_store_evicts_the_least_recently_used_arrays(self):
+        array = np.zeros(1000)
+        with tempfile.TemporaryDirectory() as directory:
+            store = ArrayStore(directory, max_size=2.5 * array.nbytes / 1024 / 1024)
+            store.set("a", array)
+            store.set("b", array)
+            # "a" is used after "b"
+            os.utime(store.path("b"), (0, 0))
+            np.testing.assert_array_equal(store.get("a"), array)
+            store.set("c", array)
+            self.assertIsNone(store.get("b"))
+            self.assertIsNotNone(store.get("a"))
+            self.assertLessEqual(store.size(), store.max_bytes)
+
+            build = mock.Mock(return_value=np.ones(3))
+            store.get_or_set("d", build)
+            np.testing.assert_array_equal(store.get_or_set("d", build), np.ones(3))
+            self.assertEqual(build.call_count, 1)
+
+
+class ProjectPermissionsTest(TestCase):
+    fixtures = ["fixtures/benchmarks_fixture.json", "fixtures/test_users.json"]
+
+    def setUp(self):
+        self.owner = CustomUser.objects.get(username="testUser")
+        self.viewer = CustomUser.objects.get(username="testUser2")
+        self.project = Project.objects.get(pk=1)
+        self.projects = [
+            Project.objects.create(
+                name=f"Shared {i}", description="", country="NIGERIA", latitude=9, longitude=8, user=self.owner
+            )
+            for i in range(10)
+        ]
+        for i, project in enumerate(self.projects):
+            project.add_viewer_if_not_exist(email=self.viewer.email, share_rights="edit" if i % 2 else "read")
+
+    def test_rights_loaded_in_one_query(self):
+        permissions = get_project_permissions(CustomUser.objects.get(pk=self.viewer.pk))
+        with self.assertNumQueries(1):
+            rights = permissions.rights
+            self.assertEqual(permissions.get(self.projects[1].id), EDIT)
+            self.assertEqual(permissions.get(self.projects[0].id), READ)
+            self.assertFalse(permissions.can_read(self.project.id))
+            self.assertEqual(len(permissions.editable), 5)
+        self.assertEqual(len(rights), 10)
+        self.assertEqual(get_project_permissions(self.owner).get(self.project.id), OWNER)
+
+    def test_template_filters_share_the_rights(self):
+        template = Template(
+            "{% load custom_filters %}{% for proj_id in ids %}{{ proj_id|has_viewer_edit_rights:user }} {% endfor %}"
+        )
+        user = CustomUser.objects.get(pk=self.viewer.pk)
+        with self.assertNumQueries(1):
+            output = template.render(Context({"ids": [p.id for p in self.projects], "user": user}))
+        self.assertEqual(output.split(), ["False", "True"] * 5)
+
+    def test_read_rights_filter_includes_the_owner(self):
+        template = Template("{% load custom_filters %}{{ proj_id|has_viewer_read_rights:user }}")
+        for user, project, expected in (
+            (self.owner, self.projects[0], "True"),
+            (self.viewer, self.projects[0], "True"),
+            (self.viewer, self.projects[1], "False"),
+            (self.viewer, self.project, "False"),
+        ):
+            output = template.render(Context({"proj_id": project.id, "user": user}))
+            self.assertEqual(output, expected)
+
+    def test_rights_invalidated_when_sharing_changes(self):
+        other = CustomUser.objects.get(username="testUser3")
+        permissions = get_project_permissions(other)
+        self.assertFalse(permissions.can_edit(self.project.id))
+
+        self.project.add_viewer_if_not_exist(email=other.email, share_rights="edit")
+        self.assertTrue(permissions.can_edit(self.project.id))
+
+        self.project.revoke_access(viewers=list(self.project.viewers.values_list("id", flat=True)))
+        self.assertFalse(permissions.can_read(self.project.id))
+
+    def test_decorated_view_checks_edit_rights(self):
+        self.client.force_login(self.viewer)
+        response = self.client.get(reverse("project_update", args=[self.projects[0].id]))
+        self.assertEqual(response.status_code, 403)
+        response = self.client.get(reverse("project_update", args=[self.projects[1].id]))
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(reverse("project_update", args=[9999]))
+        self.assertEqual(response.status_code, 404)
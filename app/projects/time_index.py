@@ -0,0 +1,47 @@
+"""Time index of the scenarios
+
+The timestamps of a scenario only depend on its start date, its time step (in minutes) and its evaluated period (in
+days). They are built at once with numpy datetime64 arithmetic and memoized, so that the graphs of a scenario and the
+validation of its assets do not rebuild thousands of datetime objects.
+
+A time axis with regular steps can also be sent to the browser in the compact form {start, step, count}, which is
+expanded client side (see expandTimeAxis in static/js/report_items.js) instead of one ISO string per timestep.
+"""
+
+from datetime import timedelta
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# format of the timestamps sent to the browser, same as datetime.isoformat().replace("T", " ") without microseconds
+JSON_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@lru_cache(maxsize=64)
+def time_index(start, step, count):
+    """Return a pandas.DatetimeIndex of count timestamps starting at start, spaced by step minutes"""
+    offsets = np.arange(count, dtype="int64") * np.timedelta64(int(step), "m").astype("timedelta64[ns]")
+    return pd.DatetimeIndex(np.datetime64(start, "ns") + offsets)
+
+
+@lru_cache(maxsize=64)
+def time_index_json(start, step, count):
+    """Return the time index as a tuple of strings formatted for the browser"""
+    return tuple(time_index(start, step, count).strftime(JSON_FORMAT))
+
+
+def scenario_time_axis(start_date, time_step, evaluated_period):
+    """Return the (start, step, count) of the timestamps of a scenario
+
+    The first timestamp of a scenario is one day and one time step after its start date, the scenario has one
+    timestamp per time step over its evaluated period.
+    """
+    n_occurence_per_day = int((24 * 60) / time_step)
+    start = start_date + timedelta(days=1, minutes=time_step)
+    return start, time_step, evaluated_period * n_occurence_per_day
+
+
+def compact_time_axis(start, step, count):
+    """Time axis as sent to the browser instead of the list of its timestamps"""
+    return {"start": start.strftime(JSON_FORMAT), "step": step, "count": count}
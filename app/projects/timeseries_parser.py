@@ -0,0 +1,169 @@
+"""Parsing of the timeseries files uploaded by the users into numpy arrays
+
+The supported formats are csv/txt (one or two columns, the values being in the last one), json (a list of values),
+xls/xlsx (first sheet, one or two columns), parquet and npy. The csv files are read by the pandas C parser once their
+delimiter and decimal separator are guessed from the first lines, the xlsx files are streamed in read-only mode, so that
+no Python object is created per value until the caller needs a list.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
+from openpyxl import load_workbook
+
+SUPPORTED_FORMATS = ("json", "csv", "txt", "xls", "xlsx", "parquet", "npy")
+
+# number of bytes read at the beginning of a csv file to guess its format
+SNIFF_SAMPLE_SIZE = 64 * 1024
+
+
+def is_decimal_comma_number(line):
+    """Return True if the line is made of two groups of digits separated by a comma, e.g. "1,5"
+
+    Such a line could also be two integer columns, it is read as a number with a decimal comma (as the former
+    parse_csv_timeseries did)
+    """
+    parts = line.split(",")
+    return len(parts) == 2 and all(part.strip().isdigit() for part in parts)
+
+
+def sniff_csv_format(sample):
+    """Guess the format of a csv file from its first lines
+
+    The delimiter is ";" or a tab if present, otherwise "," if each line contains the same number of commas. When the
+    delimiter is not a comma, a comma is a decimal separator. Lines like "1,5" can be read either way: if all the lines
+    are like this, the file is read as a single column of numbers with a decimal comma. The decision only depends on the
+    structure of the lines, so that it does not change with the length of the sample.
+
+    :param sample: str, first lines of the file
+    :return: tuple (delimiter, decimal separator, number of columns, True if the first line is a header)
+    """
+    lines = [line for line in sample.splitlines() if line.strip() != ""]
+    if not lines:
+        return ",", ".", 1, False
+
+    if any(";" in line for line in lines):
+        delimiter = ";"
+    elif any("\t" in line for line in lines):
+        delimiter = "\t"
+    elif len({line.count(",") for line in lines}) == 1 and "," in lines[0]:
+        delimiter = ";" if all(is_decimal_comma_number(line) for line in lines) else ","
+    else:
+        # single column, the commas are decimal separators
+        delimiter = ";"
+    decimal = "," if delimiter != "," and any("," in line for line in lines) else "."
+
+    first_row = lines[0].split(delimiter)
+    try:
+        float(first_row[-1 if len(first_row) > 1 else 0].strip().strip('"').replace(decimal, "."))
+        header = False
+    except ValueError:
+        header = True
+    return delimiter, decimal, len(first_row), header
+
+
+def read_csv_values(timeseries_file):
+    """Read the values of a csv file, the second column is used if there are several"""
+    sample = timeseries_file.read(SNIFF_SAMPLE_SIZE)
+    timeseries_file.seek(0)
+    if isinstance(sample, bytes):
+        sample = sample.decode("utf-8", errors="ignore")
+    if len(sample) == SNIFF_SAMPLE_SIZE:
+        # drop the last line which may be truncated
+        sample = sample[: sample.rfind("\n")]
+    delimiter, decimal, n_col, header = sniff_csv_format(sample)
+
+    df = pd.read_csv(
+        timeseries_file,
+        sep=delimiter,
+        decimal=decimal,
+        header=None,
+        skiprows=1 if header else 0,
+        usecols=[1 if n_col > 1 else 0],
+        skip_blank_lines=True,
+        encoding="utf-8",
+    )
+    return df.iloc[:, 0].to_numpy(dtype=float)
+
+
+def read_excel_values(timeseries_file):
+    """Read the values of the active sheet of a workbook, the second column is used if there are several
+
+    The cells which are not numbers (e.g. a header) are ignored
+    """
+    wb = load_workbook(filename=timeseries_file, read_only=True, data_only=True)
+    try:
+        worksheet = wb.active
+        col_idx = 2 if (worksheet.max_column or 1) > 1 else 1
+        cells = pd.Series(
+            [row[0] for row in worksheet.iter_rows(min_col=col_idx, max_col=col_idx, values_only=True)], dtype=object
+        )
+    finally:
+        wb.close()
+    return pd.to_numeric(cells, errors="coerce").dropna().to_numpy(dtype=float)
+
+
+def read_table_values(values):
+    """Return the values of a 1D array or of the second column of a 2D array"""
+    values = np.asarray(values)
+    if values.ndim == 2 and values.shape[1] > 1:
+        values = values[:, 1]
+    return values.ravel().astype(float)
+
+
+def read_parquet_values(timeseries_file):
+    try:
+        df = pd.read_parquet(timeseries_file)
+    except ImportError:
+        raise TypeError(_("Parquet files can only be read if the pyarrow or fastparquet package is installed"))
+    return read_table_values(df.to_numpy())
+
+
+def read_timeseries_file(timeseries_file):
+    """Parse an uploaded timeseries file
+
+    :param timeseries_file: uploaded file, its extension decides of the format
+    :return: 1D numpy array of floats
+    """
+    name = timeseries_file.name
+    extension = name.rsplit(".", 1)[-1].lower() if "." in name else ""
+    if extension not in SUPPORTED_FORMATS:
+        raise TypeError(
+            _(
+                f'Input timeseries file type of "{name}" is not supported. The supported formats are '
+                + ", ".join(f'"{ext}"' for ext in SUPPORTED_FORMATS)
+            )
+        )
+    if timeseries_file.size == 0:
+        raise ValidationError(
+            _('Input timeseries file "%(fname)s" is empty'), code="empty_file", params={"fname": name}
+        )
+
+    if extension in ("xls", "xlsx"):
+        return read_excel_values(timeseries_file)
+    if extension == "parquet":
+        return read_parquet_values(timeseries_file)
+    if extension == "npy":
+        return read_table_values(np.load(timeseries_file, allow_pickle=False))
+
+    if extension == "json" or (extension == "txt" and b"\n" not in timeseries_file.read().strip()):
+        timeseries_file.seek(0)
+        return read_table_values(json.load(timeseries_file))
+    timeseries_file.seek(0)
+    return read_csv_values(timeseries_file)
+
+
+def check_timeseries_length(values, n_timesteps, fname=""):
+    """Raise a ValidationError if a timeseries (not a single value) does not match the number of timesteps"""
+    if n_timesteps is not None and values.size > 1 and values.size != n_timesteps:
+        raise ValidationError(
+            _(
+                'The number of values in "%(fname)s" (%(n_values)s) is not equal to the number of simulation timesteps '
+                "(%(n_timesteps)s)"
+            ),
+            code="invalid_length",
+            params={"fname": fname, "n_values": values.size, "n_timesteps": n_timesteps},
+        )
@@ -192,6 +192,11 @@ urlpatterns = [
         fetch_simulation_results,
         name="fetch_simulation_results",
     ),
+    path(
+        "simulation/status-stream/<int:sim_id>",
+        simulation_status_stream,
+        name="simulation_status_stream",
+    ),
     # Sensitivity analysis
     path(
         "scenario/<int:scen_id>/sensitivity-analysis/create",
@@ -3,7 +3,7 @@ from django.contrib.auth.decorators import login_required
 import json
 import logging
 import traceback
-from django.http import HttpResponseForbidden, JsonResponse
+from django.http import HttpResponseForbidden, JsonResponse, StreamingHttpResponse
 from django.http.response import Http404
 from django.utils.translation import gettext_lazy as _
 from django.shortcuts import *
@@ -15,14 +15,16 @@ from jsonview.decorators import json_view
 from datetime import datetime
 from users.models import CustomUser
 from django.db.models import Q
-from epa.settings import MVS_GET_URL, MVS_LP_FILE_URL, MVS_SA_GET_URL
+from epa.settings import MVS_GET_URL, MVS_LP_FILE_URL, MVS_SA_GET_URL, METRICS_ALLOWED_IPS
 from .forms import *
 from .requests import (
     mvs_simulation_request,
-    fetch_mvs_simulation_results,
     mvs_sensitivity_analysis_request,
     fetch_mvs_sa_results,
     parse_mvs_results,
+    clone_mvs_results,
+    current_mvs_version,
+    remember_mvs_version,
 )
 from projects.models import *
 from dashboard.models import FancyResults
@@ -38,7 +40,7 @@ from .scenario_topology_helpers import (
     load_scenario_from_dict,
     load_project_from_dict,
 )
-from projects.helpers import format_scenario_for_mvs, PARAMETERS
+from projects.helpers import format_scenario_for_mvs, mvs_payload_hash, PARAMETERS
 from dashboard.helpers import fetch_user_projects
 from .constants import DONE, PENDING, ERROR, MODIFIED
 from .services import (
@@ -47,6 +49,9 @@ from .services import (
     send_feedback_email,
     get_selected_scenarios_in_cache,
 )
+from .permissions import project_rights_required, get_project_permissions, EDIT
+from .metrics import prometheus_metrics, record_submission, simulation_stages, stage_timer
+from .simulation_status import poll_simulation_status, simulation_status_events
 import traceback
 
 logger = logging.getLogger(__name__)
@@ -274,14 +279,10 @@ def project_create(request):
 
 @login_required
 @require_http_methods(["GET", "POST"])
+@project_rights_required(EDIT)
 def project_update(request, proj_id):
     project = get_object_or_404(Project, id=proj_id)
 
-    if (project.user != request.user) and (
-        project.viewers.filter(user__email=request.user.email, share_rights="edit").exists() is False
-    ):
-        raise PermissionDenied
-
     project_form = ProjectUpdateForm(request.POST or None, instance=project)
     economic_data_form = EconomicDataUpdateForm(request.POST or None, instance=project.economic_data)
 
@@ -499,9 +500,7 @@ def project_duplicate(request, proj_id):
 
     # duplicate the project
     dm = project.export(bind_scenario_data=True)
-    if (project.user == request.user) or (
-        project.viewers.filter(user__email=request.user.email, share_rights="edit").exists() is True
-    ):
+    if get_project_permissions(request.user).can_edit(project.id):
         new_proj_id = load_project_from_dict(dm, user=request.user)
     else:
         messages.error(_("You cannot duplicate a shared project without the owner granting you 'edit' rights"))
@@ -728,9 +727,7 @@ def scenario_create_parameters(request, proj_id, scen_id=None, step_id=1, max_st
 
             # Only allow edition in DB for owner or share with edit rights
             selected_project = form.cleaned_data["project"]
-            if (selected_project.user == request.user) or (
-                selected_project.viewers.filter(user__email=request.user.email, share_rights="edit").exists() is True
-            ):
+            if get_project_permissions(request.user).can_edit(selected_project.id):
                 qs_sim = Simulation.objects.filter(scenario=scenario)
                 # update the parameter values which are different from existing values
                 for name, value in form.cleaned_data.items():
@@ -835,9 +832,7 @@ def scenario_create_topology(request, proj_id, scen_id, step_id=2, max_step=3):
         # called by function save_topology() in templates/scenario/scenario_step2.html
 
         scenario = get_object_or_404(Scenario, pk=scen_id)
-        if (scenario.project.user != request.user) and (
-            scenario.project.viewers.filter(user__email=request.user.email, share_rights="edit").exists() is False
-        ):
+        if not get_project_permissions(request.user).can_edit(scenario.project_id):
             return JsonResponse({"success": True}, status=403)
             # raise PermissionDenied
 
@@ -969,10 +964,7 @@ def scenario_create_constraints(request, proj_id, scen_id, step_id=3, max_step=4
                 if constraint_type == "net_zero_energy":
                     constraint_instance.value = constraint_instance.activated
 
-                if (scenario.project.user == request.user) or (
-                    scenario.project.viewers.filter(user__email=request.user.email, share_rights="edit").exists()
-                    is True
-                ):
+                if get_project_permissions(request.user).can_edit(scenario.project_id):
                     constraint_instance.save()
 
         return HttpResponseRedirect(reverse("scenario_review", args=[proj_id, scen_id]))
@@ -1008,7 +1000,7 @@ def scenario_review(request, proj_id, scen_id, step_id=4, max_step=5):
             simulation = qs.first()
 
             if simulation.status == PENDING:
-                fetch_mvs_simulation_results(simulation)
+                poll_simulation_status(simulation)
 
             context.update(
                 {
@@ -1025,9 +1017,11 @@ def scenario_review(request, proj_id, scen_id, step_id=4, max_step=5):
                 # Look for back compatibility of simulation results with the result view
                 qs = FancyResults.objects.filter(simulation=simulation)
                 if not qs.exists():
-                    # If no updated results exist, try to generate them from simulation results
-                    parse_mvs_results(simulation, simulation.results)
-                    qs = FancyResults.objects.filter(simulation=simulation)
+                    # If no updated results exist, try to generate them from simulation results (the ones fetched
+                    # from MVS are saved in the result tables only)
+                    if simulation.results is not None:
+                        parse_mvs_results(simulation, simulation.results)
+                        qs = FancyResults.objects.filter(simulation=simulation)
                     # inform the user about the problem if the updated results could not be parsed from the existing simulation
                     if not qs.exists():
                         simulation.status = ERROR
@@ -1201,9 +1195,7 @@ def scenario_delete(request, scen_id):
 def reset_scenario_changes(request, scen_id):
     scenario = get_object_or_404(Scenario, id=scen_id)
 
-    if (scenario.project.user != request.user) and (
-        scenario.project.viewers.filter(user__email=request.user.email, share_rights="edit").exists() is False
-    ):
+    if not get_project_permissions(request.user).can_edit(scenario.project_id):
         raise PermissionDenied
 
     if request.POST:
@@ -1570,8 +1562,10 @@ def request_mvs_simulation(request, scen_id=0):
         )
     # Load scenario
     scenario = Scenario.objects.get(pk=scen_id)
+    stages = {}
     # try:
-    data_clean = format_scenario_for_mvs(scenario)
+    with stage_timer(stages, "serialization"):
+        data_clean = format_scenario_for_mvs(scenario)
     # err = 1/0
     # except Exception as e:
     #     error_msg = f"Scenario Serialization ERROR! User: {scenario.project.user.username}. Scenario Id: {scenario.id}. Thrown Exception: {e}."
@@ -1583,13 +1577,40 @@ def request_mvs_simulation(request, scen_id=0):
     #         content_type="application/json",
     #     )
 
+    force_rerun = request.GET.get("force_rerun", None) == "on"
     if request.method == "POST":
         output_lp_file = request.POST.get("output_lp_file", None)
         if output_lp_file == "on":
             data_clean["simulation_settings"]["output_lp_file"] = "true"
+        force_rerun = request.POST.get("force_rerun", None) == "on"
+
+    payload_hash = mvs_payload_hash(data_clean)
+
+    # Reuse the results of a finished simulation with the exact same inputs and the current MVS version instead of
+    # running the MVS again
+    source = None
+    mvs_version = current_mvs_version()
+    if force_rerun is False and mvs_version is not None:
+        source = (
+            Simulation.objects.filter(payload_hash=payload_hash, status=DONE, mvs_version=mvs_version)
+            .order_by("-end_date")
+            .first()
+        )
+    if source is not None:
+        if source.scenario_id != scen_id:
+            Simulation.objects.filter(scenario_id=scen_id).delete()
+            simulation = Simulation(start_date=datetime.now(), scenario_id=scen_id, payload_hash=payload_hash)
+            simulation_stages(simulation).update(stages)
+            clone_mvs_results(simulation, source)
+            simulation.elapsed_seconds = (datetime.now() - simulation.start_date).seconds
+            simulation.save()
+        logger.info(f"The results of simulation {source.id} were reused for scenario {scen_id}")
+        messages.info(request, _("The scenario was already simulated with the same inputs, its results were reused"))
+        return HttpResponseRedirect(reverse("scenario_review", args=[scenario.project.id, scen_id]))
 
     # Make simulation request to MVS
-    results = mvs_simulation_request(data_clean)
+    with stage_timer(stages, "mvs_post"):
+        results = mvs_simulation_request(data_clean)
 
     if results is None:
         error_msg = "Could not communicate with the simulation server."
@@ -1606,9 +1627,12 @@ def request_mvs_simulation(request, scen_id=0):
         Simulation.objects.filter(scenario_id=scen_id).delete()
 
         # Create empty Simulation model object
-        simulation = Simulation(start_date=datetime.now(), scenario_id=scen_id)
+        simulation = Simulation(start_date=datetime.now(), scenario_id=scen_id, payload_hash=payload_hash)
+        record_submission(simulation, stages)
 
         simulation.mvs_token = results["id"] if results["id"] else None
+        simulation.mvs_version = results.get("mvs_version")
+        remember_mvs_version(simulation.mvs_version)
 
         if "status" in results.keys() and (results["status"] == DONE or results["status"] == ERROR):
             simulation.status = results["status"]
@@ -1627,6 +1651,20 @@ def request_mvs_simulation(request, scen_id=0):
     return answer
 
 
+@require_http_methods(["GET"])
+def simulation_metrics(request):
+    """Expose the lifecycle metrics of the simulations in the Prometheus text format (see projects.metrics)
+
+    Only staff users and the clients listed in METRICS_ALLOWED_IPS (local scrapers) can access it
+    """
+    if not request.user.is_staff and request.META.get("REMOTE_ADDR") not in METRICS_ALLOWED_IPS:
+        raise PermissionDenied
+    metrics = prometheus_metrics(
+        Simulation.objects.values_list("timings", flat=True), pending=Simulation.objects.filter(status=PENDING).count()
+    )
+    return HttpResponse(metrics, content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 @json_view
 @login_required
 @require_http_methods(["POST"])
@@ -1649,7 +1687,8 @@ def update_simulation_rating(request):
 @require_http_methods(["GET"])
 def fetch_simulation_results(request, sim_id):
     simulation = get_object_or_404(Simulation, id=sim_id)
-    are_result_ready = fetch_mvs_simulation_results(simulation)
+    # MVS is only asked if the status was not checked recently by another request or process
+    are_result_ready = poll_simulation_status(simulation)
     return JsonResponse(
         dict(areResultReady=are_result_ready),
         status=200,
@@ -1657,6 +1696,18 @@ def fetch_simulation_results(request, sim_id):
     )
 
 
+@login_required
+@require_http_methods(["GET"])
+def simulation_status_stream(request, sim_id):
+    """Server-sent events pushing the end of a pending simulation, see projects.simulation_status"""
+    get_object_or_404(Simulation, id=sim_id)
+    response = StreamingHttpResponse(simulation_status_events(sim_id), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # prevent nginx from buffering the events
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
 @json_view
 @login_required
 @require_http_methods(["GET"])
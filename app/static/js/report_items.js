@@ -155,6 +155,24 @@ var createReportItem = (event) => {
     })
 }
 
+function expandTimeAxis(timeAxis){
+    /* expand a compact time axis {start, step (in minutes), count} into the list of its timestamps, formatted as
+    "YYYY-MM-DD HH:MM:SS" like the timestamps provided by the server (see projects/time_index.py) */
+    const start = Date.parse(timeAxis.start.replace(" ", "T") + "Z");
+    const step = timeAxis.step * 60000;
+    return Array.from({length: timeAxis.count}, (_, i) => new Date(start + i * step).toISOString().slice(0, 19).replace("T", " "));
+}
+
+function scenarioTimestamps(scenario){
+    // the timestamps of a scenario are provided either as a list or as a compact time axis
+    if(scenario.time_axis){
+        if(scenario.timestamps == null || scenario.timestamps.length == 0){
+            scenario.timestamps = expandTimeAxis(scenario.time_axis);
+        }
+    }
+    return scenario.timestamps;
+}
+
 function format_trace_name(scenario_name, label, unit, compare=false){
     title_label = format_as_title(label);
     var trace_name = title_label + ' (' + unit + ')' ;
@@ -183,6 +201,7 @@ function addTimeseriesGraph(graphId, parameters){
     }
 
     parameters.data.forEach(scenario => {
+        scenarioTimestamps(scenario);
         scenario.timeseries.forEach(timeseries => {
             var y_vals = timeseries.value;
             if(typeof y_vals === "string"){
@@ -225,6 +244,7 @@ function addStackedTimeseriesGraph(graphId, parameters){
     axisRange = []
 
     parameters.data.forEach(scenario => {
+        scenarioTimestamps(scenario);
         scenario.timeseries.forEach(timeseries => {
             // todo provide a function to format the name of the timeseries
             var trace = {x: scenario.timestamps,
@@ -265,6 +285,7 @@ function addCPNStackedTimeseriesGraph(graphId, parameters){
     axisRange = []
 
     parameters.data.forEach(scenario => {
+        scenarioTimestamps(scenario);
         axisRange.push(scenario.timestamps[0], scenario.timestamps[168])
         scenario.timeseries.forEach(timeseries => {
             // todo provide a function to format the name of the timeseries
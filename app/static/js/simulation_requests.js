@@ -1,5 +1,23 @@
 
-const myInterval = setInterval(check_if_simulation_is_done, 3000);
+var myInterval = null;
+
+if(typeof checkSimulationStreamUrl !== "undefined" && window.EventSource){
+    // the server pushes the end of the simulation, the browser reconnects each time the stream is closed
+    const simulationStatusSource = new EventSource(checkSimulationStreamUrl);
+    simulationStatusSource.addEventListener("finished", function (event) {
+        simulationStatusSource.close();
+        location.reload();
+    });
+    simulationStatusSource.onerror = function (event) {
+        // the browser gives up reconnecting (e.g. the stream is not served), poll the status instead
+        if(simulationStatusSource.readyState === EventSource.CLOSED && myInterval === null){
+            myInterval = setInterval(check_if_simulation_is_done, 3000);
+        }
+    };
+}
+else{
+    myInterval = setInterval(check_if_simulation_is_done, 3000);
+}
 
 function check_if_simulation_is_done(url=checkSimulationUrl){
 
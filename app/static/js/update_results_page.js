@@ -21,15 +21,9 @@ $(document).ready(function () {
     scenario_visualize_cpn_stacked_timeseries(scen_id);
     scenario_visualize_capacities(scen_id);
 //    scenario_visualize_costs(scen_id);
-    scenario_visualize_cash_flow(scen_id);
-//    scenario_visualize_revenue(scen_id);
-    scenario_visualize_system_costs(scen_id, system_costs);
-    scenario_visualize_capex(scen_id);
-    scenario_visualize_opex(scen_id);
+    request_financial_outputs(scen_id);
     request_project_summary_table(scen_id);
     request_community_summary_table(scen_id);
-    request_system_size_table(scen_id);
-    request_financial_kpi_table(scen_id);
 });
 
 // Define a variable to keep track of ongoing requests
@@ -107,6 +101,7 @@ function scenario_visualize_timeseries(scen_id=""){
  $.ajax({
             url: urlVisualizeTimeseries,
             type: "GET",
+            data: {time_axis: "compact"},
             success: async (parameters) => {
                 await graph_type_mapping[parameters.type](parameters.id, parameters);
             }
@@ -117,6 +112,7 @@ function scenario_visualize_cpn_stacked_timeseries(scen_id){
     $.ajax({
         url: urlVisualizeStackedTimeseries,
         type: "GET",
+        data: {time_axis: "compact"},
         success: async (graphs) => {
             const parentDiv = document.getElementById("cpn_stacked_timeseries");
             await graphs.map(parameters => {
@@ -231,6 +227,32 @@ function scenario_visualize_system_costs(scen_id=""){
 };
 
 
+// the cash flow, costs, system size and financial KPIs are all computed from the same financial tool, they are
+// requested at once instead of with one call per graph/table
+function request_financial_outputs(scen_id=""){
+ $.ajax({
+            url: urlRequestFinancialOutputs,
+            type: "GET",
+            data: {save_to_db: saveToDB},
+            success: async (outputs) => {
+                await addFinancialPlot(outputs.cash_flow, plot_id="cash_flow");
+                await addTable(outputs.system_costs, table_id="container_system_costs");
+                await addCostsChart(outputs.system_costs, plot_id="system_costs");
+                await addTable(outputs.capex, table_id="container_total_capex");
+                await addPieChart(outputs.capex, plot_id="capex");
+                await addTable(outputs.opex, table_id="container_total_opex");
+                await addPieChart(outputs.opex, plot_id="opex");
+                await addTable(outputs.system_size, table_id="container_system_size")
+                await addTable(outputs.financial_kpis.tables.financial_kpi_table, table_id="container_financial_kpis")
+                await addTable(outputs.financial_kpis.tables.financing_structure_table, table_id="container_financial_structure")
+            },
+            error: function(xhr, errmsg, err) {
+                console.log(xhr.status + ": " + xhr.responseText);
+            }
+        });
+    };
+
+
 function request_project_summary_table(scen_id=""){
  $.ajax({
             url: urlRequestProjectSummary,
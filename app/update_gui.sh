@@ -2,5 +2,6 @@
 python manage.py compilemessages
 python manage.py makemigrations users projects dashboard && \
 python manage.py migrate && \
+python manage.py createcachetable && \
 python manage.py collectstatic && \
 echo 'Updated the open-plan GUI app successfully!!'